@@ -16,10 +16,13 @@ from .main_window import MainWindow
 def main() -> None:
     """Create and run the application."""
     config = Config()
+    config.apply_instrumentation()
     qt_app = QApplication(sys.argv)
     window = MainWindow(config)
     window.show()
-    sys.exit(qt_app.exec_())
+    code = qt_app.exec_()
+    config.dump_instrumentation()
+    sys.exit(code)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,122 @@
+"""compute_worker.py – Berekeningen buiten de GUI-thread.
+
+:class:`ComputeWorker` voert rekentaken uit op een ``QThreadPool`` en levert
+het resultaat via signalen af in de GUI-thread.  Taken hebben een *sleutel*
+(bijv. ``"monte_carlo"``); per sleutel telt alleen de nieuwste invoer:
+
+* elke :meth:`~ComputeWorker.submit` verhoogt de generatie van de sleutel;
+  resultaten van een oudere generatie worden weggegooid;
+* per sleutel draait hooguit één taak tegelijk.  Komt er nieuwe invoer
+  terwijl een taak loopt, dan wacht alleen de nieuwste; tussenliggende
+  invoer wordt nooit gerekend.
+
+De GUI-thread doet dus alleen het verzamelen van de invoer en het tonen van
+het resultaat.  Taken krijgen alleen gewone Python-waarden mee (dicts,
+arrays), nooit widgets.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+from PyQt5.QtCore import QCoreApplication, QDeadlineTimer, QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class _Job(QRunnable):
+    def __init__(self, worker: "ComputeWorker", key: str, generation: int,
+                 fn: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        super().__init__()
+        self.worker = worker
+        self.key = key
+        self.generation = generation
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self) -> None:
+        result, ok = None, False
+        if self.worker.is_current(self.key, self.generation):
+            try:
+                result, ok = self.fn(*self.args, **self.kwargs), True
+            except Exception as exc:
+                result = exc
+        # anders inmiddels achterhaald: niet rekenen, alleen afmelden
+        try:
+            self.worker._done.emit(self.key, self.generation, result, ok)
+        except RuntimeError:
+            pass    # worker (met zijn tab) is al opgeruimd
+
+
+class ComputeWorker(QObject):
+    """Rekentaken per sleutel op een threadpool; alleen het nieuwste resultaat telt."""
+
+    # (sleutel, generatie, resultaat) – alleen voor de actuele generatie
+    finished = pyqtSignal(str, int, object)
+    # (sleutel, generatie, exceptie)
+    failed = pyqtSignal(str, int, object)
+
+    # intern: vanuit de pool-thread, via een queued verbinding naar de GUI-thread
+    _done = pyqtSignal(str, int, object, bool)
+
+    def __init__(self, pool: Optional[QThreadPool] = None, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._pool = pool or QThreadPool.globalInstance()
+        self._generation: dict[str, int] = {}
+        # sleutels met een taak in de pool (die is dan eigendom van de pool)
+        self._running: set[str] = set()
+        self._next: dict[str, _Job] = {}
+        self._done.connect(self._deliver)
+
+    def submit(self, key: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> int:
+        """Plan ``fn(*args, **kwargs)`` voor *key*; geeft de nieuwe generatie terug.
+
+        Een lopende taak voor *key* wordt achterhaald (zijn resultaat vervalt);
+        een nog wachtende taak wordt vervangen.
+        """
+        generation = self._generation.get(key, 0) + 1
+        self._generation[key] = generation
+        job = _Job(self, key, generation, fn, args, kwargs)
+        if key in self._running:
+            self._next[key] = job
+        else:
+            self._start(job)
+        return generation
+
+    def cancel(self, key: str) -> None:
+        """Laat de lopende en wachtende taak van *key* vervallen."""
+        self._generation[key] = self._generation.get(key, 0) + 1
+        self._next.pop(key, None)
+
+    def is_current(self, key: str, generation: int) -> bool:
+        return self._generation.get(key) == generation
+
+    def is_busy(self, key: Optional[str] = None) -> bool:
+        if key is None:
+            return bool(self._running)
+        return key in self._running
+
+    def wait(self, msecs: int = 30_000) -> bool:
+        """Wacht (met event-verwerking) tot alle taken klaar en afgeleverd zijn."""
+        deadline = QDeadlineTimer(msecs)
+        while self._running:
+            if deadline.hasExpired():
+                return False
+            self._pool.waitForDone(min(max(deadline.remainingTime(), 0), 50))
+            QCoreApplication.processEvents()
+        return True
+
+    def _start(self, job: _Job) -> None:
+        self._running.add(job.key)
+        self._pool.start(job)
+
+    def _deliver(self, key: str, generation: int, result: Any, ok: bool) -> None:
+        self._running.discard(key)
+        nxt = self._next.pop(key, None)
+        if nxt is not None:
+            self._start(nxt)
+        if not self.is_current(key, generation):
+            return
+        if ok:
+            self.finished.emit(key, generation, result)
+        else:
+            self.failed.emit(key, generation, result)
@@ -29,6 +29,10 @@ _DEFAULTS: dict[str, Any] = {
     "app_scale": "Normaal",
     "window_width": 1100,
     "window_height": 750,
+    # Tijdmeting van de rekenkern (zie instrumentation.py); bij afsluiten
+    # weggeschreven naar instrumentation_file (.prom = Prometheus, anders JSON)
+    "instrumentation": False,
+    "instrumentation_file": "",
 }
 
 # Lettergrootte in pixels per schaaloptie (voor de instellingen)
@@ -99,3 +103,34 @@ class Config:
     @app_scale.setter
     def app_scale(self, value: str) -> None:
         self._data["app_scale"] = value
+
+    @property
+    def instrumentation(self) -> bool:
+        return bool(self._data.get("instrumentation", False))
+
+    @instrumentation.setter
+    def instrumentation(self, value: bool) -> None:
+        self._data["instrumentation"] = bool(value)
+
+    @property
+    def instrumentation_file(self) -> str:
+        return self._data.get("instrumentation_file", "") or ""
+
+    # ── instrumentation ──────────────────────────────────────────────────────
+
+    def apply_instrumentation(self) -> bool:
+        """Switch the timing counters on or off to match the preferences."""
+        import instrumentation
+
+        if self.instrumentation:
+            instrumentation.enable()
+        else:
+            instrumentation.disable()
+        return self.instrumentation
+
+    def dump_instrumentation(self) -> None:
+        """Write the counters to ``instrumentation_file`` (when enabled and set)."""
+        if self.instrumentation and self.instrumentation_file:
+            import instrumentation
+
+            instrumentation.dump(self.instrumentation_file)
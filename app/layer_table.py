@@ -0,0 +1,354 @@
+"""layer_table.py – Tabelweergave van de constructielagen.
+
+Voor constructies met veel lagen is een :class:`LayerRow`-widget per laag te
+zwaar.  :class:`LayerTableModel` bewaart de lagen als ``.uwr``-laagdicts en
+:class:`LayerTableView` toont ze in één ``QTableView``: alleen zichtbare rijen
+worden getekend en :class:`LayerDelegate` maakt een keuzelijst of spinbox
+pas aan voor de cel die bewerkt wordt (met de gedeelde keuzelijstmodellen uit
+``material_models.py``).
+
+:class:`TableLayer` heeft dezelfde interface als ``LayerRow`` (``row_info``,
+``get_r``, ``to_dict``, ``load_from_dict``), zodat de U-waarde tab en de
+diktedialoog beide weergaven gelijk behandelen.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import Any, Mapping, Optional
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+from PyQt5.QtWidgets import (
+    QAbstractItemView,
+    QComboBox,
+    QDoubleSpinBox,
+    QHeaderView,
+    QStyledItemDelegate,
+    QTableView,
+)
+
+_BASE_DIR = getattr(sys, "_MEIPASS", os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _BASE_DIR not in sys.path:
+    sys.path.insert(0, _BASE_DIR)
+
+from heat_calc import (  # noqa: E402
+    R_VALUE_CATS,
+    U_VALUE_CATS,
+    layer_r_bounds,
+    raw_value,
+    scalar,
+    sub_keys,
+    third_keys,
+)
+from material_catalogue import MaterialCatalogue  # noqa: E402
+from r_cache import MODE_MANUAL, MODE_MATERIAL, get_r_cache  # noqa: E402
+
+from .material_models import get_material_models
+
+MODES = (MODE_MATERIAL, MODE_MANUAL)
+
+COLUMNS = ("Invoermodus", "Categorie", "Materiaal", "Subtype", "d [m]", "R [m²·K/W]")
+COL_MODE, COL_CAT, COL_SUB, COL_THIRD, COL_D, COL_R = range(len(COLUMNS))
+
+# Zelfde bereik en standaardwaarden als de spinboxen van LayerRow
+THICKNESS_RANGE = (0.0, 10.0)
+MANUAL_R_RANGE = (0.0, 100.0)
+DEFAULT_THICKNESS = 0.100
+DEFAULT_MANUAL_R = 0.100
+
+
+def layer_dict_r(data: Mapping[str, Any]) -> Optional[float]:
+    """Warmteweerstand [m²·K/W] van een laagdict (``None`` als onbekend)."""
+    if data.get("modus") == MODE_MANUAL:
+        return data.get("handmatige_r")
+    return get_r_cache().material_r(
+        data.get("categorie"), data.get("materiaal"), data.get("subtype"),
+        float(data.get("dikte") or 0.0),
+    )
+
+
+def layer_info(materials: MaterialCatalogue, data: Mapping[str, Any]) -> dict:
+    """Weergave-informatie voor de resultaatrij van een laagdict.
+
+    ``R_bounds`` is ``(R_min, R_max)`` over het volledige λ-bereik van het
+    materiaal, of ``None`` als R niet te bepalen is.
+    """
+    r = layer_dict_r(data)
+    if data.get("modus") == MODE_MANUAL:
+        formula = f"{r:.3f}" if r is not None else "?"
+        return {"naam": "Handmatig", "d": None, "lam": "—", "R": r, "formula": formula,
+                "R_bounds": (r, r)}
+
+    cat = data.get("categorie")
+    sub = data.get("materiaal")
+    third = data.get("subtype")
+    d = float(data.get("dikte") or 0.0)
+    val = raw_value(materials, cat, sub, third)
+    label = f"{cat} / {sub}" + (f" / {third}" if third else "")
+    bounds = layer_r_bounds(cat, val, d)
+
+    if cat in U_VALUE_CATS:
+        u = scalar(val)
+        formula = f"1 / {u:.2f} = {r:.3f}" if (u and r is not None) else "?"
+        return {"naam": label, "d": None, "lam": f"(U={u:.2f})", "R": r, "formula": formula,
+                "R_bounds": bounds}
+    if cat in R_VALUE_CATS:
+        formula = f"{r:.3f}" if r is not None else "?"
+        return {"naam": label, "d": None, "lam": "(R-waarde)", "R": r, "formula": formula,
+                "R_bounds": bounds}
+
+    lam = scalar(val)
+    if lam and lam > 0 and d > 0 and r is not None:
+        formula = f"{d:.3f} / {lam:.4f} = {r:.3f}"
+    else:
+        formula = "?"
+    return {
+        "naam": label,
+        "d": d,
+        "lam": f"{lam:.4f}" if lam else "—",
+        "R": r,
+        "formula": formula,
+        "R_bounds": bounds,
+    }
+
+
+def normalize_layer(materials: MaterialCatalogue, data: Mapping[str, Any]) -> dict:
+    """Maak een volledig laagdict met een geldige materiaalkeuze.
+
+    Onbekende keuzes vallen terug op de eerste optie, zoals bij
+    ``LayerRow.load_from_dict`` (de keuzelijst blijft dan op zijn standaard).
+    """
+    cats = list(materials.keys())
+    cat = data.get("categorie")
+    if cat not in cats:
+        cat = cats[0] if cats else ""
+    subs = sub_keys(materials, cat) or ["—"]
+    sub = data.get("materiaal")
+    if sub not in subs:
+        sub = subs[0]
+    thirds = third_keys(materials, cat, sub)
+    third = data.get("subtype")
+    if thirds and third not in thirds:
+        third = thirds[0]
+    elif not thirds:
+        third = None
+    dikte = data.get("dikte")
+    manual_r = data.get("handmatige_r")
+    return {
+        "modus": data.get("modus") if data.get("modus") in MODES else MODE_MATERIAL,
+        "categorie": cat,
+        "materiaal": sub,
+        "subtype": third,
+        "dikte": DEFAULT_THICKNESS if dikte is None else float(dikte),
+        "handmatige_r": DEFAULT_MANUAL_R if manual_r is None else float(manual_r),
+    }
+
+
+class TableLayer:
+    """Eén laag in de tabelweergave; zelfde interface als ``LayerRow``."""
+
+    __slots__ = ("_model", "data")
+
+    def __init__(self, model: "LayerTableModel", data: dict) -> None:
+        self._model = model
+        self.data = data
+
+    def get_r(self) -> Optional[float]:
+        return layer_dict_r(self.data)
+
+    def row_info(self) -> dict:
+        return layer_info(self._model.materials, self.data)
+
+    def to_dict(self) -> dict:
+        return dict(self.data)
+
+    def load_from_dict(self, data: dict) -> None:
+        self._model.update_layer(self, data)
+
+
+class LayerTableModel(QAbstractTableModel):
+    """Lagen als rijen; ``layerChanged`` meldt elke bewerkte laag."""
+
+    layerChanged = pyqtSignal(object)
+
+    def __init__(self, materials: MaterialCatalogue, parent=None) -> None:
+        super().__init__(parent)
+        self.materials = materials
+        self.item_models = get_material_models(materials)
+        self.layers: list[TableLayer] = []
+
+    # ── QAbstractTableModel ──────────────────────────────────────────────────
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.layers)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section: int, orientation: int, role: int = Qt.DisplayRole) -> Any:
+        if role != Qt.DisplayRole:
+            return None
+        return COLUMNS[section] if orientation == Qt.Horizontal else str(section + 1)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        data = self.layers[index.row()].data
+        col = index.column()
+        manual = data["modus"] == MODE_MANUAL
+        if role == Qt.EditRole:
+            return (data["modus"], data["categorie"], data["materiaal"], data["subtype"],
+                    data["dikte"], data["handmatige_r"])[col]
+        if role == Qt.DisplayRole:
+            if col == COL_MODE:
+                return data["modus"]
+            if manual and col != COL_R:
+                return "—"
+            if col == COL_CAT:
+                return data["categorie"]
+            if col == COL_SUB:
+                return data["materiaal"]
+            if col == COL_THIRD:
+                return data["subtype"] or "—"
+            if col == COL_D:
+                return f"{data['dikte']:.3f}"
+            r = layer_dict_r(data)
+            return f"{r:.3f}" if r is not None else "?"
+        if role == Qt.TextAlignmentRole and col in (COL_D, COL_R):
+            return int(Qt.AlignCenter)
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        flags = super().flags(index)
+        if index.isValid() and self._editable(index.row(), index.column()):
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        layer = self.layers[index.row()]
+        data = dict(layer.data)
+        key = ("modus", "categorie", "materiaal", "subtype", "dikte", "handmatige_r")[index.column()]
+        if data[key] == value:
+            return False
+        data[key] = value
+        self.update_layer(layer, data)
+        return True
+
+    # ── Lagen ────────────────────────────────────────────────────────────────
+
+    def _editable(self, row: int, col: int) -> bool:
+        data = self.layers[row].data
+        if col == COL_MODE:
+            return True
+        if data["modus"] == MODE_MANUAL:
+            return col == COL_R
+        if col == COL_THIRD:
+            return data["subtype"] is not None
+        return col != COL_R
+
+    def options(self, row: int, col: int) -> list[str]:
+        """Keuzes voor een keuzelijstkolom van rij *row*."""
+        data = self.layers[row].data
+        if col == COL_MODE:
+            return list(MODES)
+        if col == COL_CAT:
+            return list(self.materials.keys())
+        if col == COL_SUB:
+            return sub_keys(self.materials, data["categorie"]) or ["—"]
+        if col == COL_THIRD:
+            return third_keys(self.materials, data["categorie"], data["materiaal"])
+        return []
+
+    def append(self, data: Optional[Mapping[str, Any]] = None) -> TableLayer:
+        layer = TableLayer(self, normalize_layer(self.materials, data or {}))
+        n = len(self.layers)
+        self.beginInsertRows(QModelIndex(), n, n)
+        self.layers.append(layer)
+        self.endInsertRows()
+        return layer
+
+    def remove(self, layer: TableLayer) -> None:
+        row = self.layers.index(layer)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.layers[row]
+        self.endRemoveRows()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self.layers.clear()
+        self.endResetModel()
+
+    def update_layer(self, layer: TableLayer, data: Mapping[str, Any]) -> None:
+        """Vervang de gegevens van *layer* en meld de rij als gewijzigd."""
+        layer.data = normalize_layer(self.materials, data)
+        row = self.layers.index(layer)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(COLUMNS) - 1))
+        self.layerChanged.emit(layer)
+
+
+class LayerDelegate(QStyledItemDelegate):
+    """Maakt per bewerkte cel een keuzelijst of spinbox aan."""
+
+    def createEditor(self, parent, option, index):
+        model = index.model()
+        col = index.column()
+        if col in (COL_D, COL_R):
+            editor = QDoubleSpinBox(parent)
+            editor.setRange(*(THICKNESS_RANGE if col == COL_D else MANUAL_R_RANGE))
+            editor.setDecimals(3)
+            editor.setSingleStep(0.1)
+            return editor
+        editor = QComboBox(parent)
+        data = model.layers[index.row()].data
+        if col == COL_CAT:
+            editor.setModel(model.item_models.categories)
+        elif col == COL_SUB:
+            editor.setModel(model.item_models.subs(data["categorie"]))
+        elif col == COL_THIRD:
+            editor.setModel(model.item_models.thirds(data["categorie"], data["materiaal"]))
+        else:
+            editor.addItems(model.options(index.row(), col))
+        # Een keuze direct doorvoeren, niet pas bij het verlaten van de cel
+        editor.activated.connect(lambda _: self.commitData.emit(editor))
+        return editor
+
+    def setEditorData(self, editor, index) -> None:
+        value = index.data(Qt.EditRole)
+        if isinstance(editor, QDoubleSpinBox):
+            editor.setValue(float(value or 0.0))
+        else:
+            editor.setCurrentText(value or "")
+
+    def setModelData(self, editor, model, index) -> None:
+        if isinstance(editor, QDoubleSpinBox):
+            model.setData(index, editor.value())
+        else:
+            model.setData(index, editor.currentText())
+
+
+class LayerTableView(QTableView):
+    """``QTableView`` over een :class:`LayerTableModel`."""
+
+    def __init__(self, model: LayerTableModel, parent=None) -> None:
+        super().__init__(parent)
+        self.setModel(model)
+        self.setItemDelegate(LayerDelegate(self))
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setEditTriggers(
+            QAbstractItemView.DoubleClicked
+            | QAbstractItemView.SelectedClicked
+            | QAbstractItemView.EditKeyPressed
+        )
+        header = self.horizontalHeader()
+        for col in range(len(COLUMNS)):
+            header.setSectionResizeMode(
+                col, QHeaderView.Stretch if col in (COL_CAT, COL_SUB) else QHeaderView.Interactive
+            )
+
+    def selected_layers(self) -> list[TableLayer]:
+        model = self.model()
+        rows = sorted({index.row() for index in self.selectionModel().selectedRows()})
+        return [model.layers[row] for row in rows]
@@ -150,7 +150,7 @@ QCheckBox::indicator:checked {{
 QScrollArea {{
     border: none;
 }}
-QTableWidget {{
+QTableView {{
     background: #1c2026;
     color: #ffffff;
     gridline-color: #3a3f4b;
@@ -158,7 +158,7 @@ QTableWidget {{
     border-radius: 4px;
     font-size: {fs}px;
 }}
-QTableWidget::item {{
+QTableView::item {{
     padding: 6px 10px;
 }}
 QHeaderView::section {{
@@ -315,7 +315,7 @@ QCheckBox::indicator:checked {{
 QScrollArea {{
     border: none;
 }}
-QTableWidget {{
+QTableView {{
     background: #ffffff;
     color: #1a1a1a;
     gridline-color: #999999;
@@ -323,7 +323,7 @@ QTableWidget {{
     border-radius: 4px;
     font-size: {fs}px;
 }}
-QTableWidget::item {{
+QTableView::item {{
     padding: 6px 10px;
 }}
 QHeaderView::section {{
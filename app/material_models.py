@@ -0,0 +1,78 @@
+"""material_models.py – Gedeelde itemmodellen voor de materiaalkeuzelijsten.
+
+Elke laag (``LayerRow`` en de editors van de lagentabel) heeft keuzelijsten
+voor categorie, materiaal en subtype.  In plaats van per laag dezelfde
+teksten met ``addItems`` te vullen, zetten ze hier eenmalig per catalogus
+opgebouwde ``QStandardItemModel``'s als model: één voor de categorieën, één
+per categorie (materialen) en één per materiaal met subtypes.
+
+De modellen worden gedeeld en mogen dus nooit via de keuzelijst gewijzigd
+worden (geen ``clear``/``addItems`` op een lijst met zo'n model).
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import Optional
+
+from PyQt5.QtGui import QStandardItem, QStandardItemModel
+
+_BASE_DIR = getattr(sys, "_MEIPASS", os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _BASE_DIR not in sys.path:
+    sys.path.insert(0, _BASE_DIR)
+
+from material_catalogue import MaterialCatalogue  # noqa: E402
+
+# Tekst van de lege keuzelijst (categorie zonder materialen, geen subtypes)
+PLACEHOLDER = "—"
+
+
+def _model(texts) -> QStandardItemModel:
+    model = QStandardItemModel()
+    for text in texts:
+        item = QStandardItem(text)
+        item.setEditable(False)
+        model.appendRow(item)
+    return model
+
+
+class MaterialModels:
+    """Alle keuzelijstmodellen van één :class:`MaterialCatalogue`."""
+
+    def __init__(self, catalogue: MaterialCatalogue) -> None:
+        self.catalogue = catalogue
+        self.categories = _model(catalogue.keys())
+        self.placeholder = _model([PLACEHOLDER])
+        self._subs = {
+            cat: _model(catalogue.sub_keys(cat)) for cat in catalogue.keys()
+            if catalogue.sub_keys(cat)
+        }
+        self._thirds = {
+            (cat, sub): _model(catalogue.third_keys(cat, sub))
+            for cat in catalogue.keys()
+            for sub in catalogue.sub_keys(cat)
+            if catalogue.third_keys(cat, sub)
+        }
+
+    def subs(self, cat: str) -> QStandardItemModel:
+        """Materialen van *cat* (het placeholdermodel als er geen zijn)."""
+        return self._subs.get(cat, self.placeholder)
+
+    def thirds(self, cat: str, sub: str) -> Optional[QStandardItemModel]:
+        """Subtypes van *cat* / *sub*, of ``None`` als het materiaal er geen heeft."""
+        return self._thirds.get((cat, sub))
+
+
+# id(catalogus) → modellen.  Ze blijven bestaan (en houden hun catalogus vast):
+# keuzelijsten van bestaande lagen kunnen na een herlaadactie van de catalogus
+# nog naar de oude modellen wijzen.
+_models: dict[int, MaterialModels] = {}
+
+
+def get_material_models(catalogue: MaterialCatalogue) -> MaterialModels:
+    """De gedeelde modellen voor *catalogue*, gebouwd bij de eerste aanvraag."""
+    models = _models.get(id(catalogue))
+    if models is None:
+        models = _models[id(catalogue)] = MaterialModels(catalogue)
+    return models
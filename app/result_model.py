@@ -0,0 +1,111 @@
+"""result_model.py – Tabelmodel voor de resultaattabellen.
+
+:class:`ResultTableModel` houdt de tabel bij als lijst van tekst-tuples en
+vergelijkt elke nieuwe inhoud met de vorige: alleen rijen die echt anders
+zijn worden als ``dataChanged`` gemeld, en rijen komen of verdwijnen alleen
+aan het eind.  Een ``QTableView`` hoeft daardoor alleen de gewijzigde cellen
+opnieuw te tekenen en er worden geen items per cel aangemaakt.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional, Sequence
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+Row = tuple[str, ...]
+
+
+class ResultTableModel(QAbstractTableModel):
+    """Alleen-lezen tabel van tekstcellen met kolomkoppen.
+
+    *alignments* geeft per kolom de tekstuitlijning (standaard gecentreerd).
+    """
+
+    def __init__(
+        self,
+        headers: Sequence[str],
+        alignments: Optional[Sequence[int]] = None,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+        self._headers = tuple(headers)
+        self._align = tuple(
+            int(a) for a in (alignments or [Qt.AlignCenter] * len(self._headers))
+        )
+        self._rows: list[Row] = []
+
+    # ── QAbstractTableModel ──────────────────────────────────────────────────
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.TextAlignmentRole:
+            return self._align[index.column()]
+        return None
+
+    def headerData(self, section: int, orientation: int, role: int = Qt.DisplayRole) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
+
+    # ── Bijwerken ────────────────────────────────────────────────────────────
+
+    def row(self, r_idx: int) -> Row:
+        return self._rows[r_idx]
+
+    def rows(self) -> list[Row]:
+        return list(self._rows)
+
+    def set_row(self, r_idx: int, values: Sequence[str]) -> None:
+        """Vervang één rij; meldt alleen de gewijzigde kolommen."""
+        new = tuple(values)
+        old = self._rows[r_idx]
+        if new == old:
+            return
+        changed = [c for c, (a, b) in enumerate(zip(old, new)) if a != b]
+        self._rows[r_idx] = new
+        self.dataChanged.emit(
+            self.index(r_idx, changed[0]), self.index(r_idx, changed[-1]), [Qt.DisplayRole]
+        )
+
+    def set_rows(self, rows: Sequence[Sequence[str]]) -> None:
+        """Vervang de hele inhoud; meldt alleen rijen die anders zijn."""
+        new = [tuple(r) for r in rows]
+        n_old, n_new = len(self._rows), len(new)
+        if n_new < n_old:
+            self.beginRemoveRows(QModelIndex(), n_new, n_old - 1)
+            del self._rows[n_new:]
+            self.endRemoveRows()
+
+        # Aaneengesloten reeksen gewijzigde rijen → één dataChanged per reeks
+        start = None
+        for r_idx in range(min(n_old, n_new) + 1):
+            differs = r_idx < min(n_old, n_new) and self._rows[r_idx] != new[r_idx]
+            if differs:
+                self._rows[r_idx] = new[r_idx]
+                if start is None:
+                    start = r_idx
+            elif start is not None:
+                self.dataChanged.emit(
+                    self.index(start, 0),
+                    self.index(r_idx - 1, len(self._headers) - 1),
+                    [Qt.DisplayRole],
+                )
+                start = None
+
+        if n_new > n_old:
+            self.beginInsertRows(QModelIndex(), n_old, n_new - 1)
+            self._rows.extend(new[n_old:])
+            self.endInsertRows()
+
+    def clear(self) -> None:
+        self.set_rows([])
@@ -0,0 +1,187 @@
+"""thickness_dialog.py – Benodigde isolatiedikte voor een doel-U of doel-Rc.
+
+Dialoog bij de U-waarde calculator: de gebruiker kiest de variabele laag en
+een doelwaarde; de dikte volgt in gesloten vorm (zie ``thickness_solver``),
+afgerond naar boven op handelsdiktes.  Daarnaast toont de dialoog in één keer
+alle isolatiematerialen uit de database, gesorteerd op benodigde dikte.
+Een dikte boven het maximum van een laag (:data:`~app.layer_table.THICKNESS_RANGE`)
+wordt gemeld en kan niet worden toegepast.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import Optional
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import (
+    QComboBox,
+    QDialog,
+    QDoubleSpinBox,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+
+_BASE_DIR = getattr(sys, "_MEIPASS", os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _BASE_DIR not in sys.path:
+    sys.path.insert(0, _BASE_DIR)
+
+from heat_calc import SURFACE_R  # noqa: E402
+from thickness_solver import ThicknessSolution, rank_materials, solve_thickness  # noqa: E402
+
+from .layer_table import THICKNESS_RANGE
+
+TARGET_U = "U  [W/(m²·K)]"
+TARGET_RC = "Rc  [m²·K/W]"
+
+
+def fits_layer(solution: ThicknessSolution) -> bool:
+    """True als de afgeronde dikte in het dikte-veld van een laag past."""
+    return solution.thickness <= THICKNESS_RANGE[1]
+
+
+class ThicknessDialog(QDialog):
+    """Bereken de benodigde dikte van één laag van een ``UValueTab``."""
+
+    def __init__(self, tab, parent=None) -> None:
+        super().__init__(parent or tab)
+        self.tab = tab
+        self.setWindowTitle("Benodigde isolatiedikte")
+        self.setMinimumWidth(560)
+        self.solution: Optional[ThicknessSolution] = None
+        self.ranking: list[ThicknessSolution] = []
+
+        root = QVBoxLayout(self)
+
+        row = QHBoxLayout()
+        row.addWidget(QLabel("Variabele laag:"))
+        self.layer_dd = QComboBox()
+        for i, layer in enumerate(tab.layers):
+            self.layer_dd.addItem(f"Laag {i + 1} – {layer.row_info()['naam']}")
+        row.addWidget(self.layer_dd, 1)
+        root.addLayout(row)
+
+        row = QHBoxLayout()
+        row.addWidget(QLabel("Doel:"))
+        self.target_dd = QComboBox()
+        self.target_dd.addItems([TARGET_U, TARGET_RC])
+        row.addWidget(self.target_dd)
+        self.target = QDoubleSpinBox()
+        self.target.setDecimals(3)
+        self.target.setRange(0.001, 100.0)
+        self.target.setSingleStep(0.01)
+        self.target.setValue(0.2)
+        row.addWidget(self.target)
+        row.addStretch()
+        root.addLayout(row)
+
+        self.result_label = QLabel("")
+        self.result_label.setWordWrap(True)
+        self.result_label.setStyleSheet("font-weight: bold; padding: 4px;")
+        root.addWidget(self.result_label)
+
+        self.rank_table = QTableWidget()
+        self.rank_table.setColumnCount(4)
+        self.rank_table.setHorizontalHeaderLabels(
+            ["Isolatiemateriaal", "λ [W/(m·K)]", "d [m]", "U [W/(m²·K)]"]
+        )
+        header = self.rank_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        for col in range(1, 4):
+            header.setSectionResizeMode(col, QHeaderView.ResizeToContents)
+        self.rank_table.verticalHeader().setVisible(False)
+        self.rank_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.rank_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.rank_table.setSelectionMode(QTableWidget.SingleSelection)
+        root.addWidget(self.rank_table, 1)
+
+        btn_row = QHBoxLayout()
+        self.apply_btn = QPushButton("Dikte toepassen")
+        self.apply_btn.clicked.connect(self._apply)
+        btn_row.addWidget(self.apply_btn)
+        self.apply_material_btn = QPushButton("Gekozen materiaal toepassen")
+        self.apply_material_btn.clicked.connect(self._apply_selected)
+        btn_row.addWidget(self.apply_material_btn)
+        btn_row.addStretch()
+        close_btn = QPushButton("Sluiten")
+        close_btn.setProperty("secondary", True)
+        close_btn.clicked.connect(self.reject)
+        btn_row.addWidget(close_btn)
+        root.addLayout(btn_row)
+
+        self.layer_dd.currentIndexChanged.connect(lambda _: self._solve())
+        self.target_dd.currentIndexChanged.connect(lambda _: self._solve())
+        self.target.valueChanged.connect(lambda _: self._solve())
+        self.rank_table.itemSelectionChanged.connect(self._update_buttons)
+
+        self._solve()
+
+    def _targets(self) -> dict:
+        key = "u" if self.target_dd.currentText() == TARGET_U else "rc"
+        return {
+            key: self.target.value(),
+            "ri": SURFACE_R[self.tab.ri_dd.currentText()],
+            "re": SURFACE_R[self.tab.re_dd.currentText()],
+        }
+
+    def _solve(self) -> None:
+        """Herbereken de dikte van de gekozen laag en de materiaalranglijst."""
+        index = self.layer_dd.currentIndex()
+        layers = [layer.to_dict() for layer in self.tab.layers]
+        if index < 0:
+            return
+        kwargs = self._targets()
+
+        try:
+            self.solution = solve_thickness(layers, index, **kwargs)
+        except ValueError:
+            self.solution = None
+            self.result_label.setText(
+                "De gekozen laag heeft geen λ-waarde; kies hieronder een isolatiemateriaal."
+            )
+        else:
+            s = self.solution
+            text = (
+                f"{s.label}:  d = {s.exact:.4f} m  →  {s.thickness:.3f} m"
+                f"   (Rc = {s.rc:.3f} m²·K/W, U = {s.u:.3f} W/(m²·K))"
+            )
+            if not fits_layer(s):
+                text += f"\n⚠ Dikker dan de maximale laagdikte van {THICKNESS_RANGE[1]:g} m."
+            self.result_label.setText(text)
+
+        self.ranking = rank_materials(layers, index, **kwargs)
+        self.rank_table.setRowCount(len(self.ranking))
+        for r_idx, s in enumerate(self.ranking):
+            for c_idx, val in enumerate(
+                [s.label, f"{s.lam:.4f}", f"{s.thickness:.3f}", f"{s.u:.3f}"]
+            ):
+                item = QTableWidgetItem(val)
+                if c_idx:
+                    item.setTextAlignment(Qt.AlignCenter)
+                if not fits_layer(s):
+                    item.setFlags(item.flags() & ~Qt.ItemIsSelectable)
+                    item.setToolTip(f"Dikker dan de maximale laagdikte van {THICKNESS_RANGE[1]:g} m")
+                self.rank_table.setItem(r_idx, c_idx, item)
+        self._update_buttons()
+
+    def _update_buttons(self) -> None:
+        self.apply_btn.setEnabled(self.solution is not None and fits_layer(self.solution))
+        rows = self.rank_table.selectionModel().selectedRows()
+        self.apply_material_btn.setEnabled(bool(rows) and fits_layer(self.ranking[rows[0].row()]))
+
+    def _apply(self) -> None:
+        if self.solution is not None and fits_layer(self.solution):
+            self.tab.apply_thickness(self.layer_dd.currentIndex(), self.solution)
+            self.accept()
+
+    def _apply_selected(self) -> None:
+        rows = self.rank_table.selectionModel().selectedRows()
+        if rows and fits_layer(self.ranking[rows[0].row()]):
+            self.tab.apply_thickness(self.layer_dd.currentIndex(), self.ranking[rows[0].row()])
+            self.accept()
@@ -2,7 +2,11 @@
 
 Elke constructielaag laat de gebruiker een materiaal kiezen uit de
 JSON-database of handmatig een R-waarde invoeren.  De resultaattabel
-wordt live bijgewerkt.
+wordt live bijgewerkt: wijzigingen binnen :data:`REFRESH_DEBOUNCE_MS` worden
+samengevoegd, en alleen de rijen van gewijzigde lagen plus de totalen worden
+opnieuw geschreven (:class:`~app.result_model.ResultTableModel`).  De
+Monte Carlo-spreiding wordt op de achtergrond berekend
+(:class:`~app.compute_worker.ComputeWorker`).
 """
 
 from __future__ import annotations
@@ -10,10 +14,13 @@ from __future__ import annotations
 import json
 import os
 import sys
-from typing import Callable, Optional
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QKeySequence
 from PyQt5.QtWidgets import (
+    QApplication,
     QComboBox,
     QCheckBox,
     QDoubleSpinBox,
@@ -25,8 +32,8 @@ from PyQt5.QtWidgets import (
     QLabel,
     QPushButton,
     QScrollArea,
-    QTableWidget,
-    QTableWidgetItem,
+    QShortcut,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -36,18 +43,38 @@ if _BASE_DIR not in sys.path:
     sys.path.insert(0, _BASE_DIR)
 
 from heat_calc import (  # noqa: E402
+    MC_DRAWS,
     U_VALUE_CATS,
     R_VALUE_CATS,
     SURFACE_R,
-    scalar,
-    sub_keys,
-    third_keys,
+    pack_ranges,
     raw_value,
+    u_value_monte_carlo,
 )
+from material_catalogue import MaterialCatalogue, get_catalogue  # noqa: E402
+from thickness_solver import ThicknessSolution  # noqa: E402
+
+from .compute_worker import ComputeWorker
+from .layer_table import (
+    THICKNESS_RANGE,
+    LayerTableModel,
+    LayerTableView,
+    TableLayer,
+    layer_dict_r,
+    layer_info,
+)
+from .material_models import get_material_models
+from .result_model import ResultTableModel
+from .thickness_dialog import ThicknessDialog
+
+# Verdelingen voor de Monte Carlo-modus (label → heat_calc-naam)
+MC_DIST_LABELS = {"Uniform": "uniform", "Driehoek": "triangular"}
+
+# Wijzigingen binnen dit venster [ms] geven samen één tabelupdate
+REFRESH_DEBOUNCE_MS = 30
 
-_MATERIALS_PATH = os.path.join(_BASE_DIR, "material_properties.json")
-with open(_MATERIALS_PATH, "r", encoding="utf-8") as _fh:
-    _MATERIALS: dict = json.load(_fh)
+# Bij het laden van meer lagen schakelt de tab over op de tabelweergave
+TABLE_VIEW_LAYERS = 25
 
 
 class LayerRow(QFrame):
@@ -55,12 +82,14 @@ class LayerRow(QFrame):
 
     def __init__(
         self,
-        materials: dict,
-        on_change: Callable[[], None],
+        materials: MaterialCatalogue,
+        on_change: Callable[["LayerRow"], None],
         on_remove: Callable[["LayerRow"], None],
     ) -> None:
         super().__init__()
         self.materials = materials
+        self._models = get_material_models(materials)
+        self._has_third = False
         self._on_change = on_change
         self._on_remove = on_remove
 
@@ -88,7 +117,7 @@ class LayerRow(QFrame):
 
         sel_row = QHBoxLayout()
         self.cat_dd = QComboBox()
-        self.cat_dd.addItems(list(materials.keys()))
+        self.cat_dd.setModel(self._models.categories)
         self.cat_dd.setSizeAdjustPolicy(QComboBox.AdjustToContents)
         sel_row.addWidget(QLabel("Categorie:"))
         sel_row.addWidget(self.cat_dd)
@@ -108,7 +137,7 @@ class LayerRow(QFrame):
 
         dim_row = QHBoxLayout()
         self.thickness = QDoubleSpinBox()
-        self.thickness.setRange(0.0, 10.0)
+        self.thickness.setRange(*THICKNESS_RANGE)
         self.thickness.setDecimals(3)
         self.thickness.setSingleStep(0.1)
         self.thickness.setValue(0.100)
@@ -172,26 +201,21 @@ class LayerRow(QFrame):
         self._recalc()
 
     def _refresh_sub(self) -> None:
-        self.sub_dd.blockSignals(True)
-        self.sub_dd.clear()
-        opts = sub_keys(self.materials, self.cat_dd.currentText())
-        self.sub_dd.addItems(opts if opts else ["—"])
-        self.sub_dd.blockSignals(False)
+        blocked = self.sub_dd.blockSignals(True)
+        self.sub_dd.setModel(self._models.subs(self.cat_dd.currentText()))
+        self.sub_dd.blockSignals(blocked)
 
     def _refresh_third(self) -> None:
-        self.third_dd.blockSignals(True)
-        self.third_dd.clear()
-        sub = self.sub_dd.currentText() if self.sub_dd.count() else ""
-        opts = third_keys(self.materials, self.cat_dd.currentText(), sub)
-        if opts:
-            self.third_dd.addItems(opts)
-            self.third_dd.setVisible(True)
-            self.third_lbl.setVisible(True)
-        else:
-            self.third_dd.addItems(["—"])
-            self.third_dd.setVisible(False)
-            self.third_lbl.setVisible(False)
-        self.third_dd.blockSignals(False)
+        blocked = self.third_dd.blockSignals(True)
+        model = self._models.thirds(self.cat_dd.currentText(), self.sub_dd.currentText())
+        self._has_third = model is not None
+        self.third_dd.setModel(model if model is not None else self._models.placeholder)
+        self.third_dd.setVisible(self._has_third)
+        self.third_lbl.setVisible(self._has_third)
+        self.third_dd.blockSignals(blocked)
+
+    def _third(self) -> Optional[str]:
+        return self.third_dd.currentText() if self._has_third else None
 
     def _recalc(self) -> None:
         r = self.get_r()
@@ -210,12 +234,7 @@ class LayerRow(QFrame):
         ):
             self.lam_lbl.setText("")
         else:
-            third = (
-                self.third_dd.currentText()
-                if self.third_dd.isVisible()
-                else None
-            )
-            val = raw_value(self.materials, cat, self.sub_dd.currentText(), third)
+            val = raw_value(self.materials, cat, self.sub_dd.currentText(), self._third())
             if isinstance(val, list):
                 self.lam_lbl.setText(
                     f"  λ = {val[0]} – {val[1]} W/(m·K)"
@@ -226,68 +245,16 @@ class LayerRow(QFrame):
             else:
                 self.lam_lbl.setText("")
 
-        self._on_change()
+        self._on_change(self)
 
     def get_r(self) -> Optional[float]:
         """Bereken de warmteweerstand [m²·K/W] voor deze laag."""
-        if self.mode_cb.currentText() == "Handmatige R":
-            return self.manual_r.value()
-
-        cat = self.cat_dd.currentText()
-        sub = self.sub_dd.currentText()
-        third = (
-            self.third_dd.currentText() if self.third_dd.isVisible() else None
-        )
-        val = raw_value(self.materials, cat, sub, third)
-
-        if cat in U_VALUE_CATS:
-            u = scalar(val)
-            return (1.0 / u) if u else None
-
-        if cat in R_VALUE_CATS:
-            return scalar(val)
-
-        lam = scalar(val)
-        d = self.thickness.value()
-        return (d / lam) if (lam and lam > 0 and d > 0) else None
+        return layer_dict_r(self.to_dict())
 
     def row_info(self) -> dict:
-        """Geeft een dict met weergave-informatie voor de resultaatrij."""
-        cat = self.cat_dd.currentText()
-        sub = self.sub_dd.currentText()
-        third = (
-            self.third_dd.currentText() if self.third_dd.isVisible() else None
-        )
-        r = self.get_r()
-
-        if self.mode_cb.currentText() == "Handmatige R":
-            formula = f"{r:.3f}" if r is not None else "?"
-            return {"naam": "Handmatig", "d": None, "lam": "—", "R": r, "formula": formula}
-
-        val = raw_value(self.materials, cat, sub, third)
-        label = f"{cat} / {sub}" + (f" / {third}" if third else "")
-
-        if cat in U_VALUE_CATS:
-            u = scalar(val)
-            formula = f"1 / {u:.2f} = {r:.3f}" if (u and r is not None) else "?"
-            return {"naam": label, "d": None, "lam": f"(U={u:.2f})", "R": r, "formula": formula}
-        if cat in R_VALUE_CATS:
-            formula = f"{r:.3f}" if r is not None else "?"
-            return {"naam": label, "d": None, "lam": "(R-waarde)", "R": r, "formula": formula}
-
-        lam = scalar(val)
-        d = self.thickness.value()
-        if lam and lam > 0 and d > 0 and r is not None:
-            formula = f"{d:.3f} / {lam:.4f} = {r:.3f}"
-        else:
-            formula = "?"
-        return {
-            "naam": label,
-            "d": d,
-            "lam": f"{lam:.4f}" if lam else "—",
-            "R": r,
-            "formula": formula,
-        }
+        """Geeft een dict met weergave-informatie voor de resultaatrij (zie
+        :func:`~app.layer_table.layer_info`)."""
+        return layer_info(self.materials, self.to_dict())
 
     def to_dict(self) -> dict:
         """Exporteer laagconfiguratie als dict voor opslaan."""
@@ -295,37 +262,47 @@ class LayerRow(QFrame):
             "modus": self.mode_cb.currentText(),
             "categorie": self.cat_dd.currentText(),
             "materiaal": self.sub_dd.currentText(),
-            "subtype": self.third_dd.currentText() if self.third_dd.isVisible() else None,
+            "subtype": self._third(),
             "dikte": self.thickness.value(),
             "handmatige_r": self.manual_r.value(),
         }
 
     def load_from_dict(self, data: dict) -> None:
-        """Herstel laagconfiguratie vanuit een dict."""
-        self.mode_cb.blockSignals(True)
-        if data.get("modus") in ["Materiaallijst", "Handmatige R"]:
-            self.mode_cb.setCurrentText(data["modus"])
-        self.mode_cb.blockSignals(False)
-
-        if data.get("categorie"):
-            idx = self.cat_dd.findText(data["categorie"])
-            if idx >= 0:
-                self.cat_dd.setCurrentIndex(idx)
-                self._refresh_sub()
-        if data.get("materiaal"):
-            idx = self.sub_dd.findText(data["materiaal"])
-            if idx >= 0:
-                self.sub_dd.setCurrentIndex(idx)
-                self._refresh_third()
-        if data.get("subtype"):
-            idx = self.third_dd.findText(data["subtype"])
-            if idx >= 0:
-                self.third_dd.setCurrentIndex(idx)
-
-        if data.get("dikte") is not None:
-            self.thickness.setValue(data["dikte"])
-        if data.get("handmatige_r") is not None:
-            self.manual_r.setValue(data["handmatige_r"])
+        """Herstel laagconfiguratie vanuit een dict.
+
+        De invoerwidgets zijn daarbij geblokkeerd; de laag wordt aan het eind
+        één keer herberekend.
+        """
+        widgets = (self.mode_cb, self.cat_dd, self.sub_dd, self.third_dd,
+                   self.thickness, self.manual_r)
+        blocked = [w.blockSignals(True) for w in widgets]
+        try:
+            if data.get("modus") in ["Materiaallijst", "Handmatige R"]:
+                self.mode_cb.setCurrentText(data["modus"])
+
+            if data.get("categorie"):
+                idx = self.cat_dd.findText(data["categorie"])
+                if idx >= 0:
+                    self.cat_dd.setCurrentIndex(idx)
+                    self._refresh_sub()
+                    self._refresh_third()
+            if data.get("materiaal"):
+                idx = self.sub_dd.findText(data["materiaal"])
+                if idx >= 0:
+                    self.sub_dd.setCurrentIndex(idx)
+                    self._refresh_third()
+            if data.get("subtype"):
+                idx = self.third_dd.findText(data["subtype"])
+                if idx >= 0:
+                    self.third_dd.setCurrentIndex(idx)
+
+            if data.get("dikte") is not None:
+                self.thickness.setValue(data["dikte"])
+            if data.get("handmatige_r") is not None:
+                self.manual_r.setValue(data["handmatige_r"])
+        finally:
+            for w, was_blocked in zip(widgets, blocked):
+                w.blockSignals(was_blocked)
 
         self._on_mode()
 
@@ -336,7 +313,8 @@ class UValueTab(QWidget):
     def __init__(self, config) -> None:
         super().__init__()
         self.config = config
-        self.layers: list[LayerRow] = []
+        # LayerRow-widgets, of TableLayer-rijen in de tabelweergave
+        self.layers: list[LayerRow | TableLayer] = []
 
         root = QVBoxLayout(self)
 
@@ -372,28 +350,54 @@ class UValueTab(QWidget):
         self.scroll.setWidget(self.scroll_content)
         layers_outer.addWidget(self.scroll)
 
+        # Tabelweergave voor grote constructies (zie layer_table.py)
+        self.layer_model = LayerTableModel(get_catalogue(), self)
+        self.layer_model.layerChanged.connect(self._layer_changed)
+        self.layer_view = LayerTableView(self.layer_model)
+        self.layer_view.setVisible(False)
+        for keys, slot in ((QKeySequence.Copy, self._copy_layers),
+                           (QKeySequence.Paste, self._paste_layers)):
+            QShortcut(keys, self.layer_view, slot, context=Qt.WidgetShortcut)
+        layers_outer.addWidget(self.layer_view)
+
         btn_row = QHBoxLayout()
         add_btn = QPushButton("＋ Laag toevoegen")
         add_btn.clicked.connect(self._add_layer)
         btn_row.addWidget(add_btn)
+        self.remove_sel_btn = QPushButton("✕ Verwijder selectie")
+        self.remove_sel_btn.setProperty("danger", True)
+        self.remove_sel_btn.clicked.connect(self._remove_selected_layers)
+        self.remove_sel_btn.setVisible(False)
+        btn_row.addWidget(self.remove_sel_btn)
+        solve_btn = QPushButton("Benodigde dikte…")
+        solve_btn.setProperty("secondary", True)
+        solve_btn.clicked.connect(self._open_thickness_dialog)
+        btn_row.addWidget(solve_btn)
         btn_row.addStretch()
+        self.table_cb = QCheckBox("Tabelweergave")
+        self.table_cb.setToolTip(
+            f"Toon de lagen als tabel; gaat automatisch aan bij meer dan "
+            f"{TABLE_VIEW_LAYERS} lagen"
+        )
+        self.table_cb.toggled.connect(self._set_table_view)
+        btn_row.addWidget(self.table_cb)
         layers_outer.addLayout(btn_row)
         root.addWidget(layers_group, 3)
 
         # Resultaat
         res_group = QGroupBox("Resultaat")
         res_layout = QVBoxLayout(res_group)
-        self.result_table = QTableWidget()
-        self.result_table.setColumnCount(5)
-        self.result_table.setHorizontalHeaderLabels(
+        self.result_model = ResultTableModel(
             ["Materiaal / Laag", "d [m]", "λ [W/(m·K)]", "Berekening → R [m²·K/W]", "Ri & Re [m²·K/W]"]
         )
+        self.result_table = QTableView()
+        self.result_table.setModel(self.result_model)
         header = self.result_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Stretch)
         for col in range(1, 5):
             header.setSectionResizeMode(col, QHeaderView.ResizeToContents)
         self.result_table.verticalHeader().setVisible(False)
-        self.result_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.result_table.setEditTriggers(QTableView.NoEditTriggers)
         res_layout.addWidget(self.result_table)
 
         self.u_label = QLabel("")
@@ -401,6 +405,28 @@ class UValueTab(QWidget):
         self.u_label.setStyleSheet("font-weight: bold; padding: 8px;")
         self.u_label.setWordWrap(True)
         res_layout.addWidget(self.u_label)
+
+        mc_row = QHBoxLayout()
+        self.bounds_cb = QCheckBox("Bandbreedte λ_min – λ_max")
+        self.bounds_cb.setToolTip("Toon de gegarandeerde onder- en bovengrens van R, Rc en U")
+        mc_row.addWidget(self.bounds_cb)
+        self.mc_cb = QCheckBox("Spreiding λ-bereik (Monte Carlo)")
+        self.mc_cb.setToolTip(
+            f"Trek {MC_DRAWS:,} keer een λ binnen het bereik van elk materiaal".replace(",", ".")
+        )
+        mc_row.addWidget(self.mc_cb)
+        self.mc_dist_dd = QComboBox()
+        self.mc_dist_dd.addItems(list(MC_DIST_LABELS))
+        self.mc_dist_dd.setEnabled(False)
+        mc_row.addWidget(self.mc_dist_dd)
+        mc_row.addStretch()
+        res_layout.addLayout(mc_row)
+
+        self.mc_label = QLabel("")
+        self.mc_label.setAlignment(Qt.AlignCenter)
+        self.mc_label.setWordWrap(True)
+        self.mc_label.setVisible(False)
+        res_layout.addWidget(self.mc_label)
         root.addWidget(res_group, 1)
 
         # Opslaan / Laden knoppen
@@ -416,65 +442,300 @@ class UValueTab(QWidget):
         io_row.addStretch()
         root.addLayout(io_row)
 
+        # Tabelupdates: gewijzigde lagen worden verzameld en na
+        # REFRESH_DEBOUNCE_MS in één keer verwerkt
+        self._row_info: dict[LayerRow, dict] = {}   # laatst getoonde rij per laag
+        self._dirty: dict[LayerRow, None] = {}      # geordende set
+        self._full_refresh = False
+        self._bulk = 0                              # diepte van bulk_update()
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(REFRESH_DEBOUNCE_MS)
+        self._refresh_timer.timeout.connect(self._flush_refresh)
+        self.worker = ComputeWorker(parent=self)
+        self.worker.finished.connect(self._on_monte_carlo)
+        self.worker.failed.connect(self._on_monte_carlo_failed)
+
         # Signalen
-        self.ri_dd.currentTextChanged.connect(lambda _: self._refresh())
-        self.re_dd.currentTextChanged.connect(lambda _: self._refresh())
+        self.ri_dd.currentTextChanged.connect(lambda _: self._schedule_refresh(full=True))
+        self.re_dd.currentTextChanged.connect(lambda _: self._schedule_refresh(full=True))
+        self.bounds_cb.toggled.connect(lambda _: self._schedule_refresh(full=True))
+        self.mc_cb.toggled.connect(self.mc_dist_dd.setEnabled)
+        self.mc_cb.toggled.connect(lambda _: self._schedule_refresh())
+        self.mc_dist_dd.currentTextChanged.connect(lambda _: self._schedule_refresh())
 
         # Start met één lege laag
         self._add_layer()
+        self._refresh()
 
-    def _add_layer(self) -> None:
-        layer = LayerRow(_MATERIALS, self._refresh, self._remove_layer)
+    def _create_layer(self, data: Optional[dict] = None) -> LayerRow | TableLayer:
+        """Maak een laag in de huidige weergave en voeg hem achteraan toe."""
+        if self.table_cb.isChecked():
+            layer = self.layer_model.append(data)
+        else:
+            layer = LayerRow(get_catalogue(), self._layer_changed, self._remove_layer)
+            if data is not None:
+                layer.load_from_dict(data)
+            self.layers_layout.addWidget(layer)
         self.layers.append(layer)
-        self.layers_layout.addWidget(layer)
-        self._refresh()
+        return layer
 
-    def _remove_layer(self, layer: LayerRow) -> None:
+    def _add_layer(self) -> None:
+        self._create_layer()
+        self._schedule_refresh(full=True)
+
+    def _remove_layer(self, layer: LayerRow | TableLayer) -> None:
         self.layers.remove(layer)
-        self.layers_layout.removeWidget(layer)
-        layer.deleteLater()
+        if isinstance(layer, TableLayer):
+            self.layer_model.remove(layer)
+        else:
+            self.layers_layout.removeWidget(layer)
+            layer.deleteLater()
+        self._row_info.pop(layer, None)
+        self._dirty.pop(layer, None)
+        self._schedule_refresh(full=True)
+
+    def _remove_selected_layers(self) -> None:
+        for layer in self.layer_view.selected_layers():
+            self._remove_layer(layer)
+
+    def _clear_layers(self) -> None:
+        for layer in self.layers:
+            if isinstance(layer, LayerRow):
+                self.layers_layout.removeWidget(layer)
+                layer.deleteLater()
+        self.layer_model.clear()
+        self.layers.clear()
+        self._row_info.clear()
+        self._dirty.clear()
+        self._schedule_refresh(full=True)
+
+    def _set_table_view(self, on: bool) -> None:
+        """Wissel tussen LayerRow-widgets en de tabelweergave (lagen blijven gelijk)."""
+        with self.bulk_update():
+            data = [layer.to_dict() for layer in self.layers]
+            self._clear_layers()
+            self.scroll.setVisible(not on)
+            self.layer_view.setVisible(on)
+            self.remove_sel_btn.setVisible(on)
+            for layer_data in data:
+                self._create_layer(layer_data)
+
+    @contextmanager
+    def bulk_update(self) -> Iterator[None]:
+        """Stel alle tabelupdates uit; na afloop volgt precies één ``_refresh``.
+
+        Te nesten: alleen het buitenste blok ververst.
+        """
+        self._bulk += 1
+        try:
+            yield
+        finally:
+            self._bulk -= 1
+            if not self._bulk:
+                self._refresh()
+
+    def set_layers(self, layers: list[dict]) -> None:
+        """Vervang alle lagen in één bulkupdate (laden van een project)."""
+        with self.bulk_update():
+            self._clear_layers()
+            self.append_layers(layers)
+
+    def append_layers(self, layers: list[dict]) -> None:
+        """Voeg lagen achteraan toe in één bulkupdate (plakken).
+
+        Boven :data:`TABLE_VIEW_LAYERS` lagen gaat de tabelweergave aan.
+        """
+        with self.bulk_update():
+            if len(self.layers) + len(layers) > TABLE_VIEW_LAYERS:
+                self.table_cb.setChecked(True)
+            for layer_data in layers:
+                self._create_layer(layer_data)
+
+    def _copy_layers(self) -> None:
+        """Kopieer de geselecteerde lagen (of alle) als JSON naar het klembord."""
+        layers = self.layer_view.selected_layers() or self.layers
+        QApplication.clipboard().setText(
+            json.dumps([layer.to_dict() for layer in layers], indent=2, ensure_ascii=False)
+        )
+
+    def _paste_layers(self) -> None:
+        """Plak lagen uit het klembord: een JSON-lijst van lagen of een ``.uwr``."""
+        try:
+            data = json.loads(QApplication.clipboard().text())
+        except ValueError:
+            return
+        if isinstance(data, dict):
+            data = data.get("lagen", [])
+        if isinstance(data, list):
+            self.append_layers([layer for layer in data if isinstance(layer, dict)])
+
+    def _open_thickness_dialog(self) -> None:
+        ThicknessDialog(self).exec_()
+
+    def apply_thickness(self, index: int, solution: ThicknessSolution) -> None:
+        """Zet materiaal en (afgeronde) dikte uit *solution* op laag *index*.
+
+        Een dikte buiten :data:`~app.layer_table.THICKNESS_RANGE` geeft een
+        ``ValueError`` in plaats van een afgekapte waarde.
+        """
+        lo, hi = THICKNESS_RANGE
+        if not lo <= solution.thickness <= hi:
+            raise ValueError(
+                f"Dikte {solution.thickness:.3f} m valt buiten het bereik {lo:g} – {hi:g} m"
+            )
+        main, sub, third = solution.path
+        self.layers[index].load_from_dict(
+            {"modus": "Materiaallijst", "categorie": main, "materiaal": sub,
+             "subtype": third, "dikte": solution.thickness}
+        )
         self._refresh()
 
+    # ── Resultaattabel ───────────────────────────────────────────────────────
+
+    def _layer_changed(self, layer: LayerRow | TableLayer) -> None:
+        if self._bulk:
+            return
+        self._dirty[layer] = None
+        self._schedule_refresh()
+
+    def _schedule_refresh(self, full: bool = False) -> None:
+        """Plan een tabelupdate; *full* bouwt alle rijen opnieuw op.
+
+        De timer wordt niet herstart, zodat ook een aanhoudende reeks
+        wijzigingen (scrollen door een spinbox) elke REFRESH_DEBOUNCE_MS
+        zichtbaar wordt.
+        """
+        self._full_refresh |= full
+        if not self._bulk and not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _flush_refresh(self) -> None:
+        """Verwerk de geplande updates: alleen gewijzigde rijen + totalen."""
+        if self._full_refresh:
+            self._refresh()
+            return
+        dirty = [layer for layer in self._dirty if layer in self._row_info]
+        self._dirty.clear()
+        show_bounds = self.bounds_cb.isChecked()
+        for layer in dirty:
+            info = layer.row_info()
+            self._row_info[layer] = info
+            self.result_model.set_row(
+                self.layers.index(layer) + 1, self._layer_cells(info, show_bounds)
+            )
+        self._update_totals()
+
     def _refresh(self) -> None:
+        """Bouw de hele resultaattabel direct opnieuw op."""
+        self._refresh_timer.stop()
+        self._dirty.clear()
+        self._full_refresh = False
+        ri = SURFACE_R[self.ri_dd.currentText()]
+        re = SURFACE_R[self.re_dd.currentText()]
+        show_bounds = self.bounds_cb.isChecked()
+
+        self._row_info = {layer: layer.row_info() for layer in self.layers}
+        rows = [["lucht (binnen)", "—", "—", "—", f"{ri:.2f}"]]
+        rows += [self._layer_cells(self._row_info[layer], show_bounds) for layer in self.layers]
+        rows.append(["lucht (buiten)", "—", "—", "—", f"{re:.2f}"])
+        self._update_totals(rows)
+
+    @staticmethod
+    def _layer_cells(info: dict, show_bounds: bool) -> list[str]:
+        r = info["R"]
+        d = info["d"]
+        d_str = f"{d:.3f}" if isinstance(d, float) else "—"
+        formula = info.get("formula", f"{r:.3f}" if r is not None else "?")
+        bounds = info.get("R_bounds")
+        if show_bounds and bounds is not None and bounds[0] != bounds[1]:
+            formula += f"  [{bounds[0]:.3f} – {bounds[1]:.3f}]"
+        return [info["naam"], d_str, str(info["lam"]), formula, "—"]
+
+    def _update_totals(self, rows: Optional[list[list[str]]] = None) -> None:
+        """TOTAAL-rij, U-label en Monte Carlo uit de laatst getoonde rijen.
+
+        Met *rows* (alle rijen behalve TOTAAL) wordt de hele tabel vervangen.
+        """
         ri = SURFACE_R[self.ri_dd.currentText()]
         re = SURFACE_R[self.re_dd.currentText()]
+        show_bounds = self.bounds_cb.isChecked()
 
-        rows: list[list[str]] = []
         total_d = 0.0
         total_rc = 0.0
-
-        rows.append(["lucht (binnen)", "—", "—", "—", f"{ri:.2f}"])
-
+        rc_min = rc_max = 0.0
         for layer in self.layers:
-            info = layer.row_info()
-            r = info["R"]
-            d = info["d"]
-            d_str = f"{d:.3f}" if isinstance(d, float) else "—"
-            if isinstance(d, float):
-                total_d += d
-            if r is not None:
-                total_rc += r
-            rows.append([info["naam"], d_str, str(info["lam"]), info.get("formula", f"{r:.3f}" if r is not None else "?"), "—"])
-
-        rows.append(["lucht (buiten)", "—", "—", "—", f"{re:.2f}"])
+            info = self._row_info[layer]
+            if isinstance(info["d"], float):
+                total_d += info["d"]
+            if info["R"] is not None:
+                total_rc += info["R"]
+            bounds = info.get("R_bounds")
+            if bounds is not None:
+                rc_min += bounds[0]
+                rc_max += bounds[1]
 
         total_r = ri + total_rc + re
         u = 1.0 / total_r if total_r > 0 else None
         u_str = f"{u:.3f}" if u is not None else "?"
         d_tot = f"{total_d:.3f}" if total_d > 0 else "—"
-        rows.append(["TOTAAL", d_tot, "—", f"{total_rc:.3f}", f"{ri + re:.2f}"])
-
-        self.result_table.setRowCount(len(rows))
-        for r_idx, row in enumerate(rows):
-            for c_idx, val in enumerate(row):
-                item = QTableWidgetItem(val)
-                item.setTextAlignment(Qt.AlignCenter)
-                self.result_table.setItem(r_idx, c_idx, item)
+        rc_str = f"{total_rc:.3f}"
+        if show_bounds and rc_min != rc_max:
+            rc_str += f"  [{rc_min:.3f} – {rc_max:.3f}]"
+        totals = ["TOTAAL", d_tot, "—", rc_str, f"{ri + re:.2f}"]
+        if rows is None:
+            self.result_model.set_row(len(self.layers) + 2, totals)
+        else:
+            self.result_model.set_rows(rows + [totals])
 
-        self.u_label.setText(
+        u_text = (
             f"U = 1 / (Ri {ri:.2f} + Rc {total_rc:.3f} + Re {re:.2f})"
             f"  =  {u_str} W/(m²·K)"
         )
+        if show_bounds and ri + rc_min + re > 0:
+            u_text += (
+                f"\nU ligt tussen {1.0 / (ri + rc_max + re):.3f} en "
+                f"{1.0 / (ri + rc_min + re):.3f} W/(m²·K)  (λ_min – λ_max)"
+            )
+        self.u_label.setText(u_text)
+        self._refresh_monte_carlo(ri, re)
+
+    def _refresh_monte_carlo(self, ri: float, re: float) -> None:
+        """Start de U-spreiding door λ-bereiken (alleen als de modus aan staat).
+
+        De trekkingen lopen op de achtergrond; nieuwere invoer maakt een
+        lopende berekening overbodig.
+        """
+        self.mc_label.setVisible(self.mc_cb.isChecked())
+        if not self.mc_cb.isChecked():
+            self.worker.cancel("monte_carlo")
+            self.mc_label.setText("")
+            return
+        low, high, thickness, kinds = pack_ranges(
+            get_catalogue(), [[layer.to_dict() for layer in self.layers]]
+        )
+        if not self.mc_label.text():
+            self.mc_label.setText("Spreiding berekenen…")   # anders blijft de vorige staan
+        self.worker.submit(
+            "monte_carlo", u_value_monte_carlo,
+            low, high, thickness, kinds, ri, re,
+            distribution=MC_DIST_LABELS[self.mc_dist_dd.currentText()],
+        )
+
+    def _on_monte_carlo(self, key: str, _generation: int, mc) -> None:
+        if key != "monte_carlo":
+            return
+        if mc.std[0] == 0:
+            self.mc_label.setText("Geen λ-bereiken in deze constructie – U ligt vast.")
+            return
+        self.mc_label.setText(
+            f"U gemiddeld {mc.mean[0]:.3f} W/(m²·K)   ·   "
+            f"P5 – P95: {mc.p5[0]:.3f} – {mc.p95[0]:.3f} W/(m²·K)"
+        )
+
+    def _on_monte_carlo_failed(self, key: str, _generation: int, exc: Exception) -> None:
+        if key == "monte_carlo":
+            self.mc_label.setText(f"⚠ {exc}")
 
     # ── Opslaan / Laden ──────────────────────────────────────────────────────
 
@@ -506,26 +767,17 @@ class UValueTab(QWidget):
             return
         with open(path, "r", encoding="utf-8") as fh:
             data = json.load(fh)
-
-        # Herstel Ri / Re
-        if data.get("ri"):
-            idx = self.ri_dd.findText(data["ri"])
-            if idx >= 0:
-                self.ri_dd.setCurrentIndex(idx)
-        if data.get("re"):
-            idx = self.re_dd.findText(data["re"])
-            if idx >= 0:
-                self.re_dd.setCurrentIndex(idx)
-
-        # Verwijder bestaande lagen
-        for layer in list(self.layers):
-            self._remove_layer(layer)
-
-        # Maak nieuwe lagen aan
-        for layer_data in data.get("lagen", []):
-            layer = LayerRow(_MATERIALS, self._refresh, self._remove_layer)
-            layer.load_from_dict(layer_data)
-            self.layers.append(layer)
-            self.layers_layout.addWidget(layer)
-
-        self._refresh()
+        self.load_project(data)
+
+    def load_project(self, data: dict) -> None:
+        """Herstel Ri, Re en lagen uit een ``.uwr``-dict met één refresh."""
+        with self.bulk_update():
+            if data.get("ri"):
+                idx = self.ri_dd.findText(data["ri"])
+                if idx >= 0:
+                    self.ri_dd.setCurrentIndex(idx)
+            if data.get("re"):
+                idx = self.re_dd.findText(data["re"])
+                if idx >= 0:
+                    self.re_dd.setCurrentIndex(idx)
+            self.set_layers(data.get("lagen", []))
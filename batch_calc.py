@@ -0,0 +1,396 @@
+"""batch_calc.py – Headless batch calculator (no Qt, no notebook).
+
+Reads constructions and correctiefactor scenarios and writes one result per
+input record, streaming, so memory use does not grow with the input size::
+
+    python -m batch_calc elementen.jsonl -o resultaten.jsonl
+    python -m batch_calc lagen.csv scenarios.csv --format csv > resultaten.csv
+    python -m batch_calc gevel.uwr kelder.cfr
+
+Input records
+-------------
+* **Constructie** – a ``.uwr`` dict: ``{"ri": …, "re": …, "lagen": [...]}``.
+  ``ri`` / ``re`` are a :data:`heat_calc.SURFACE_R` label or a number.
+* **Scenario** – a ``.cfr`` dict with a ``"scenario"`` key (see
+  :mod:`fk_scenarios`).
+
+Either may carry an ``"id"`` that is copied to the output; otherwise the
+record number is used.  ``.jsonl`` (and stdin) hold one record per line,
+``.uwr`` / ``.cfr`` / ``.json`` one record (or a list of records).  In a
+``.csv`` file with a ``scenario`` column every row is a scenario; otherwise
+every row is a layer (``id, modus, categorie, materiaal, subtype, dikte,
+handmatige_r, ri, re``) and consecutive rows with the same ``id`` form one
+construction.
+
+Records that cannot be evaluated produce an ``error`` result; the exit status
+is then 1.
+
+Large batches can be spread over several processes (``--workers``, ``-j 0``
+for all cores); each worker compiles the reference tables once at start-up
+and receives the records in chunks (``--chunk-size``).  Output keeps the input
+order unless ``--unordered`` is given; ``--stats`` reports the throughput.
+
+With ``"instrumentation": true`` in the preferences file (``app/config.py``,
+``--config``) the calculation functions are timed, in the workers too, and
+the counters are written to ``instrumentation_file`` when the run ends.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Iterable, Iterator, Mapping, NamedTuple, Optional, TextIO
+
+import instrumentation
+from app.config import Config
+from fk_scenarios import DEFAULT_STATE, evaluate_state
+from heat_calc import DEFAULT_RE, DEFAULT_RI, surface_r
+from r_cache import get_r_cache
+
+KIND_CONSTRUCTION = "constructie"
+KIND_SCENARIO = "scenario"
+
+CSV_COLUMNS = ["id", "type", "scenario", "rc", "u", "f_k", "f_ia_k", "f_ig_k", "f_gw", "error"]
+LAYER_COLUMNS = ("modus", "categorie", "materiaal", "subtype", "dikte", "handmatige_r")
+
+DEFAULT_CHUNK_SIZE = 1000
+
+_JSON_DOC_EXTENSIONS = (".uwr", ".cfr", ".json")
+_TRUE = {"1", "true", "ja", "yes", "waar"}
+
+
+# ── Input ─────────────────────────────────────────────────────────────────────
+
+
+def _iter_jsonl(fh: TextIO) -> Iterator[Any]:
+    for line in fh:
+        line = line.strip()
+        if line:
+            try:
+                yield json.loads(line)
+            except ValueError as exc:  # one bad line must not end the stream
+                yield exc
+
+
+def _iter_json_doc(fh: TextIO) -> Iterator[Any]:
+    data = json.load(fh)
+    yield from (data if isinstance(data, list) else [data])
+
+
+def _csv_value(key: str, text: str) -> Any:
+    default = DEFAULT_STATE.get(key)
+    if isinstance(default, bool):
+        return text.strip().lower() in _TRUE
+    if isinstance(default, int):
+        return int(text)
+    if isinstance(default, float):
+        return float(text)
+    return text
+
+
+def _iter_csv(fh: TextIO) -> Iterator[Any]:
+    # Values are converted per record: a bad value yields that record's
+    # exception (like a bad JSONL line) and the rest of the file still follows.
+    reader = csv.DictReader(fh)
+    if "scenario" in (reader.fieldnames or ()):
+        for row in reader:
+            try:
+                yield {k: _csv_value(k, v) for k, v in row.items() if k and v not in (None, "")}
+            except ValueError as exc:
+                yield exc
+        return
+
+    for key, rows in itertools.groupby(reader, key=lambda row: row.get("id")):
+        rows = list(rows)
+        try:
+            record: dict[str, Any] = {"lagen": [_csv_layer(row) for row in rows]}
+        except ValueError as exc:
+            yield exc
+            continue
+        if key not in (None, ""):
+            record["id"] = key
+        for side in ("ri", "re"):
+            if rows[0].get(side):
+                record[side] = rows[0][side]
+        yield record
+
+
+def _csv_layer(row: Mapping[str, str]) -> dict[str, Any]:
+    layer: dict[str, Any] = {k: row[k] for k in LAYER_COLUMNS if row.get(k)}
+    layer.setdefault("modus", "Materiaallijst")
+    for k in ("dikte", "handmatige_r"):
+        if k in layer:
+            layer[k] = float(layer[k])
+    return layer
+
+
+def iter_records(source: str, fh: TextIO) -> Iterator[Any]:
+    """Yield the input records of one file; the format follows its extension."""
+    ext = os.path.splitext(source)[1].lower()
+    if ext == ".csv":
+        return _iter_csv(fh)
+    if ext in _JSON_DOC_EXTENSIONS:
+        return _iter_json_doc(fh)
+    return _iter_jsonl(fh)
+
+
+# ── Evaluation ────────────────────────────────────────────────────────────────
+
+
+def evaluate_record(record: Any) -> dict[str, Any]:
+    """Evaluate one construction or scenario record (without ``id``)."""
+    if isinstance(record, Exception):
+        raise record
+    if not isinstance(record, Mapping):
+        raise ValueError("Record is not a JSON object")
+    if "lagen" in record:
+        rc, u = get_r_cache().construction(
+            record["lagen"],
+            surface_r(record.get("ri"), DEFAULT_RI),
+            surface_r(record.get("re"), DEFAULT_RE),
+        )
+        return {"type": KIND_CONSTRUCTION, "rc": rc, "u": u}
+    if "scenario" in record:
+        result: dict[str, Any] = {"type": KIND_SCENARIO, "scenario": record["scenario"]}
+        result.update((f.key, f.value) for f in evaluate_state(record))
+        return result
+    raise ValueError("Record has neither 'lagen' nor 'scenario'")
+
+
+def evaluate_item(default_id: Any, record: Any) -> dict[str, Any]:
+    """Evaluate one record; a failure becomes ``{"id", "error"}``."""
+    rid = record.get("id", default_id) if isinstance(record, Mapping) else default_id
+    try:
+        result = evaluate_record(record)
+    except Exception as exc:  # report and continue with the next record
+        return {"id": rid, "error": f"{type(exc).__name__}: {exc}"}
+    return {"id": rid, **result}
+
+
+def evaluate_records(records: Iterable[Any], start: int = 1) -> Iterator[dict[str, Any]]:
+    """Yield one result per record, numbering records from *start*."""
+    for n, record in enumerate(records, start):
+        yield evaluate_item(n, record)
+
+
+# ── Parallel execution ────────────────────────────────────────────────────────
+
+Item = tuple[Any, Any]  # (default id, record)
+
+
+def _init_worker(instrument: bool = False) -> None:
+    # Compile every reference table once per worker process, not per chunk.
+    from material_catalogue import get_catalogue
+    from table_registry import get_registry
+
+    get_registry().load_all()
+    get_catalogue()
+    if instrument:
+        instrumentation.enable()
+
+
+def _evaluate_chunk(chunk: list[Item]) -> tuple[list[dict[str, Any]], Optional[dict]]:
+    """Evaluate a chunk; also hand back (and clear) the worker's timing counters."""
+    results = [evaluate_item(default_id, record) for default_id, record in chunk]
+    if not instrumentation.is_enabled():
+        return results, None
+    state = instrumentation.export_state()
+    instrumentation.reset()
+    return results, state
+
+
+def evaluate_parallel(
+    items: Iterable[Item],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ordered: bool = True,
+) -> Iterator[dict[str, Any]]:
+    """Evaluate ``(default id, record)`` pairs on a process pool.
+
+    *items* is consumed in chunks of *chunk_size*; at most two chunks per
+    worker are in flight, so memory stays bounded for any input length.
+    With ``ordered=False`` chunks are yielded as soon as they complete.
+    *workers* defaults to ``os.cpu_count()``.  When instrumentation is
+    enabled here, the workers' counters are merged into this process.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, not {chunk_size!r}")
+    workers = workers or os.cpu_count() or 1
+    items = iter(items)
+    chunks = iter(lambda: list(itertools.islice(items, chunk_size)), [])
+    max_pending = 2 * workers
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(instrumentation.is_enabled(),)
+    ) as pool:
+        pending: deque[Future] = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_evaluate_chunk, chunk))
+            while len(pending) >= max_pending:
+                yield from _next_done(pending, ordered)
+        while pending:
+            yield from _next_done(pending, ordered)
+
+
+def _next_done(pending: deque[Future], ordered: bool) -> list[dict[str, Any]]:
+    if ordered:
+        future = pending.popleft()
+    else:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        future = next(iter(done))
+        pending.remove(future)
+    results, state = future.result()
+    if state:
+        instrumentation.merge_state(state)
+    return results
+
+
+class BatchStats(NamedTuple):
+    records: int
+    errors: int
+    seconds: float
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.records} records ({self.errors} fouten) in {self.seconds:.2f} s"
+            f" – {self.records_per_second:,.0f} records/s"
+        )
+
+
+# ── Output ────────────────────────────────────────────────────────────────────
+
+
+class _JsonlWriter:
+    def __init__(self, fh: TextIO) -> None:
+        self.fh = fh
+
+    def write(self, result: Mapping[str, Any]) -> None:
+        self.fh.write(json.dumps(result, ensure_ascii=False) + "\n")
+
+
+class _CsvWriter:
+    def __init__(self, fh: TextIO) -> None:
+        self.writer = csv.DictWriter(fh, CSV_COLUMNS, extrasaction="ignore", lineterminator="\n")
+        self.writer.writeheader()
+
+    def write(self, result: Mapping[str, Any]) -> None:
+        self.writer.writerow(result)
+
+
+def _items(sources: Iterable[str]) -> Iterator[Item]:
+    """Number the records of all *sources*; an unreadable file yields one item."""
+    n = 0
+    for source in sources:
+        if source == "-":
+            fh, close = sys.stdin, False
+        else:
+            fh, close = open(source, "r", encoding="utf-8", newline=""), True
+        try:
+            for record in iter_records(source, fh):
+                n += 1
+                yield n, record
+        except (ValueError, csv.Error) as exc:  # unreadable input file
+            yield source, exc
+        finally:
+            if close:
+                fh.close()
+
+
+def run(
+    sources: Iterable[str],
+    out: TextIO,
+    fmt: str = "jsonl",
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ordered: bool = True,
+) -> BatchStats:
+    """Stream all *sources* (``"-"`` is stdin) to *out*.
+
+    With ``workers > 1`` the records are evaluated by :func:`evaluate_parallel`.
+    """
+    writer = _CsvWriter(out) if fmt == "csv" else _JsonlWriter(out)
+    items = _items(sources)
+    if workers > 1:
+        results = evaluate_parallel(items, workers, chunk_size, ordered)
+    else:
+        results = (evaluate_item(default_id, record) for default_id, record in items)
+
+    start = time.perf_counter()
+    count = errors = 0
+    for result in results:
+        writer.write(result)
+        count += 1
+        errors += "error" in result
+    return BatchStats(count, errors, time.perf_counter() - start)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m batch_calc",
+        description="Bereken Rc/U van constructies en correctiefactoren zonder GUI.",
+    )
+    parser.add_argument(
+        "inputs", nargs="*", default=["-"],
+        help="JSONL-, CSV-, .uwr- of .cfr-bestanden ('-' = stdin, standaard)",
+    )
+    parser.add_argument("-o", "--output", help="uitvoerbestand (standaard stdout)")
+    parser.add_argument(
+        "-f", "--format", choices=("jsonl", "csv"), default=None,
+        help="uitvoerformaat (standaard afgeleid van --output, anders jsonl)",
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=1,
+        help="aantal rekenprocessen (0 = alle cores, standaard 1)",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+        help=f"records per taak bij --workers (standaard {DEFAULT_CHUNK_SIZE})",
+    )
+    parser.add_argument(
+        "--unordered", action="store_true",
+        help="resultaten schrijven zodra ze klaar zijn (volgorde kan afwijken)",
+    )
+    parser.add_argument(
+        "--stats", action="store_true", help="doorvoer rapporteren op stderr",
+    )
+    parser.add_argument(
+        "--config", metavar="PAD",
+        help="voorkeurenbestand voor o.a. instrumentation (standaard user_preferences.json)",
+    )
+    args = parser.parse_args(argv)
+    if args.workers < 0 or args.chunk_size < 1:
+        parser.error("--workers moet ≥ 0 en --chunk-size ≥ 1 zijn")
+    workers = args.workers or os.cpu_count() or 1
+
+    fmt = args.format
+    if fmt is None:
+        fmt = "csv" if (args.output or "").lower().endswith(".csv") else "jsonl"
+
+    config = Config(args.config) if args.config else Config()
+    config.apply_instrumentation()
+
+    options = dict(workers=workers, chunk_size=args.chunk_size, ordered=not args.unordered)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as out:
+            stats = run(args.inputs, out, fmt, **options)
+    else:
+        stats = run(args.inputs, sys.stdout, fmt, **options)
+    if args.stats:
+        print(stats, file=sys.stderr)
+    config.dump_instrumentation()
+    return 1 if stats.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
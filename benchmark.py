@@ -0,0 +1,259 @@
+"""benchmark.py – Performance baseline for the fk_calc and heat_calc hot paths.
+
+Times every ``fk_calc.calc_*`` function, the table look-ups and a headless
+U-value evaluation (:func:`heat_calc.pack_constructions` +
+:func:`heat_calc.u_value_batch`) over generated stacks of 1–200 layers at
+several batch sizes, and compares the result with a stored baseline::
+
+    python benchmark.py                         # run and print
+    python benchmark.py -o resultaat.json       # also save the results
+    python benchmark.py --compare               # vs. benchmark_baseline.json
+    python benchmark.py --save-baseline         # overwrite the baseline
+    python benchmark.py -k u_value --quick      # subset, shorter runs
+
+Each case reports the best of *repeat* runs in µs per operation (one call, or
+one construction for the U-value cases).  ``--compare`` exits with status 1
+when a case is more than ``--threshold`` (default 25 %) slower than the
+baseline.  Timings depend on the machine: record the baseline on the machine
+that runs the nightly batch.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Any, Callable, Iterator, Mapping, NamedTuple, Optional
+
+import numpy as np
+
+import fk_calc
+from heat_calc import LAYER_LAMBDA, pack_constructions, u_value_batch
+from material_catalogue import get_catalogue
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_REPEAT = 5
+DEFAULT_MIN_TIME = 0.05      # seconds per timed run
+
+LAYER_COUNTS = (1, 10, 50, 200)
+BATCH_SIZES = (1, 100, 1000)
+
+# (name, function, kwargs) – one representative call per fk_calc function
+FK_CASES: list[tuple[str, str, dict[str, Any]]] = [
+    ("get_delta_theta", "get_delta_theta", {"heating_system_id": "radiatoren_lt"}),
+    ("get_theta_i", "get_theta_i", {"room_type_id": "verblijfsruimte"}),
+    ("calc_u_equiv_k", "calc_u_equiv_k", {"r_c": 3.0}),
+    ("calc_f_k_buitenlucht", "calc_f_k_buitenlucht",
+     {"bouwdeel": "plat_dak", "theta_i": 20.0, "theta_e": -10.0,
+      "heating_system_id": "radiatoren_lt"}),
+    ("calc_f_ia_k_aangrenzend_gebouw", "calc_f_ia_k_aangrenzend_gebouw",
+     {"bouwdeel": "vloer", "theta_i": 20.0, "theta_e": -10.0, "theta_b": 15.0,
+      "heating_system_id": "radiatoren_lt"}),
+    ("calc_f_ia_k_verwarmde_ruimte", "calc_f_ia_k_verwarmde_ruimte",
+     {"bouwdeel": "vloer", "theta_i": 20.0, "theta_e": -10.0, "theta_a": 18.0,
+      "heating_system_id_own": "radiatoren_lt", "heating_system_id_adjacent": "radiatoren_lt"}),
+    ("calc_f_k_onverwarmd_bekend", "calc_f_k_onverwarmd_bekend",
+     {"bouwdeel": "wand", "theta_i": 20.0, "theta_e": -10.0, "theta_a": 5.0}),
+    ("calc_f_k_onverwarmd_onbekend_warmteverlies", "calc_f_k_onverwarmd_onbekend_warmteverlies",
+     {"ruimte_type": "kruipruimte", "openingsgrootte_mm2_per_m2": 800.0}),
+    ("calc_f_k_onverwarmd_onbekend_tijdconstante", "calc_f_k_onverwarmd_onbekend_tijdconstante",
+     {"aangrenzende_ruimte": "kelder"}),
+    ("calc_f_gw", "calc_f_gw", {"grondwaterdiepte_m": 0.5}),
+    ("calc_f_ig_k", "calc_f_ig_k",
+     {"bouwdeel": "vloer", "theta_i": 20.0, "theta_e": -10.0,
+      "heating_system_id": "radiatoren_lt"}),
+    ("calc_h_t_ig", "calc_h_t_ig", {"area": 50.0, "r_c": 3.5, "f_ig_k": 0.4, "f_gw": 1.15}),
+]
+
+
+class Case(NamedTuple):
+    name: str
+    setup: Callable[[], Callable[[], Any]]   # returns the function to time
+    ops: int                                 # operations per call
+
+
+class Result(NamedTuple):
+    us_per_op: float
+    ops: int
+    loops: int
+    repeat: int
+
+
+def generate_stacks(layers: int, batch: int, seed: int = 0) -> list[list[dict]]:
+    """Return *batch* random constructions of *layers* λ-material layers each."""
+    catalogue = get_catalogue()
+    paths = [catalogue.paths[i] for i in np.flatnonzero(catalogue.kinds == LAYER_LAMBDA)]
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(len(paths), size=(batch, layers))
+    thickness = rng.integers(1, 31, size=(batch, layers)) / 100.0
+    return [
+        [
+            {"modus": "Materiaallijst", "categorie": paths[p][0], "materiaal": paths[p][1],
+             "subtype": paths[p][2], "dikte": float(d)}
+            for p, d in zip(row_p, row_d)
+        ]
+        for row_p, row_d in zip(picks, thickness)
+    ]
+
+
+def _fk_setup(func: str, kwargs: dict[str, Any]) -> Callable[[], Callable[[], Any]]:
+    def setup() -> Callable[[], Any]:
+        fn = getattr(fk_calc, func)
+        fn(**kwargs)   # compile the tables outside the timing
+        return lambda: fn(**kwargs)
+
+    return setup
+
+
+def _u_value_setup(layers: int, batch: int) -> Callable[[], Callable[[], Any]]:
+    def setup() -> Callable[[], Any]:
+        catalogue = get_catalogue()
+        constructions = generate_stacks(layers, batch)
+        return lambda: u_value_batch(*pack_constructions(catalogue, constructions))
+
+    return setup
+
+
+def cases() -> Iterator[Case]:
+    """All benchmark cases, fk_calc first."""
+    for name, func, kwargs in FK_CASES:
+        yield Case(f"fk_calc.{name}", _fk_setup(func, kwargs), 1)
+    for layers in LAYER_COUNTS:
+        for batch in BATCH_SIZES:
+            yield Case(f"heat_calc.u_value[L={layers},M={batch}]", _u_value_setup(layers, batch), batch)
+
+
+def time_case(
+    case: Case, repeat: int = DEFAULT_REPEAT, min_time: float = DEFAULT_MIN_TIME
+) -> Result:
+    """Best-of-*repeat* time per operation; each run lasts at least *min_time*."""
+    fn = case.setup()
+
+    def run(loops: int) -> float:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        return time.perf_counter() - start
+
+    loops = 1
+    elapsed = run(loops)
+    while elapsed < min_time:
+        loops = max(2 * loops, int(loops * 1.2 * min_time / max(elapsed, 1e-9)))
+        elapsed = run(loops)
+    best = min([elapsed] + [run(loops) for _ in range(repeat - 1)])
+    return Result(best / loops / case.ops * 1e6, case.ops, loops, repeat)
+
+
+def run_benchmarks(
+    pattern: Optional[str] = None,
+    repeat: int = DEFAULT_REPEAT,
+    min_time: float = DEFAULT_MIN_TIME,
+    progress: Optional[Callable[[str, Result], None]] = None,
+) -> dict[str, Any]:
+    """Run all cases whose name contains *pattern*; return a JSON-ready report."""
+    results: dict[str, dict[str, Any]] = {}
+    for case in cases():
+        if pattern and pattern not in case.name:
+            continue
+        result = time_case(case, repeat, min_time)
+        results[case.name] = result._asdict()
+        if progress:
+            progress(case.name, result)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+class Comparison(NamedTuple):
+    name: str
+    baseline_us: float
+    current_us: float
+    ratio: float
+    regression: bool
+
+
+def compare(
+    current: Mapping[str, Any], baseline: Mapping[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> list[Comparison]:
+    """Compare two reports case by case (cases missing from either are skipped)."""
+    base = baseline["results"]
+    out = []
+    for name, result in current["results"].items():
+        if name not in base:
+            continue
+        b, c = base[name]["us_per_op"], result["us_per_op"]
+        ratio = c / b if b > 0 else float("inf")
+        out.append(Comparison(name, b, c, ratio, ratio > 1.0 + threshold))
+    return out
+
+
+def load_report(path: str) -> dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def save_report(report: Mapping[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+        fh.write("\n")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python benchmark.py",
+        description="Meet de rekenkern (fk_calc, heat_calc) en vergelijk met een baseline.",
+    )
+    parser.add_argument("-k", dest="pattern", help="alleen cases waarvan de naam dit bevat")
+    parser.add_argument("-o", "--output", help="resultaten opslaan als JSON")
+    parser.add_argument(
+        "--compare", nargs="?", const=BASELINE_PATH, metavar="BASELINE",
+        help="vergelijk met een baseline (standaard benchmark_baseline.json)",
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help=f"toegestane vertraging t.o.v. de baseline (standaard {DEFAULT_THRESHOLD:.0%})",
+    )
+    parser.add_argument("--save-baseline", action="store_true", help="overschrijf benchmark_baseline.json")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="herhalingen per case")
+    parser.add_argument("--quick", action="store_true", help="kortere metingen (minder nauwkeurig)")
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat moet ≥ 1 zijn")
+
+    def progress(name: str, result: Result) -> None:
+        print(f"{name:<58} {result.us_per_op:>12.3f} µs/op", file=sys.stderr)
+
+    report = run_benchmarks(
+        args.pattern, args.repeat, DEFAULT_MIN_TIME / 4 if args.quick else DEFAULT_MIN_TIME, progress
+    )
+    if args.output:
+        save_report(report, args.output)
+    if args.save_baseline:
+        save_report(report, BASELINE_PATH)
+
+    if not args.compare:
+        return 0
+    rows = compare(report, load_report(args.compare), args.threshold)
+    regressions = [row for row in rows if row.regression]
+    print(f"\n{'case':<58} {'baseline':>10} {'nu':>10} {'factor':>7}")
+    for row in rows:
+        flag = "  TRAGER" if row.regression else ""
+        print(f"{row.name:<58} {row.baseline_us:>10.3f} {row.current_us:>10.3f} {row.ratio:>7.2f}{flag}")
+    print(f"\n{len(regressions)} van {len(rows)} cases meer dan {args.threshold:.0%} trager")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
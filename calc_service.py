@@ -0,0 +1,372 @@
+"""calc_service.py – Local HTTP/JSON calculation service (asyncio, stdlib only).
+
+Start with::
+
+    python -m calc_service --port 8765
+
+Endpoints (request and response bodies are JSON):
+
+  POST /u-value        ``.uwr`` dict (``ri``, ``re``, ``lagen``) → ``{"rc", "u"}``
+  POST /scenario       ``.cfr`` dict → ``{"f_k": …}`` (see :mod:`fk_scenarios`)
+  POST /fk/<name>      keyword arguments of ``fk_calc.<name>`` → ``{"value"}``,
+                       e.g. ``/fk/calc_f_k_buitenlucht``
+  GET  /health         ``{"status": "ok"}``
+  GET  /stats          requests and batches per endpoint
+
+Requests for the same endpoint that arrive within ``--window`` seconds are
+coalesced by a :class:`Coalescer` into one batch: U-values go through
+:func:`heat_calc.u_value_batch`, ``fk_calc`` functions with a ``*_batch``
+variant through that variant.  Batches run on an executor (threads, or
+processes with ``--executor process``) so the event loop keeps accepting
+connections.  Invalid input gives status 400, an unknown path 404 and a
+calculation error 422 with ``{"error": "…"}``.
+
+``loadgen.py`` drives the service on localhost and reports latencies.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Mapping, Optional
+
+import fk_calc
+from fk_scenarios import evaluate_state
+from heat_calc import DEFAULT_RE, DEFAULT_RI, pack_constructions, surface_r, u_value_batch
+from material_catalogue import get_catalogue
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_WINDOW = 0.002  # s
+DEFAULT_MAX_BATCH = 1024
+MAX_BODY = 1 << 20
+
+# Batch functions return one ``(ok, payload)`` per item: the result, or the
+# error message.  They are module-level so a process pool can pickle them.
+Outcome = tuple[bool, Any]
+
+
+class RequestError(Exception):
+    """Client error with an HTTP status."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+# ── Batch functions ──────────────────────────────────────────────────────────
+
+
+def _error(exc: Exception) -> Outcome:
+    return False, f"{type(exc).__name__}: {exc}"
+
+
+def _one_by_one(fn: Callable[[Any], Any], items: list) -> list[Outcome]:
+    outcomes = []
+    for item in items:
+        try:
+            outcomes.append((True, fn(item)))
+        except Exception as exc:
+            outcomes.append(_error(exc))
+    return outcomes
+
+
+def _finite(x: float) -> Optional[float]:
+    return float(x) if math.isfinite(x) else None
+
+
+def u_value_items(records: list[Mapping[str, Any]]) -> list[Outcome]:
+    """Evaluate ``.uwr`` dicts with one vectorised :func:`u_value_batch` call."""
+    try:
+        return _u_value_batch(records)
+    except Exception as exc:  # isolate the offending record(s)
+        if len(records) == 1:
+            return [_error(exc)]
+        return [u_value_items([r])[0] for r in records]
+
+
+def _u_value_batch(records: list[Mapping[str, Any]]) -> list[Outcome]:
+    for r in records:
+        if not isinstance(r.get("lagen"), list):
+            raise ValueError("'lagen' must be a list of layers")
+    ri = [surface_r(r.get("ri"), DEFAULT_RI) for r in records]
+    re = [surface_r(r.get("re"), DEFAULT_RE) for r in records]
+    values, thickness, kinds = pack_constructions(get_catalogue(), [r["lagen"] for r in records])
+    rc, u = u_value_batch(values, thickness, kinds, ri=ri, re=re)
+    return [(True, {"rc": float(a), "u": _finite(b)}) for a, b in zip(rc, u)]
+
+
+def scenario_items(states: list[Mapping[str, Any]]) -> list[Outcome]:
+    return _one_by_one(lambda s: {f.key: f.value for f in evaluate_state(s)}, states)
+
+
+def fk_items(name: str, kwargs_list: list[Mapping[str, Any]]) -> list[Outcome]:
+    """Evaluate ``fk_calc.<name>(**kwargs)`` for every item.
+
+    Items with the same keywords go through ``fk_calc.<name>_batch`` when it
+    exists; rows the batch flags (error code, NaN) are recomputed with the
+    scalar function, which also yields the proper error message.
+    """
+    scalar = getattr(fk_calc, name)
+    outcomes: list[Optional[Outcome]] = [None] * len(kwargs_list)
+    batch_fn = getattr(fk_calc, f"{name}_batch", None)
+
+    if batch_fn is not None:
+        groups: dict[tuple[str, ...], list[int]] = {}
+        for i, kw in enumerate(kwargs_list):
+            groups.setdefault(tuple(sorted(kw)), []).append(i)
+        for keys, rows in groups.items():
+            if len(rows) < 2:
+                continue
+            try:
+                values, errors = batch_fn(**{k: [kwargs_list[i][k] for i in rows] for k in keys})
+            except Exception:
+                continue  # fall back to the scalar function below
+            for i, value, err in zip(rows, values.tolist(), errors.tolist()):
+                if err == fk_calc.ERR_OK and math.isfinite(value):
+                    outcomes[i] = (True, {"value": value})
+
+    todo = [i for i, o in enumerate(outcomes) if o is None]
+    for i, outcome in zip(todo, _one_by_one(lambda kw: {"value": scalar(**kw)},
+                                             [kwargs_list[i] for i in todo])):
+        outcomes[i] = outcome
+    return outcomes
+
+
+def fk_functions() -> list[str]:
+    """Names of the ``fk_calc`` functions exposed under ``/fk/<name>``."""
+    return sorted(n for n in dir(fk_calc) if n.startswith("calc_") and callable(getattr(fk_calc, n)))
+
+
+# ── Coalescing ───────────────────────────────────────────────────────────────
+
+
+class Coalescer:
+    """Collect concurrent submissions into batches for *batch_fn*.
+
+    The first item opens a window of *window* seconds (or until *max_batch*
+    items are queued); the whole batch then runs on *executor*.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list], list[Outcome]],
+        executor: Optional[Executor] = None,
+        window: float = DEFAULT_WINDOW,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ) -> None:
+        self.batch_fn = batch_fn
+        self.executor = executor
+        self.window = window
+        self.max_batch = max_batch
+        self.requests = 0
+        self.batches = 0
+        self._items: list = []
+        self._futures: list[asyncio.Future] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Running batches; the loop keeps only weak references to tasks
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, item: Any) -> Outcome:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._items.append(item)
+        self._futures.append(future)
+        self.requests += 1
+        if len(self._items) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        items, futures = self._items, self._futures
+        self._items, self._futures = [], []
+        if items:
+            self.batches += 1
+            task = asyncio.ensure_future(self._run(items, futures))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, items: list, futures: list[asyncio.Future]) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            outcomes = await loop.run_in_executor(self.executor, self.batch_fn, items)
+        except Exception as exc:
+            outcomes = [_error(exc)] * len(items)
+        for future, outcome in zip(futures, outcomes):
+            if not future.done():
+                future.set_result(outcome)
+
+
+# ── HTTP ─────────────────────────────────────────────────────────────────────
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 422: "Unprocessable Entity"}
+
+
+class CalcService:
+    """The HTTP front-end; one :class:`Coalescer` per endpoint / function."""
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        window: float = DEFAULT_WINDOW,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ) -> None:
+        self.executor = executor
+        self.window = window
+        self.max_batch = max_batch
+        self._fk_names = set(fk_functions())
+        self.coalescers: dict[str, Coalescer] = {
+            "/u-value": self._coalescer(u_value_items),
+            "/scenario": self._coalescer(scenario_items),
+        }
+
+    def _coalescer(self, batch_fn: Callable[[list], list[Outcome]]) -> Coalescer:
+        return Coalescer(batch_fn, self.executor, self.window, self.max_batch)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            path: {"requests": c.requests, "batches": c.batches}
+            for path, c in self.coalescers.items()
+        }
+
+    async def dispatch(self, method: str, path: str, body: bytes) -> tuple[int, Any]:
+        if method == "GET":
+            if path == "/health":
+                return 200, {"status": "ok"}
+            if path == "/stats":
+                return 200, self.stats()
+            raise RequestError(404, f"Unknown path {path!r}")
+        if method != "POST":
+            raise RequestError(405, f"Method {method} not allowed")
+
+        coalescer = self.coalescers.get(path)
+        if coalescer is None and path.startswith("/fk/"):
+            name = path[len("/fk/"):]
+            if name not in self._fk_names:
+                raise RequestError(404, f"Unknown fk_calc function {name!r}")
+            coalescer = self.coalescers[path] = self._coalescer(partial(fk_items, name))
+        if coalescer is None:
+            raise RequestError(404, f"Unknown path {path!r}")
+
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError as exc:
+            raise RequestError(400, f"Invalid JSON: {exc}") from None
+        if not isinstance(payload, dict):
+            raise RequestError(400, "Request body must be a JSON object")
+
+        ok, result = await coalescer.submit(payload)
+        return (200, result) if ok else (422, {"error": result})
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, version = request_line.decode("latin-1").split(maxsplit=2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                keep_alive = headers.get("connection", "").lower() != "close" and (
+                    version.strip().upper() == "HTTP/1.1"
+                )
+                try:
+                    if length > MAX_BODY:
+                        raise RequestError(413, "Request body too large")
+                    body = await reader.readexactly(length) if length else b""
+                    status, result = await self.dispatch(method.upper(), path, body)
+                except RequestError as exc:
+                    status, result = exc.status, {"error": str(exc)}
+                    keep_alive = keep_alive and status != 413
+
+                data = json.dumps(result, ensure_ascii=False).encode("utf-8")
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                        "Content-Type: application/json; charset=utf-8\r\n"
+                        f"Content-Length: {len(data)}\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                    ).encode("latin-1")
+                    + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass  # malformed request or client went away
+        finally:
+            writer.close()
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self.handle, host, port)
+
+
+def _warm_up() -> None:
+    # Compile tables and the material catalogue before the first request.
+    from table_registry import get_registry
+
+    get_registry().load_all()
+    get_catalogue()
+
+
+def make_executor(kind: str, workers: Optional[int] = None) -> Executor:
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=workers, initializer=_warm_up)
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="calc")
+
+
+async def serve(host: str, port: int, service: CalcService) -> None:
+    server = await service.start(host, port)
+    addr = ", ".join(str(s.getsockname()) for s in server.sockets)
+    print(f"calc_service luistert op {addr}", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m calc_service", description="Lokale HTTP/JSON rekenservice."
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--window", type=float, default=DEFAULT_WINDOW,
+        help=f"bundelvenster in seconden (standaard {DEFAULT_WINDOW})",
+    )
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH)
+    parser.add_argument("--executor", choices=("thread", "process"), default="thread")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    _warm_up()
+    executor = make_executor(args.executor, args.workers)
+    service = CalcService(executor, args.window, args.max_batch)
+    try:
+        asyncio.run(serve(args.host, args.port, service))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        executor.shutdown(cancel_futures=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
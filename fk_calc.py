@@ -6,56 +6,51 @@ Implements the decision process and formulas from fk_berekening.md:
   f_ia,k   – adjacent building or heated space (same dwelling)
   f_ig,k   – ground contact (with groundwater factor f_gw)
 
-All reference data is loaded from the JSON files in the ``tables/`` folder.
+Every temperature-based ``calc_*`` function has a ``*_batch`` variant that
+accepts NumPy arrays and returns ``(f, err)`` arrays instead of raising per
+row.  They live in :mod:`fk_calc_batch` and are re-exported here on first
+access, so scripts that only need scalar formulas never import NumPy.
+
+All reference data comes from the JSON files in the ``tables/`` folder,
+compiled into O(1) indexes by :mod:`table_registry`.
 """
 
 from __future__ import annotations
 
-import json
-import os
-import sys
+import math
 from typing import Optional
 
-# ── Table loading ─────────────────────────────────────────────────────────────
+from table_registry import get_registry
 
-_BASE_DIR = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
-_TABLES_DIR = os.path.join(_BASE_DIR, "tables")
+# ── Table loading ─────────────────────────────────────────────────────────────
 
+# Tables are compiled lazily on first use; importing this module reads no files.
+_tables = get_registry()
 
-def _load_json(filename: str) -> dict:
-    with open(os.path.join(_TABLES_DIR, filename), "r", encoding="utf-8") as fh:
-        return json.load(fh)
+# ── Constants ─────────────────────────────────────────────────────────────────
 
+# DEFAULT_THETA_E / DEFAULT_THETA_ME come from tabel_binnentemperaturen.json and
+# are resolved on first access (see __getattr__).  Functions that default to
+# them take ``None`` and substitute the table value.
+_LAZY_CONSTANTS = {"DEFAULT_THETA_E": "theta_e", "DEFAULT_THETA_ME": "theta_me"}
 
-_tabel_2_12: dict = _load_json("tabel_2_12.json")
-_tabel_2_13: dict = _load_json("tabel_2_13.json")
-_tabel_2_3: dict = _load_json("tabel_2_3.json")
-_tabel_binnentemperaturen: dict = _load_json("tabel_binnentemperaturen.json")
-_tabel_f_gw: dict = _load_json("tabel_f_gw.json")
-_tabel_u_equiv_k: dict = _load_json("tabel_u_equiv_k.json")
 
-# ── Constants ─────────────────────────────────────────────────────────────────
+def __getattr__(name: str):
+    if name in _LAZY_CONSTANTS:
+        return getattr(_tables, _LAZY_CONSTANTS[name])
+    if name.endswith("_batch") or name.startswith("ERR_") or name == "BATCH_ERRORS":
+        import fk_calc_batch
 
-DEFAULT_THETA_E: float = _tabel_binnentemperaturen["standaard_nl"]["theta_e_C"]
-DEFAULT_THETA_ME: float = _tabel_binnentemperaturen["standaard_nl"]["theta_me_C"]
+        if hasattr(fk_calc_batch, name):
+            return getattr(fk_calc_batch, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ── Helper: heating-system delta-theta lookup ─────────────────────────────────
 
 
 def list_heating_systems() -> list[dict]:
     """Return a flat list of all heating systems with id, description, Δθ₁, Δθ₂."""
-    systems: list[dict] = []
-    for cat in _tabel_2_12["categorieen"]:
-        for s in cat["systemen"]:
-            systems.append(
-                {
-                    "id": s["id"],
-                    "omschrijving": s["omschrijving"],
-                    "delta_theta_1": s["delta_theta_1_K"],
-                    "delta_theta_2": s["delta_theta_2_K"],
-                }
-            )
-    return systems
+    return [dict(s) for s in _tables.heating_systems]
 
 
 def get_delta_theta(heating_system_id: str) -> tuple[float, float]:
@@ -63,11 +58,10 @@ def get_delta_theta(heating_system_id: str) -> tuple[float, float]:
 
     Raises ``ValueError`` when the id is not found.
     """
-    for cat in _tabel_2_12["categorieen"]:
-        for s in cat["systemen"]:
-            if s["id"] == heating_system_id:
-                return (s["delta_theta_1_K"], s["delta_theta_2_K"])
-    raise ValueError(f"Unknown heating system id: {heating_system_id!r}")
+    try:
+        return _tables.delta_theta[heating_system_id]
+    except KeyError:
+        raise ValueError(f"Unknown heating system id: {heating_system_id!r}") from None
 
 
 # ── Helper: indoor design-temperature lookup ──────────────────────────────────
@@ -77,8 +71,7 @@ def list_room_types(
     building_type: str = "woonfunctie",
 ) -> list[dict]:
     """Return the room-type entries for a building category."""
-    data = _tabel_binnentemperaturen.get(building_type, [])
-    return [{"id": r["id"], "omschrijving": r["omschrijving"], "theta_i": r["theta_i_C"]} for r in data]
+    return [dict(r) for r in _tables.room_types.get(building_type, ())]
 
 
 def get_theta_i(room_type_id: str, building_type: str = "woonfunctie") -> float:
@@ -86,12 +79,12 @@ def get_theta_i(room_type_id: str, building_type: str = "woonfunctie") -> float:
 
     Raises ``ValueError`` when the id is not found.
     """
-    for r in _tabel_binnentemperaturen.get(building_type, []):
-        if r["id"] == room_type_id:
-            return float(r["theta_i_C"])
-    raise ValueError(
-        f"Unknown room type {room_type_id!r} in building type {building_type!r}"
-    )
+    try:
+        return _tables.theta_i[(building_type, room_type_id)]
+    except KeyError:
+        raise ValueError(
+            f"Unknown room type {room_type_id!r} in building type {building_type!r}"
+        ) from None
 
 
 # ── Scenario 1: Buitenlucht ──────────────────────────────────────────────────
@@ -100,7 +93,7 @@ def get_theta_i(room_type_id: str, building_type: str = "woonfunctie") -> float:
 def calc_f_k_buitenlucht(
     bouwdeel: str,
     theta_i: float,
-    theta_e: float = DEFAULT_THETA_E,
+    theta_e: Optional[float] = None,
     heating_system_id: Optional[str] = None,
     is_heated_surface: bool = False,
 ) -> float:
@@ -112,7 +105,7 @@ def calc_f_k_buitenlucht(
         ``"buitenwand"``, ``"schuin_dak"``, ``"vloer_boven_buitenlucht"``, or
         ``"plat_dak"``.
     theta_i : design indoor temperature [°C].
-    theta_e : design outdoor temperature [°C].
+    theta_e : design outdoor temperature [°C] (default ``DEFAULT_THETA_E``).
     heating_system_id :
         Required when *bouwdeel* is ``"vloer_boven_buitenlucht"`` or
         ``"plat_dak"`` (used to look up Δθ).
@@ -126,6 +119,9 @@ def calc_f_k_buitenlucht(
     if bouwdeel in ("buitenwand", "schuin_dak"):
         return 1.0
 
+    if theta_e is None:
+        theta_e = _tables.theta_e
+
     if theta_i == theta_e:
         raise ValueError("theta_i must not equal theta_e")
 
@@ -318,34 +314,29 @@ def calc_f_k_onverwarmd_onbekend_warmteverlies(
     if ruimte_type == "vertrek":
         if aantal_externe_gevels is None:
             raise ValueError("aantal_externe_gevels is required for vertrek")
-        for entry in _tabel_2_3["vertrek"]["waarden"]:
-            spec = entry["aantal_externe_scheidingsconstructies"]
-            if spec == "3+" and aantal_externe_gevels >= 3:
-                return entry["f_k"]
-            if isinstance(spec, int) and spec == aantal_externe_gevels:
-                if spec == 2:
-                    if buitendeur_aanwezig is None:
-                        raise ValueError(
-                            "buitendeur_aanwezig is required when "
-                            "aantal_externe_gevels == 2"
-                        )
-                    if entry["buitendeur_aanwezig"] == buitendeur_aanwezig:
-                        return entry["f_k"]
-                else:
-                    return entry["f_k"]
-        raise ValueError(
-            f"No matching entry in Tabel 2.3 vertrek for "
-            f"gevels={aantal_externe_gevels}, deur={buitendeur_aanwezig}"
-        )
+        n = aantal_externe_gevels
+        if n == 2 and buitendeur_aanwezig is None:
+            raise ValueError(
+                "buitendeur_aanwezig is required when aantal_externe_gevels == 2"
+            )
+        f_k = _tables.vertrek_f_k.get((n, buitendeur_aanwezig if n == 2 else None))
+        if f_k is None and n >= 3:
+            f_k = _tables.vertrek_f_k.get(("3+", None))
+        if f_k is None:
+            raise ValueError(
+                f"No matching entry in Tabel 2.3 vertrek for "
+                f"gevels={aantal_externe_gevels}, deur={buitendeur_aanwezig}"
+            )
+        return f_k
 
     # ── Category 2: Ruimte onder het dak ──
     if ruimte_type == "dak":
         if daktype is None:
             raise ValueError("daktype is required for dak")
-        for entry in _tabel_2_3["dak"]["waarden"]:
-            if entry["daktype"] == daktype:
-                return entry["f_k"]
-        raise ValueError(f"Unknown daktype: {daktype!r}")
+        try:
+            return _tables.dak_f_k[daktype]
+        except KeyError:
+            raise ValueError(f"Unknown daktype: {daktype!r}") from None
 
     # ── Category 3: Gemeenschappelijke verkeersruimte ──
     if ruimte_type == "verkeersruimte":
@@ -368,12 +359,7 @@ def calc_f_k_onverwarmd_onbekend_warmteverlies(
             raise ValueError(
                 "openingsgrootte_mm2_per_m2 is required for kruipruimte"
             )
-        val = openingsgrootte_mm2_per_m2
-        if val <= 1000:
-            return 0.6
-        if val <= 1500:
-            return 0.8
-        return 1.0
+        return _tables.kruipruimte_f_k.lookup(openingsgrootte_mm2_per_m2)
 
     raise ValueError(f"Unknown ruimte_type: {ruimte_type!r}")
 
@@ -389,10 +375,10 @@ def calc_f_k_onverwarmd_onbekend_tijdconstante(
         ``"kelder"``, ``"stallingsruimte"``, or
         ``"kruipruimte_serre_trappenhuis"``.
     """
-    for entry in _tabel_2_13["waarden"]:
-        if entry["aangrenzende_ruimte"] == aangrenzende_ruimte:
-            return entry["f_k"]
-    raise ValueError(f"Unknown aangrenzende_ruimte: {aangrenzende_ruimte!r}")
+    try:
+        return _tables.tijdconstante_f_k[aangrenzende_ruimte]
+    except KeyError:
+        raise ValueError(f"Unknown aangrenzende_ruimte: {aangrenzende_ruimte!r}") from None
 
 
 # ── Scenario 5: Grond ─────────────────────────────────────────────────────────
@@ -405,18 +391,20 @@ def calc_f_gw(grondwaterdiepte_m: Optional[float] = None) -> float:
     ----------
     grondwaterdiepte_m :
         Depth of groundwater table below floor level [m].
-        ``None`` is treated as *unknown* → 1.15.
+        ``None`` (or NaN) is treated as *unknown* → 1.15.
     """
-    if grondwaterdiepte_m is not None and grondwaterdiepte_m >= 1.0:
-        return 1.00
-    return 1.15
+    table = _tables.f_gw
+    if grondwaterdiepte_m is None or math.isnan(grondwaterdiepte_m):
+        # "ondiep of onbekend" shares the lowest bin of the table
+        return table.values[0]
+    return table.lookup(grondwaterdiepte_m)
 
 
 def calc_f_ig_k(
     bouwdeel: str,
     theta_i: float,
-    theta_e: float = DEFAULT_THETA_E,
-    theta_me: float = DEFAULT_THETA_ME,
+    theta_e: Optional[float] = None,
+    theta_me: Optional[float] = None,
     heating_system_id: Optional[str] = None,
     is_heated_surface: bool = False,
 ) -> float:
@@ -425,11 +413,17 @@ def calc_f_ig_k(
     Parameters
     ----------
     bouwdeel : ``"wand"`` or ``"vloer"``.
+    theta_e : design outdoor temperature [°C] (default ``DEFAULT_THETA_E``).
     theta_me : mean annual outdoor temperature [°C] (default 10.5 for NL).
     """
     if is_heated_surface:
         return 0.0
 
+    if theta_e is None:
+        theta_e = _tables.theta_e
+    if theta_me is None:
+        theta_me = _tables.theta_me
+
     if theta_i == theta_e:
         raise ValueError("theta_i must not equal theta_e")
 
@@ -456,15 +450,10 @@ def calc_u_equiv_k(r_c: float) -> float:
     ----------
     r_c : thermal resistance of the ground-contact construction [m²·K/W].
     """
-    for entry in _tabel_u_equiv_k["waarden"]:
-        r_min = entry["R_c_min_m2KperW"]
-        r_max = entry["R_c_max_m2KperW"]
-        if r_min is not None and r_c < r_min:
-            continue
-        if r_max is not None and r_c >= r_max:
-            continue
-        return entry["U_equiv_k_W_per_m2K"]
-    raise ValueError(f"No matching U_equiv_k entry for R_c={r_c}")
+    try:
+        return _tables.u_equiv_k.lookup(r_c)
+    except ValueError:
+        raise ValueError(f"No matching U_equiv_k entry for R_c={r_c}") from None
 
 
 def calc_h_t_ig(
@@ -0,0 +1,312 @@
+"""fk_calc_batch.py – Array variants of the fk_calc correction-factor formulas.
+
+The ``*_batch`` functions evaluate formulas 2.7–2.28 (and the U_equiv,k /
+f_gw tables) for whole arrays at once.  Every argument may be a scalar or an
+array; all are broadcast to a common shape.  Instead of raising, each returns
+``(f, err)``: *f* holds the factor (``NaN`` where undetermined) and *err* an
+``int8`` error code per row (``ERR_OK`` where valid, see :data:`BATCH_ERRORS`).
+
+The functions are also reachable as ``fk_calc.<name>``.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+
+from table_registry import get_registry
+
+_tables = get_registry()
+
+# ── Error codes ───────────────────────────────────────────────────────────────
+
+ERR_OK = 0
+ERR_EQUAL_TEMPERATURES = 1
+ERR_MISSING_HEATING_SYSTEM = 2
+ERR_UNKNOWN_HEATING_SYSTEM = 3
+ERR_UNKNOWN_BOUWDEEL = 4
+ERR_OUT_OF_RANGE = 5
+
+BATCH_ERRORS: dict[int, str] = {
+    ERR_OK: "",
+    ERR_EQUAL_TEMPERATURES: "theta_i must not equal theta_e",
+    ERR_MISSING_HEATING_SYSTEM: "heating_system_id is required for this bouwdeel",
+    ERR_UNKNOWN_HEATING_SYSTEM: "Unknown heating system id",
+    ERR_UNKNOWN_BOUWDEEL: "Unknown bouwdeel",
+    ERR_OUT_OF_RANGE: "Value outside the range of the reference table",
+}
+
+
+@lru_cache(maxsize=None)
+def _delta_theta_columns() -> tuple[dict[str, int], np.ndarray, np.ndarray]:
+    """Return ``(id → row, Δθ₁ column, Δθ₂ column)`` for Tabel 2.12."""
+    systems = _tables.heating_systems
+    index = {s["id"]: i for i, s in enumerate(systems)}
+    d1 = np.array([s["delta_theta_1"] for s in systems], dtype=float)
+    d2 = np.array([s["delta_theta_2"] for s in systems], dtype=float)
+    return index, d1, d2
+
+
+def _batch_shape(*args) -> tuple[int, ...]:
+    return np.broadcast_shapes(*(np.shape(a) for a in args))
+
+
+def _float_array(values, shape) -> np.ndarray:
+    return np.broadcast_to(np.asarray(values, dtype=float), shape)
+
+
+def _bool_array(values, shape) -> np.ndarray:
+    return np.broadcast_to(np.asarray(values, dtype=bool), shape)
+
+
+def _code(key, index: dict[str, int], lower: bool) -> int:
+    if isinstance(key, str):
+        return index.get(key.lower() if lower else key, -1)
+    if key is None or (isinstance(key, float) and key != key):   # None / NaN
+        return -2
+    return -1
+
+
+def _codes(values, shape, index: dict[str, int], lower: bool = False):
+    """Map strings to integer codes via *index*.
+
+    Returns ``(codes, missing)``: *codes* is ``-1`` for unknown or missing
+    entries and *missing* flags ``None`` and ``NaN`` entries (an empty cell
+    in pandas); any other non-string is unknown.  Only the distinct values
+    are normalised and looked up; the per-row mapping runs in C.
+    """
+    arr = values if isinstance(values, np.ndarray) else np.asarray(values, dtype=object)
+    if arr.dtype.kind != "U":
+        arr = arr.astype(object)
+    keys = np.broadcast_to(arr, shape).ravel().tolist()
+    mapping = {k: _code(k, index, lower) for k in set(keys)}
+    codes = np.fromiter(map(mapping.__getitem__, keys), dtype=np.intp, count=len(keys))
+    codes = codes.reshape(shape)
+    missing = codes == -2
+    return np.where(missing, -1, codes), missing
+
+
+def _delta_theta_batch(heating_system_id, shape):
+    """Return ``(Δθ₁, Δθ₂, missing, unknown)`` arrays for heating-system ids."""
+    index, d1_col, d2_col = _delta_theta_columns()
+    codes, missing = _codes(heating_system_id, shape, index)
+    unknown = (codes < 0) & ~missing
+    safe = np.where(codes < 0, 0, codes)
+    d1 = np.where(codes < 0, np.nan, d1_col[safe])
+    d2 = np.where(codes < 0, np.nan, d2_col[safe])
+    return d1, d2, missing, unknown
+
+
+def _finish(shape, heated, choices, errors):
+    """Combine formula branches and error conditions into ``(f, err)``.
+
+    *choices* and *errors* are lists of ``(mask, value)``; the first matching
+    entry wins, mirroring the order of checks in the scalar functions.
+    """
+    err = np.select([mask for mask, _ in errors], [code for _, code in errors], ERR_OK)
+    err = np.broadcast_to(np.where(heated, ERR_OK, err), shape).astype(np.int8)
+    f = np.select(
+        [heated] + [mask for mask, _ in choices],
+        [0.0] + [value for _, value in choices],
+        np.nan,
+    )
+    f = np.broadcast_to(np.where(err != ERR_OK, np.nan, f), shape).astype(float)
+    return f, err
+
+
+_BL_CODES = {"buitenwand": 0, "schuin_dak": 1, "vloer_boven_buitenlucht": 2, "plat_dak": 3}
+_WVP_CODES = {"wand": 0, "vloer": 1, "plafond": 2}
+_WV_CODES = {"wand": 0, "vloer": 1}
+
+
+def calc_f_k_buitenlucht_batch(
+    bouwdeel,
+    theta_i,
+    theta_e=None,
+    heating_system_id=None,
+    is_heated_surface=False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Array variant of :func:`fk_calc.calc_f_k_buitenlucht` (formulas 2.7 / 2.8)."""
+    if theta_e is None:
+        theta_e = _tables.theta_e
+    shape = _batch_shape(bouwdeel, theta_i, theta_e, heating_system_id, is_heated_surface)
+    bd, _ = _codes(bouwdeel, shape, _BL_CODES, lower=True)
+    ti, te = _float_array(theta_i, shape), _float_array(theta_e, shape)
+    heated = _bool_array(is_heated_surface, shape)
+    d1, d2, hs_missing, hs_unknown = _delta_theta_batch(heating_system_id, shape)
+
+    constant = (bd == 0) | (bd == 1)
+    needs = ~constant
+    with np.errstate(divide="ignore", invalid="ignore"):
+        denom = ti - te
+        choices = [
+            (constant, 1.0),
+            (bd == 2, ((ti + d2) - te) / denom),
+            (bd == 3, ((ti + d1) - te) / denom),
+        ]
+    errors = [
+        (needs & (ti == te), ERR_EQUAL_TEMPERATURES),
+        (needs & hs_missing, ERR_MISSING_HEATING_SYSTEM),
+        (needs & hs_unknown, ERR_UNKNOWN_HEATING_SYSTEM),
+        (bd < 0, ERR_UNKNOWN_BOUWDEEL),
+    ]
+    return _finish(shape, heated, choices, errors)
+
+
+def _adjacent_batch(bouwdeel, theta_i, theta_e, theta_x, heating_system_id, is_heated_surface):
+    """Shared body of formulas 2.11–2.13 and 2.22–2.24 (θ_b or θ_a)."""
+    shape = _batch_shape(
+        bouwdeel, theta_i, theta_e, theta_x, heating_system_id, is_heated_surface
+    )
+    bd, _ = _codes(bouwdeel, shape, _WVP_CODES, lower=True)
+    ti, te = _float_array(theta_i, shape), _float_array(theta_e, shape)
+    tx = _float_array(theta_x, shape)
+    heated = _bool_array(is_heated_surface, shape)
+    d1, d2, hs_missing, hs_unknown = _delta_theta_batch(heating_system_id, shape)
+
+    needs_hs = (bd == 1) | (bd == 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        denom = ti - te
+        choices = [
+            (bd == 0, (ti - tx) / denom),
+            (bd == 1, ((ti + d2) - tx) / denom),
+            (bd == 2, ((ti + d1) - tx) / denom),
+        ]
+    errors = [
+        (ti == te, ERR_EQUAL_TEMPERATURES),
+        (needs_hs & hs_missing, ERR_MISSING_HEATING_SYSTEM),
+        (needs_hs & hs_unknown, ERR_UNKNOWN_HEATING_SYSTEM),
+        (bd < 0, ERR_UNKNOWN_BOUWDEEL),
+    ]
+    return _finish(shape, heated, choices, errors)
+
+
+def calc_f_ia_k_aangrenzend_gebouw_batch(
+    bouwdeel,
+    theta_i,
+    theta_e,
+    theta_b,
+    heating_system_id=None,
+    is_heated_surface=False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Array variant of :func:`fk_calc.calc_f_ia_k_aangrenzend_gebouw` (2.11–2.13)."""
+    return _adjacent_batch(
+        bouwdeel, theta_i, theta_e, theta_b, heating_system_id, is_heated_surface
+    )
+
+
+def calc_f_k_onverwarmd_bekend_batch(
+    bouwdeel,
+    theta_i,
+    theta_e,
+    theta_a,
+    heating_system_id=None,
+    is_heated_surface=False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Array variant of :func:`fk_calc.calc_f_k_onverwarmd_bekend` (2.22–2.24)."""
+    return _adjacent_batch(
+        bouwdeel, theta_i, theta_e, theta_a, heating_system_id, is_heated_surface
+    )
+
+
+def calc_f_ia_k_verwarmde_ruimte_batch(
+    bouwdeel,
+    theta_i,
+    theta_e,
+    theta_a,
+    heating_system_id_own=None,
+    heating_system_id_adjacent=None,
+    is_heated_surface=False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Array variant of :func:`fk_calc.calc_f_ia_k_verwarmde_ruimte` (2.17–2.19)."""
+    shape = _batch_shape(
+        bouwdeel, theta_i, theta_e, theta_a,
+        heating_system_id_own, heating_system_id_adjacent, is_heated_surface,
+    )
+    bd, _ = _codes(bouwdeel, shape, _WVP_CODES, lower=True)
+    ti, te = _float_array(theta_i, shape), _float_array(theta_e, shape)
+    ta = _float_array(theta_a, shape)
+    heated = _bool_array(is_heated_surface, shape)
+    d1_own, d2_own, own_missing, own_unknown = _delta_theta_batch(heating_system_id_own, shape)
+    d1_adj, d2_adj, adj_missing, adj_unknown = _delta_theta_batch(
+        heating_system_id_adjacent, shape
+    )
+
+    needs_hs = (bd == 1) | (bd == 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        denom = ti - te
+        choices = [
+            (bd == 0, (ti - ta) / denom),
+            (bd == 1, ((ti + d2_own) - (ta + d1_adj)) / denom),
+            (bd == 2, ((ti + d1_own) - (ta + d2_adj)) / denom),
+        ]
+    errors = [
+        (ti == te, ERR_EQUAL_TEMPERATURES),
+        (needs_hs & (own_missing | adj_missing), ERR_MISSING_HEATING_SYSTEM),
+        (needs_hs & (own_unknown | adj_unknown), ERR_UNKNOWN_HEATING_SYSTEM),
+        (bd < 0, ERR_UNKNOWN_BOUWDEEL),
+    ]
+    return _finish(shape, heated, choices, errors)
+
+
+def calc_f_ig_k_batch(
+    bouwdeel,
+    theta_i,
+    theta_e=None,
+    theta_me=None,
+    heating_system_id=None,
+    is_heated_surface=False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Array variant of :func:`fk_calc.calc_f_ig_k` (formulas 2.27 / 2.28)."""
+    if theta_e is None:
+        theta_e = _tables.theta_e
+    if theta_me is None:
+        theta_me = _tables.theta_me
+    shape = _batch_shape(
+        bouwdeel, theta_i, theta_e, theta_me, heating_system_id, is_heated_surface
+    )
+    bd, _ = _codes(bouwdeel, shape, _WV_CODES, lower=True)
+    ti, te = _float_array(theta_i, shape), _float_array(theta_e, shape)
+    tme = _float_array(theta_me, shape)
+    heated = _bool_array(is_heated_surface, shape)
+    _d1, d2, hs_missing, hs_unknown = _delta_theta_batch(heating_system_id, shape)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        denom = ti - te
+        choices = [
+            (bd == 0, (ti - tme) / denom),
+            (bd == 1, ((ti + d2) - tme) / denom),
+        ]
+    errors = [
+        (ti == te, ERR_EQUAL_TEMPERATURES),
+        ((bd == 1) & hs_missing, ERR_MISSING_HEATING_SYSTEM),
+        ((bd == 1) & hs_unknown, ERR_UNKNOWN_HEATING_SYSTEM),
+        (bd < 0, ERR_UNKNOWN_BOUWDEEL),
+    ]
+    return _finish(shape, heated, choices, errors)
+
+
+def calc_f_gw_batch(grondwaterdiepte_m) -> tuple[np.ndarray, np.ndarray]:
+    """Array variant of :func:`fk_calc.calc_f_gw`; ``NaN`` depth means *unknown*."""
+    table = _tables.f_gw
+    depth = np.asarray(grondwaterdiepte_m, dtype=float)
+    f, _valid = table.lookup_array(depth)
+    f = np.where(np.isnan(depth), table.values[0], f)
+    err = np.where(np.isnan(f), ERR_OUT_OF_RANGE, ERR_OK).astype(np.int8)
+    return f, err
+
+
+def calc_u_equiv_k_batch(r_c) -> tuple[np.ndarray, np.ndarray]:
+    """Array variant of :func:`fk_calc.calc_u_equiv_k`."""
+    u, valid = _tables.u_equiv_k.lookup_array(r_c)
+    return u, np.where(valid, ERR_OK, ERR_OUT_OF_RANGE).astype(np.int8)
+
+
+def calc_h_t_ig_batch(area, r_c, f_ig_k, f_gw) -> tuple[np.ndarray, np.ndarray]:
+    """Array variant of :func:`fk_calc.calc_h_t_ig` (``A · U_equiv,k · f_ig,k · f_gw``)."""
+    u_eq, err = calc_u_equiv_k_batch(r_c)
+    h = np.asarray(area, dtype=float) * u_eq * np.asarray(f_ig_k, dtype=float) * np.asarray(
+        f_gw, dtype=float
+    )
+    return h, np.broadcast_to(err, np.shape(h)).astype(np.int8)
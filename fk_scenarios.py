@@ -0,0 +1,222 @@
+"""fk_scenarios.py – Qt-free evaluation of correctiefactor scenarios.
+
+The Correctiefactoren tab saves its input as a ``.cfr`` JSON dict (see
+``FkCalcTab._get_state``): the scenario name, θ_i / θ_e and one group of
+``bl_*``, ``ag_*``, ``vr_*``, ``ob_*``, ``oo_*`` or ``gr_*`` fields holding
+the GUI labels and indexes.  :func:`evaluate_state` turns such a dict into the
+same factors the tab displays, so the desktop app and the headless batch CLI
+(``batch_calc``) share a single implementation.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Mapping, NamedTuple
+
+import fk_calc
+from table_registry import get_registry
+
+_TABLES = get_registry()
+HS_OPTIONS = _TABLES.heating_system_id_by_omschrijving
+HS_LIST = list(HS_OPTIONS.keys())
+
+ROOM_TYPES_WOON = _TABLES.room_types["woonfunctie"]
+
+BUITENLUCHT_BD = {
+    "Buitenwand": "buitenwand",
+    "Schuin dak": "schuin_dak",
+    "Vloer boven buitenlucht": "vloer_boven_buitenlucht",
+    "Plat dak": "plat_dak",
+}
+
+RUIMTE_MAP = {
+    "Vertrek": "vertrek",
+    "Ruimte onder dak": "dak",
+    "Verkeersruimte": "verkeersruimte",
+    "Kruipruimte": "kruipruimte",
+}
+
+DAKTYPE_MAP = {
+    "Pannendak zonder folie (hoog infiltratievoud)": "pannendak_zonder_folie",
+    "Overige niet-geïsoleerde daken": "niet_geisoleerd",
+    "Geïsoleerde daken": "geisoleerd",
+}
+
+GEVEL_OPTIONS = [
+    ("1 externe scheidingsconstructie / buitenwand", 1, None),
+    ("2 externe scheidingsconstructies – zonder buitendeur", 2, False),
+    ("2 externe scheidingsconstructies – met buitendeur", 2, True),
+    ("3 of meer externe scheidingsconstructies", 3, None),
+]
+
+TIJDCONST_MAP = {
+    "Kelder": "kelder",
+    "Stallingsruimte": "stallingsruimte",
+    "Kruipruimte / serre / trappenhuis": "kruipruimte_serre_trappenhuis",
+}
+
+# f_gw-opties afgeleid uit tabel_f_gw.json (grens en waarden op één plek)
+GW_DEPTH = _TABLES.f_gw.breakpoints[0]
+F_GW_DEEP = _TABLES.f_gw.lookup(GW_DEPTH)
+F_GW_SHALLOW = _TABLES.f_gw.values[0]
+GW_OPTIONS = [
+    (f"Grondwater ≥ {GW_DEPTH:g} m onder vloer  →  f_gw = {F_GW_DEEP:.2f}".replace(".", ","), F_GW_DEEP),
+    (
+        f"Grondwater < {GW_DEPTH:g} m onder vloer of onbekend  →  f_gw = {F_GW_SHALLOW:.2f}".replace(".", ","),
+        F_GW_SHALLOW,
+    ),
+]
+
+SCENARIOS = [
+    "Buitenlucht",
+    "Aangrenzend gebouw",
+    "Verwarmde ruimte (zelfde woning)",
+    "Onverwarmde ruimte – bekende temperatuur",
+    "Onverwarmde ruimte – onbekende temperatuur",
+    "Grond",
+]
+
+# Beginwaarden van de invoervelden in de GUI; ontbrekende sleutels in een
+# .cfr-dict vallen hierop terug.
+DEFAULT_STATE: dict[str, Any] = {
+    "scenario": SCENARIOS[0],
+    "theta_i": 22.0,
+    "theta_e": -10.0,
+    "bl_bouwdeel": next(iter(BUITENLUCHT_BD)),
+    "bl_hs": HS_LIST[0],
+    "bl_heated": False,
+    "ag_bouwdeel": "Wand",
+    "ag_theta_b": 20.0,
+    "ag_hs": HS_LIST[0],
+    "ag_heated": False,
+    "vr_bouwdeel": "Wand",
+    "vr_theta_a_idx": 0,
+    "vr_override": False,
+    "vr_theta_manual": 20.0,
+    "vr_hs_own": HS_LIST[0],
+    "vr_hs_adj": HS_LIST[0],
+    "vr_heated": False,
+    "ob_bouwdeel": "Wand",
+    "ob_theta_a": 5.0,
+    "ob_hs": HS_LIST[0],
+    "ob_heated": False,
+    "oo_doel": "Warmteverlies",
+    "oo_ruimte": next(iter(RUIMTE_MAP)),
+    "oo_gevels_idx": 0,
+    "oo_daktype": next(iter(DAKTYPE_MAP)),
+    "oo_buitenwanden": True,
+    "oo_ventilatievoud": 0.3,
+    "oo_a_opening": 0.003,
+    "oo_opening_mm2": 800.0,
+    "oo_tijdconst": next(iter(TIJDCONST_MAP)),
+    "gr_bouwdeel": "Wand",
+    "gr_theta_me": 10.5,
+    "gr_hs": HS_LIST[0],
+    "gr_heated": False,
+    "gr_grondwater": "Nee",
+    "gr_gwdiepte_idx": 0,
+    "gr_rc": 3.5,
+    "gr_area": 10.0,
+}
+
+
+def _option(options: list, index: int):
+    if not 0 <= index < len(options):
+        raise ValueError(f"Option index {index!r} out of range 0..{len(options) - 1}")
+    return options[index]
+
+
+class Factor(NamedTuple):
+    """One result row: machine key, GUI label, value and display decimals."""
+
+    key: str
+    label: str
+    value: float
+    decimals: int
+
+    def formatted(self) -> str:
+        return f"{self.value:.{self.decimals}f}"
+
+
+def evaluate_state(state: Mapping[str, Any]) -> list[Factor]:
+    """Compute the correctiefactoren for a ``.cfr`` state dict.
+
+    Missing keys take their :data:`DEFAULT_STATE` value.  Raises
+    ``ValueError`` (or ``KeyError`` for unknown labels) on invalid input, like
+    the underlying :mod:`fk_calc` functions.
+    """
+    d = {**DEFAULT_STATE, **state}
+    s = d["scenario"]
+    theta_i = d["theta_i"]
+    theta_e = d["theta_e"]
+
+    if s == "Buitenlucht":
+        bd = BUITENLUCHT_BD[d["bl_bouwdeel"]]
+        hs_id = HS_OPTIONS[d["bl_hs"]] if bd in ("vloer_boven_buitenlucht", "plat_dak") else None
+        f = fk_calc.calc_f_k_buitenlucht(bd, theta_i, theta_e, hs_id, d["bl_heated"])
+        return [Factor("f_k", "f_k", f, 4)]
+
+    if s == "Aangrenzend gebouw":
+        bd = d["ag_bouwdeel"].lower()
+        hs_id = HS_OPTIONS[d["ag_hs"]] if bd in ("vloer", "plafond") else None
+        f = fk_calc.calc_f_ia_k_aangrenzend_gebouw(
+            bd, theta_i, theta_e, d["ag_theta_b"], hs_id, d["ag_heated"]
+        )
+        return [Factor("f_ia_k", "f_ia,k", f, 4)]
+
+    if s == "Verwarmde ruimte (zelfde woning)":
+        bd = d["vr_bouwdeel"].lower()
+        theta_a = (
+            d["vr_theta_manual"]
+            if d["vr_override"]
+            else _option(ROOM_TYPES_WOON, d["vr_theta_a_idx"])["theta_i"]
+        )
+        hs_own = HS_OPTIONS[d["vr_hs_own"]] if bd != "wand" else None
+        hs_adj = HS_OPTIONS[d["vr_hs_adj"]] if bd != "wand" else None
+        f = fk_calc.calc_f_ia_k_verwarmde_ruimte(
+            bd, theta_i, theta_e, theta_a, hs_own, hs_adj, d["vr_heated"]
+        )
+        return [Factor("f_ia_k", "f_ia,k", f, 4)]
+
+    if s == "Onverwarmde ruimte – bekende temperatuur":
+        bd = d["ob_bouwdeel"].lower()
+        hs_id = HS_OPTIONS[d["ob_hs"]] if bd in ("vloer", "plafond") else None
+        f = fk_calc.calc_f_k_onverwarmd_bekend(
+            bd, theta_i, theta_e, d["ob_theta_a"], hs_id, d["ob_heated"]
+        )
+        return [Factor("f_k", "f_k", f, 4)]
+
+    if s == "Onverwarmde ruimte – onbekende temperatuur":
+        if d["oo_doel"] == "Warmteverlies":
+            rt = RUIMTE_MAP[d["oo_ruimte"]]
+            kwargs: dict = {}
+            if rt == "vertrek":
+                _label, n_gevels, buitendeur = _option(GEVEL_OPTIONS, d["oo_gevels_idx"])
+                kwargs["aantal_externe_gevels"] = n_gevels
+                if buitendeur is not None:
+                    kwargs["buitendeur_aanwezig"] = buitendeur
+            elif rt == "dak":
+                kwargs["daktype"] = DAKTYPE_MAP[d["oo_daktype"]]
+            elif rt == "verkeersruimte":
+                kwargs["heeft_buitenwanden"] = d["oo_buitenwanden"]
+                kwargs["ventilatievoud"] = d["oo_ventilatievoud"]
+                kwargs["a_opening_per_v"] = d["oo_a_opening"]
+            elif rt == "kruipruimte":
+                kwargs["openingsgrootte_mm2_per_m2"] = d["oo_opening_mm2"]
+            f = fk_calc.calc_f_k_onverwarmd_onbekend_warmteverlies(rt, **kwargs)
+            return [Factor("f_k", "f_k (Tabel 2.3)", f, 2)]
+        f = fk_calc.calc_f_k_onverwarmd_onbekend_tijdconstante(TIJDCONST_MAP[d["oo_tijdconst"]])
+        return [Factor("f_k", "f_k (Tabel 2.13)", f, 2)]
+
+    if s == "Grond":
+        bd = d["gr_bouwdeel"].lower()
+        hs_id = HS_OPTIONS[d["gr_hs"]] if bd == "vloer" else None
+        f_ig = fk_calc.calc_f_ig_k(
+            bd, theta_i, theta_e, d["gr_theta_me"], hs_id, d["gr_heated"]
+        )
+        f_gw = 1.00 if d["gr_grondwater"] == "Nee" else _option(GW_OPTIONS, d["gr_gwdiepte_idx"])[1]
+        return [
+            Factor("f_ig_k", "f_ig,k (formule)", f_ig, 4),
+            Factor("f_gw", "f_gw", f_gw, 2),
+        ]
+
+    raise ValueError(f"Unknown scenario: {s!r}")
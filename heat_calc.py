@@ -1,13 +1,15 @@
 """heat_calc.py – Computation logic for the U-value / heat-transmission calculator.
 
-Contains constants, material look-up helpers, and the LayerWidget class.
+Contains constants, material look-up helpers and a vectorised batch engine for
+whole layer stacks.  The notebook's LayerWidget lives in ``heat_calc_widgets``
+and is only imported (together with ipywidgets) when it is first accessed as
+``heat_calc.LayerWidget``; the desktop app and batch workers never load it.
 Import this module from the notebook to keep the notebook concise and readable.
 """
 
-try:
-    import ipywidgets as widgets
-except ImportError:  # allow import of helpers without ipywidgets (e.g. desktop app)
-    widgets = None
+from typing import NamedTuple
+
+import numpy as np
 
 # ── Constants ─────────────────────────────────────────────────────────────────
 
@@ -22,9 +24,34 @@ SURFACE_R = {
     'Binnenzijde  —  Ri = 0,13 m²·K/W': 0.13,
     'Buitenzijde  —  Re = 0,04 m²·K/W': 0.04,
 }
+DEFAULT_RI = 0.13
+DEFAULT_RE = 0.04
+
+# Layer kinds used by the batch engine (one int8 code per layer)
+LAYER_EMPTY  = 0   # padding – contributes nothing to Rc
+LAYER_LAMBDA = 1   # value is λ [W/(m·K)]     → R = d / λ
+LAYER_U      = 2   # value is U [W/(m²·K)]    → R = 1 / U
+LAYER_R      = 3   # value is R [m²·K/W]      → R = value
+
+# Monte Carlo defaults (see u_value_monte_carlo)
+MC_DRAWS = 10_000
+MC_SEED = 0
+MC_DISTRIBUTIONS = ('uniform', 'triangular')
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+def surface_r(value, default):
+    """Return a surface resistance from a :data:`SURFACE_R` label or a number.
+
+    ``None`` or an empty string gives *default*.
+    """
+    if value is None or value == '':
+        return default
+    if isinstance(value, str) and value in SURFACE_R:
+        return SURFACE_R[value]
+    return float(value)
+
+
 def scalar(val):
     """Return the lowest float from a value that may be a list/range."""
     if isinstance(val, list):
@@ -34,211 +61,308 @@ def scalar(val):
     return None
 
 
+def scalar_range(val):
+    """Return ``(low, high)`` floats for a value that may be a list/range."""
+    if isinstance(val, list):
+        return float(min(val)), float(max(val))
+    if isinstance(val, (int, float)):
+        return float(val), float(val)
+    return None
+
+
 def sub_keys(materials, main):
-    """Return the sub-category keys for a main category."""
+    """Return the sub-category keys for a main category.
+
+    *materials* is the nested JSON dict or a
+    :class:`material_catalogue.MaterialCatalogue` (same for the helpers below).
+    """
+    if not isinstance(materials, dict):
+        return list(materials.sub_keys(main))
     v = materials.get(main, {})
     return list(v.keys()) if isinstance(v, dict) else []
 
 
 def third_keys(materials, main, sub):
     """Return the third-level keys for a main/sub combination."""
+    if not isinstance(materials, dict):
+        return list(materials.third_keys(main, sub))
     v = materials.get(main, {}).get(sub, None)
     return list(v.keys()) if isinstance(v, dict) else []
 
 
 def raw_value(materials, main, sub, third=None):
     """Look up the raw λ / U / R value for a material selection."""
+    if not isinstance(materials, dict):
+        return materials.raw_value(main, sub, third)
     v = materials.get(main, {}).get(sub, None)
     if isinstance(v, dict) and third:
         v = v.get(third, None)
     return v
 
 
-# ── LayerWidget ───────────────────────────────────────────────────────────────
-
-class LayerWidget:
-    """Interactive widget representing one construction layer in the U-value form."""
-
-    def __init__(self, materials, update_cb, remove_cb):
-        self.materials = materials
-        self.update_cb = update_cb
-        self.remove_cb = remove_cb
-
-        # Input mode toggle
-        self.mode = widgets.ToggleButtons(
-            options=['Materiaallijst', 'Handmatige R'],
-            button_style='', layout=widgets.Layout(width='auto')
-        )
-
-        # ── Material selectors ──
-        self.cat_dd = widgets.Dropdown(
-            options=list(materials.keys()), description='Categorie:',
-            layout=widgets.Layout(width='220px')
-        )
-        self.sub_dd = widgets.Dropdown(
-            options=sub_keys(materials, self.cat_dd.value), description='Materiaal:',
-            layout=widgets.Layout(width='270px')
+def layer_kind(cat):
+    """Return the layer kind (``LAYER_*``) for a main category."""
+    if cat in U_VALUE_CATS:
+        return LAYER_U
+    if cat in R_VALUE_CATS:
+        return LAYER_R
+    return LAYER_LAMBDA
+
+
+def layer_r(cat, val, d):
+    """Return the thermal resistance [m²·K/W] of one material layer.
+
+    *val* is the raw value from :func:`raw_value`, *d* the thickness [m].
+    Returns ``None`` when R cannot be determined.
+    """
+    kind = layer_kind(cat)
+    v = scalar(val)
+    if kind == LAYER_U:
+        return (1.0 / v) if v else None
+    if kind == LAYER_R:
+        return v
+    return (d / v) if (v and v > 0 and d > 0) else None
+
+
+class UBounds(NamedTuple):
+    """Guaranteed ``[min, max]`` of Rc and U (scalars or ``(M,)`` arrays)."""
+
+    rc_min: float
+    rc_max: float
+    u_min: float
+    u_max: float
+
+
+def layer_r_bounds(cat, val, d):
+    """Return ``(R_min, R_max)`` of one layer over its whole value range.
+
+    The high end of a λ- or U-range gives the lowest R.  Returns ``None``
+    when R cannot be determined (as :func:`layer_r`).
+    """
+    kind = layer_kind(cat)
+    v = scalar_range(val)
+    if v is None:
+        return None
+    lo, hi = v
+    if kind == LAYER_U:
+        return (1.0 / hi, 1.0 / lo) if lo > 0 else None
+    if kind == LAYER_R:
+        return lo, hi
+    return (d / hi, d / lo) if (lo > 0 and d > 0) else None
+
+
+def _u_from_rc(rc, ri, re):
+    total = ri + rc + re
+    return 1.0 / total if total > 0 else float('nan')
+
+
+def construction_bounds(materials, layers, ri=DEFAULT_RI, re=DEFAULT_RE):
+    """Return :class:`UBounds` for one construction in ``.uwr`` layer-dict form.
+
+    Undetermined layers count as 0 in both bounds; U is ``NaN`` where
+    Ri + Rc + Re is not positive.
+    """
+    rc_min = rc_max = 0.0
+    for layer in layers:
+        if layer.get('modus') == 'Handmatige R':
+            r = layer.get('handmatige_r') or 0.0
+            rc_min, rc_max = rc_min + r, rc_max + r
+            continue
+        cat = layer.get('categorie')
+        val = raw_value(materials, cat, layer.get('materiaal'), layer.get('subtype'))
+        b = layer_r_bounds(cat, val, layer.get('dikte') or 0.0)
+        if b is not None:
+            rc_min, rc_max = rc_min + b[0], rc_max + b[1]
+    return UBounds(rc_min, rc_max, _u_from_rc(rc_max, ri, re), _u_from_rc(rc_min, ri, re))
+
+
+# ── Batch engine ──────────────────────────────────────────────────────────────
+
+def pack_constructions(materials, constructions):
+    """Pack constructions into padded ``(M, L)`` arrays for the batch engine.
+
+    Each construction is a list of layer dicts in the shape written to
+    ``.uwr`` files (``modus``, ``categorie``, ``materiaal``, ``subtype``,
+    ``dikte``, ``handmatige_r``).  Returns ``(values, thickness, kinds)``;
+    shorter constructions are padded with ``LAYER_EMPTY``.  With a
+    :class:`material_catalogue.MaterialCatalogue` the material values are
+    gathered from its columns instead of being looked up layer by layer.
+    """
+    values, _high, thickness, kinds = pack_ranges(materials, constructions)
+    return values, thickness, kinds
+
+
+def pack_ranges(materials, constructions):
+    """Like :func:`pack_constructions`, keeping both ends of value ranges.
+
+    Returns ``(low, high, thickness, kinds)``; ``high`` equals ``low`` for
+    single values and manual R layers.
+    """
+    n = len(constructions)
+    width = max((len(c) for c in constructions), default=0)
+    values = np.full((n, width), np.nan)
+    high = np.full((n, width), np.nan)
+    thickness = np.zeros((n, width))
+    kinds = np.full((n, width), LAYER_EMPTY, dtype=np.int8)
+    catalogue = None if isinstance(materials, dict) else materials
+    ids = np.full((n, width), -1, dtype=np.intp) if catalogue is not None else None
+
+    for i, layers in enumerate(constructions):
+        for j, layer in enumerate(layers):
+            if layer.get('modus') == 'Handmatige R':
+                r = layer.get('handmatige_r')
+                kinds[i, j] = LAYER_R
+                values[i, j] = high[i, j] = r if r is not None else np.nan
+                continue
+            cat = layer.get('categorie')
+            thickness[i, j] = layer.get('dikte') or 0.0
+            kinds[i, j] = layer_kind(cat)
+            if catalogue is not None:
+                m = catalogue.find(cat, layer.get('materiaal'), layer.get('subtype'))
+                ids[i, j] = -1 if m is None else m.id
+                continue
+            v = scalar_range(raw_value(materials, cat, layer.get('materiaal'), layer.get('subtype')))
+            if v is not None:
+                values[i, j], high[i, j] = v
+
+    if catalogue is not None:
+        found = ids >= 0
+        values[found] = catalogue.low[ids[found]]
+        high[found] = catalogue.high[ids[found]]
+    return values, high, thickness, kinds
+
+
+def layer_r_batch(values, thickness, kinds):
+    """Vectorised :func:`layer_r` – R per layer, ``NaN`` where undetermined."""
+    values = np.asarray(values, dtype=float)
+    thickness = np.asarray(thickness, dtype=float)
+    kinds = np.asarray(kinds)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lam_ok = (kinds == LAYER_LAMBDA) & (values > 0) & (thickness > 0)
+        u_ok = (kinds == LAYER_U) & (values != 0) & ~np.isnan(values)
+        r = np.where(lam_ok, thickness / values, np.nan)
+        r = np.where(u_ok, 1.0 / values, r)
+        r = np.where(kinds == LAYER_R, values, r)
+    return r
+
+
+def rc_batch(values, thickness, kinds):
+    """Return Rc [m²·K/W] per construction (undetermined layers count as 0)."""
+    return np.nansum(layer_r_batch(values, thickness, kinds), axis=-1)
+
+
+def u_value_batch(values, thickness, kinds, ri=DEFAULT_RI, re=DEFAULT_RE):
+    """Return ``(Rc, U)`` arrays for a batch of constructions.
+
+    *values*, *thickness* and *kinds* have shape ``(M, L)`` (see
+    :func:`pack_constructions`); *ri* / *re* are scalars or arrays of
+    shape ``(M,)``.  U is ``NaN`` where Ri + Rc + Re is not positive.
+    """
+    rc = rc_batch(values, thickness, kinds)
+    total = np.asarray(ri, dtype=float) + rc + np.asarray(re, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        u = np.where(total > 0, 1.0 / total, np.nan)
+    return rc, u
+
+
+def u_value_bounds_batch(low, high, thickness, kinds, ri=DEFAULT_RI, re=DEFAULT_RE):
+    """Vectorised :func:`construction_bounds` on :func:`pack_ranges` arrays.
+
+    Returns :class:`UBounds` of ``(M,)`` arrays: the high end of every range
+    gives ``rc_min`` / ``u_max`` (worst case), the low end ``rc_max`` /
+    ``u_min``.
+    """
+    low = np.asarray(low, dtype=float)
+    high = np.asarray(high, dtype=float)
+    kinds = np.asarray(kinds)
+    r_kind = kinds == LAYER_R
+    # R falls with λ / U but rises with an R-value range
+    rc_min = rc_batch(np.where(r_kind, low, high), thickness, kinds)
+    rc_max = rc_batch(np.where(r_kind, high, low), thickness, kinds)
+    surface = np.asarray(ri, dtype=float) + np.asarray(re, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        u_min = np.where(surface + rc_max > 0, 1.0 / (surface + rc_max), np.nan)
+        u_max = np.where(surface + rc_min > 0, 1.0 / (surface + rc_min), np.nan)
+    return UBounds(rc_min, rc_max, u_min, u_max)
+
+
+class MonteCarloU(NamedTuple):
+    """U distribution per construction, arrays of shape ``(M,)``."""
+
+    mean: np.ndarray
+    std: np.ndarray
+    p5: np.ndarray
+    p95: np.ndarray
+
+
+def u_value_monte_carlo(low, high, thickness, kinds, ri=DEFAULT_RI, re=DEFAULT_RE,
+                        draws=MC_DRAWS, distribution='uniform', seed=MC_SEED,
+                        max_elements=2_000_000):
+    """Sample value ranges and return the U distribution per construction.
+
+    *low* / *high* / *thickness* / *kinds* come from :func:`pack_ranges`.
+    Every λ- or U-layer whose range is wider than a point gets *draws*
+    independent values, uniform or symmetric triangular (mode in the middle)
+    between its ends; the other layers keep their fixed R.  *seed* is an int
+    or a ``numpy.random.Generator``, so results are reproducible.  Only
+    constructions with a range are sampled, in slices of at most about
+    *max_elements* samples.  U is ``NaN`` where Ri + Rc + Re is not positive.
+    """
+    if distribution not in MC_DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution {distribution!r}; use one of {MC_DISTRIBUTIONS}")
+    if draws < 1:
+        raise ValueError(f"draws must be at least 1, not {draws!r}")
+    low = np.asarray(low, dtype=float)
+    high = np.asarray(high, dtype=float)
+    thickness = np.asarray(thickness, dtype=float)
+    kinds = np.asarray(kinds)
+    m_total, width = low.shape
+    ri = np.broadcast_to(np.asarray(ri, dtype=float), (m_total,))
+    re = np.broadcast_to(np.asarray(re, dtype=float), (m_total,))
+    rng = np.random.default_rng(seed)
+
+    with np.errstate(invalid='ignore'):
+        varies = (high > low) & (low > 0) & (
+            ((kinds == LAYER_LAMBDA) & (thickness > 0)) | (kinds == LAYER_U)
         )
-        self.third_dd = widgets.Dropdown(
-            options=[], description='Subtype:',
-            layout=widgets.Layout(width='220px', visibility='hidden')
-        )
-        self.thickness = widgets.BoundedFloatText(
-            value=0.10, min=0.0, max=10.0, step=0.001,
-            description='Dikte d [m]:', layout=widgets.Layout(width='195px')
-        )
-        self.lam_lbl = widgets.HTML(value='')
-
-        # ── Manual R ──
-        self.manual_r = widgets.BoundedFloatText(
-            value=0.10, min=0.0, max=100.0, step=0.01,
-            description='R [m²·K/W]:', layout=widgets.Layout(width='195px')
-        )
-
-        # Effective-R feedback & remove button
-        self.r_lbl   = widgets.HTML(value='')
-        self.rem_btn = widgets.Button(
-            description='✕ Verwijder', button_style='danger',
-            layout=widgets.Layout(width='130px', height='30px')
-        )
-
-        # Sub-boxes for each mode
-        self.mat_box = widgets.VBox([
-            widgets.HBox([self.cat_dd, self.sub_dd, self.third_dd]),
-            widgets.HBox([self.thickness, self.lam_lbl]),
-        ])
-        self.man_box = widgets.VBox([self.manual_r])
-
-        # Wire events
-        self.mode.observe(self._on_mode, names='value')
-        self.cat_dd.observe(self._on_cat, names='value')
-        self.sub_dd.observe(self._on_sub, names='value')
-        self.third_dd.observe(self._recalc, names='value')
-        self.thickness.observe(self._recalc, names='value')
-        self.manual_r.observe(self._recalc, names='value')
-        self.rem_btn.on_click(lambda _: self.remove_cb(self))
-
-        self._refresh_sub()
-        self._refresh_third()
-        self._recalc(None)
-
-        self.box = widgets.VBox(
-            [widgets.HBox([self.mode, self.rem_btn]),
-             self.mat_box, self.r_lbl],
-            layout=widgets.Layout(
-                border='1px solid #bbb', padding='6px 10px',
-                margin='4px 0', border_radius='4px'
-            )
-        )
-
-    # ── private ──────────────────────────────────────────────────────────────
-
-    def _on_mode(self, _):
-        inner = self.mat_box if self.mode.value == 'Materiaallijst' else self.man_box
-        self.box.children = [self.box.children[0], inner, self.r_lbl]
-        self._recalc(None)
-
-    def _on_cat(self, _):
-        self._refresh_sub()
-        self._refresh_third()
-        self._recalc(None)
-
-    def _on_sub(self, _):
-        self._refresh_third()
-        self._recalc(None)
-
-    def _refresh_sub(self):
-        opts = sub_keys(self.materials, self.cat_dd.value)
-        self.sub_dd.options = opts if opts else ['—']
-
-    def _refresh_third(self):
-        sub = self.sub_dd.value if self.sub_dd.options else ''
-        opts = third_keys(self.materials, self.cat_dd.value, sub)
-        if opts:
-            self.third_dd.options = opts
-            self.third_dd.layout.visibility = 'visible'
-        else:
-            self.third_dd.options = ['—']
-            self.third_dd.layout.visibility = 'hidden'
-
-    def _recalc(self, _):
-        r = self.get_r()
-        if r is not None:
-            self.r_lbl.value = (
-                f'<span style="color:#1a7a1a;font-weight:bold">'
-                f'&nbsp;&nbsp;→&nbsp; R = {r:.3f} m²·K/W</span>')
-        else:
-            self.r_lbl.value = (
-                '<span style="color:#c00">'
-                '&nbsp;&nbsp;→&nbsp; R kan niet worden bepaald</span>')
-
-        # λ hint label (only relevant for standard materials)
-        cat = self.cat_dd.value
-        if self.mode.value != 'Materiaallijst' or cat in U_VALUE_CATS or cat in R_VALUE_CATS:
-            self.lam_lbl.value = ''
-            return
-        third = self.third_dd.value if self.third_dd.layout.visibility == 'visible' else None
-        val   = raw_value(self.materials, cat, self.sub_dd.value, third)
-        if isinstance(val, list):
-            self.lam_lbl.value = (
-                f'<span style="color:#555">'
-                f'&nbsp; λ = {val[0]} – {val[1]} W/(m·K) '
-                f'&nbsp;(laagste waarde {min(val):.4f} gebruikt)</span>')
-        elif isinstance(val, (int, float)):
-            self.lam_lbl.value = (
-                f'<span style="color:#555">'
-                f'&nbsp; λ = {val} W/(m·K)</span>')
-        else:
-            self.lam_lbl.value = ''
-
-        self.update_cb()
-
-    # ── public ───────────────────────────────────────────────────────────────
-
-    def get_r(self):
-        """Compute and return the thermal resistance [m²·K/W] for this layer."""
-        if self.mode.value == 'Handmatige R':
-            return self.manual_r.value
-
-        cat   = self.cat_dd.value
-        sub   = self.sub_dd.value
-        third = self.third_dd.value if self.third_dd.layout.visibility == 'visible' else None
-        val   = raw_value(self.materials, cat, sub, third)
-
-        if cat in U_VALUE_CATS:
-            u = scalar(val)
-            return (1.0 / u) if u else None
-
-        if cat in R_VALUE_CATS:
-            return scalar(val)
-
-        lam = scalar(val)
-        d   = self.thickness.value
-        return (d / lam) if (lam and lam > 0 and d > 0) else None
-
-    def row_info(self):
-        """Return a dict with display info for the result table row."""
-        cat   = self.cat_dd.value
-        sub   = self.sub_dd.value
-        third = self.third_dd.value if self.third_dd.layout.visibility == 'visible' else None
-        r     = self.get_r()
-
-        if self.mode.value == 'Handmatige R':
-            return {'naam': 'Handmatig', 'd': None, 'lam': '—', 'R': r}
-
-        val   = raw_value(self.materials, cat, sub, third)
-        label = f'{cat} / {sub}' + (f' / {third}' if third else '')
-
-        if cat in U_VALUE_CATS:
-            u = scalar(val)
-            return {'naam': label, 'd': None, 'lam': f'(U={u:.2f})', 'R': r}
-        if cat in R_VALUE_CATS:
-            return {'naam': label, 'd': None, 'lam': '(R-waarde)', 'R': r}
-
-        lam = scalar(val)
-        return {
-            'naam': label,
-            'd':    self.thickness.value,
-            'lam':  f'{lam:.4f}' if lam else '—',
-            'R':    r,
-        }
+    r_fixed = layer_r_batch(low, thickness, kinds)
+    rc_fixed = np.nansum(np.where(varies, np.nan, r_fixed), axis=-1)
+
+    # Constructions without a range have a point distribution
+    _, u_point = u_value_batch(low, thickness, kinds, ri, re)
+    out = [u_point.copy(), np.zeros(m_total), u_point.copy(), u_point.copy()]
+    sampled = np.flatnonzero(varies.any(axis=-1))
+    num = np.where(kinds == LAYER_LAMBDA, thickness, 1.0)   # R = num / value
+    step = max(1, max_elements // (draws * max(width, 1)))
+    for start in range(0, sampled.size, step):
+        part = sampled[start:start + step]
+        total = np.empty((part.size, draws))
+        total[:] = (ri[part] + rc_fixed[part] + re[part])[:, None]
+        for j in range(width):
+            sel = np.flatnonzero(varies[part, j])
+            if not sel.size:
+                continue
+            idx = part[sel]
+            v = rng.random((sel.size, draws))
+            if distribution == 'triangular':
+                v += rng.random((sel.size, draws))
+                v *= 0.5
+            v *= (high[idx, j] - low[idx, j])[:, None]
+            v += low[idx, j][:, None]
+            np.divide(num[idx, j][:, None], v, out=v)
+            total[sel] += v
+        with np.errstate(divide='ignore', invalid='ignore'):
+            u = np.where(total > 0, 1.0 / total, np.nan)
+        out[0][part] = u.mean(axis=1)
+        out[1][part] = u.std(axis=1)
+        out[2][part], out[3][part] = np.percentile(u, [5, 95], axis=1)
+    return MonteCarloU(*out)
+
+
+def __getattr__(name):
+    # LayerWidget is re-exported lazily so that importing the helpers never
+    # pulls in ipywidgets / traitlets / IPython.
+    if name == 'LayerWidget':
+        from heat_calc_widgets import LayerWidget
+        return LayerWidget
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,297 @@
+"""instrumentation.py – Opt-in timing counters for the fk_calc / heat_calc hot paths.
+
+:func:`enable` wraps every calculation function of :mod:`fk_calc`,
+:mod:`fk_calc_batch` and :mod:`heat_calc` and the table look-ups
+(``get_delta_theta``, ``get_theta_i``, ``calc_u_equiv_k``, material
+``raw_value``, :class:`range_table.RangeTable`) with a timer that records per
+function
+
+  count, errors (raised exceptions), total and max time, and p50 / p90 / p99
+  over the most recent :data:`SAMPLE_SIZE` calls.
+
+The wrappers are installed by replacing the functions in those modules and in
+every project module that imported them by name; :func:`disable` puts the
+originals back.  While disabled nothing is wrapped, so there is no overhead
+at all.
+
+:func:`snapshot` / :func:`reset` read and clear the counters;
+:func:`to_json`, :func:`to_prometheus` and :func:`dump` write them out.  The
+desktop app and ``batch_calc`` switch this on through the ``instrumentation``
+keys of ``app/config.py``.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import json
+import math
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Optional
+
+# Latencies kept per function for the percentiles
+SAMPLE_SIZE = 2048
+
+PERCENTILES = (50, 90, 99)
+
+PROMETHEUS_PREFIX = "warmtetransmissie"
+
+_PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# module → functions to wrap; "Class.method" entries wrap a method
+_TARGETS: dict[str, tuple[str, ...]] = {
+    "fk_calc": (
+        "get_delta_theta",
+        "get_theta_i",
+        "calc_f_k_buitenlucht",
+        "calc_f_ia_k_aangrenzend_gebouw",
+        "calc_f_ia_k_verwarmde_ruimte",
+        "calc_f_k_onverwarmd_bekend",
+        "calc_f_k_onverwarmd_onbekend_warmteverlies",
+        "calc_f_k_onverwarmd_onbekend_tijdconstante",
+        "calc_f_gw",
+        "calc_f_ig_k",
+        "calc_u_equiv_k",
+        "calc_h_t_ig",
+    ),
+    "fk_calc_batch": (
+        "calc_f_k_buitenlucht_batch",
+        "calc_f_ia_k_aangrenzend_gebouw_batch",
+        "calc_f_ia_k_verwarmde_ruimte_batch",
+        "calc_f_k_onverwarmd_bekend_batch",
+        "calc_f_ig_k_batch",
+        "calc_f_gw_batch",
+        "calc_u_equiv_k_batch",
+        "calc_h_t_ig_batch",
+    ),
+    "heat_calc": (
+        "raw_value",
+        "layer_r",
+        "layer_r_bounds",
+        "construction_bounds",
+        "pack_constructions",
+        "pack_ranges",
+        "layer_r_batch",
+        "rc_batch",
+        "u_value_batch",
+        "u_value_bounds_batch",
+        "u_value_monte_carlo",
+    ),
+    "range_table": ("RangeTable.lookup", "RangeTable.lookup_array"),
+}
+
+# Functions reported with kind="lookup" instead of kind="calc"
+LOOKUPS = frozenset({
+    "fk_calc.get_delta_theta",
+    "fk_calc.get_theta_i",
+    "fk_calc.calc_u_equiv_k",
+    "fk_calc_batch.calc_u_equiv_k_batch",
+    "heat_calc.raw_value",
+    "range_table.RangeTable.lookup",
+    "range_table.RangeTable.lookup_array",
+})
+
+
+class _Stat:
+    __slots__ = ("count", "errors", "total", "max", "samples")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: deque[float] = deque(maxlen=SAMPLE_SIZE)
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.samples.append(seconds)
+
+
+_lock = threading.Lock()
+_stats: dict[str, _Stat] = {}
+# (owner, attribute, original) for every replaced reference
+_patched: list[tuple[Any, str, Any]] = []
+
+
+def _stat(name: str) -> _Stat:
+    stat = _stats.get(name)
+    if stat is None:
+        stat = _stats.setdefault(name, _Stat())
+    return stat
+
+
+def _timed(name: str, fn: Callable) -> Callable:
+    perf_counter = time.perf_counter
+
+    @functools.wraps(fn)
+    def timed(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        except Exception:
+            with _lock:
+                _stat(name).errors += 1
+            raise
+        finally:
+            elapsed = perf_counter() - start
+            with _lock:
+                _stat(name).add(elapsed)
+
+    timed.__instrumented__ = name
+    return timed
+
+
+def _project_modules() -> list[Any]:
+    out = []
+    for module in list(sys.modules.values()):
+        path = getattr(module, "__file__", None)
+        if path and os.path.abspath(path).startswith(_PROJECT_DIR + os.sep):
+            out.append(module)
+    return out
+
+
+def is_enabled() -> bool:
+    return bool(_patched)
+
+
+def enable() -> None:
+    """Install the timing wrappers (no-op when already enabled)."""
+    with _lock:
+        if _patched:
+            return
+        replacements: dict[int, Callable] = {}
+        for module_name, attrs in _TARGETS.items():
+            module = importlib.import_module(module_name)
+            for attr in attrs:
+                if "." in attr:
+                    cls_name, fn_name = attr.split(".")
+                    owner = getattr(module, cls_name)
+                    original = owner.__dict__[fn_name]
+                else:
+                    owner, fn_name = module, attr
+                    original = getattr(module, attr)
+                wrapper = _timed(f"{module_name}.{attr}", original)
+                setattr(owner, fn_name, wrapper)
+                _patched.append((owner, fn_name, original))
+                replacements[id(original)] = wrapper
+        # Rebind ``from module import fn`` copies held by other project modules
+        for module in _project_modules():
+            for attr, value in list(vars(module).items()):
+                wrapper = replacements.get(id(value))
+                if wrapper is not None and getattr(module, attr) is not wrapper:
+                    setattr(module, attr, wrapper)
+                    _patched.append((module, attr, value))
+
+
+def disable() -> None:
+    """Restore the original functions; the counters are kept."""
+    with _lock:
+        while _patched:
+            owner, attr, original = _patched.pop()
+            setattr(owner, attr, original)
+        # Modules imported while enabled picked up wrappers by name
+        for module in _project_modules():
+            for attr, value in list(vars(module).items()):
+                if getattr(value, "__instrumented__", None):
+                    setattr(module, attr, value.__wrapped__)
+
+
+def reset() -> None:
+    """Clear all counters."""
+    with _lock:
+        _stats.clear()
+
+
+def _percentile(sorted_samples: list[float], q: float) -> float:
+    # nearest-rank, like loadgen.percentile
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(q / 100.0 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def snapshot() -> dict[str, dict[str, Any]]:
+    """Return the counters per function (times in seconds), sorted by name."""
+    with _lock:
+        items = [(name, s.count, s.errors, s.total, s.max, sorted(s.samples))
+                 for name, s in _stats.items()]
+    out = {}
+    for name, count, errors, total, max_, samples in sorted(items):
+        entry = {
+            "kind": "lookup" if name in LOOKUPS else "calc",
+            "count": count,
+            "errors": errors,
+            "total_s": total,
+            "mean_s": total / count if count else 0.0,
+            "max_s": max_,
+        }
+        for q in PERCENTILES:
+            entry[f"p{q}_s"] = _percentile(samples, q)
+        out[name] = entry
+    return out
+
+
+def export_state() -> dict[str, tuple]:
+    """Raw counters for :func:`merge_state`, e.g. from a worker process."""
+    with _lock:
+        return {name: (s.count, s.errors, s.total, s.max, list(s.samples))
+                for name, s in _stats.items()}
+
+
+def merge_state(state: dict[str, tuple]) -> None:
+    """Add counters from :func:`export_state` to this process's counters."""
+    with _lock:
+        for name, (count, errors, total, max_, samples) in state.items():
+            stat = _stat(name)
+            stat.count += count
+            stat.errors += errors
+            stat.total += total
+            stat.max = max(stat.max, max_)
+            stat.samples.extend(samples)
+
+
+def to_json(snap: Optional[dict] = None) -> str:
+    return json.dumps(snapshot() if snap is None else snap, indent=2)
+
+
+def to_prometheus(snap: Optional[dict] = None) -> str:
+    """Render a snapshot in the Prometheus text exposition format."""
+    snap = snapshot() if snap is None else snap
+    p = PROMETHEUS_PREFIX
+    lines = [
+        f"# HELP {p}_calls_total Calls per calculation function.",
+        f"# TYPE {p}_calls_total counter",
+    ]
+    labels = {name: f'function="{name}",kind="{e["kind"]}"' for name, e in snap.items()}
+    lines += [f"{p}_calls_total{{{labels[n]}}} {e['count']}" for n, e in snap.items()]
+    lines += [
+        f"# HELP {p}_errors_total Calls that raised an exception.",
+        f"# TYPE {p}_errors_total counter",
+    ]
+    lines += [f"{p}_errors_total{{{labels[n]}}} {e['errors']}" for n, e in snap.items()]
+    lines += [
+        f"# HELP {p}_latency_seconds Call latency (quantiles over the most recent calls).",
+        f"# TYPE {p}_latency_seconds summary",
+    ]
+    for n, e in snap.items():
+        for q in PERCENTILES:
+            lines.append(
+                f'{p}_latency_seconds{{{labels[n]},quantile="{q / 100:g}"}} {e[f"p{q}_s"]!r}'
+            )
+        lines.append(f"{p}_latency_seconds_sum{{{labels[n]}}} {e['total_s']!r}")
+        lines.append(f"{p}_latency_seconds_count{{{labels[n]}}} {e['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def dump(path: str) -> None:
+    """Write a snapshot to *path*: Prometheus text for ``.prom`` / ``.txt``, else JSON."""
+    text = to_prometheus() if path.lower().endswith((".prom", ".txt")) else to_json() + "\n"
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write(text)
@@ -0,0 +1,156 @@
+"""loadgen.py – Load generator for the local calculation service.
+
+Sends concurrent requests over keep-alive connections and reports throughput
+and p50 / p99 latency::
+
+    python -m calc_service &
+    python loadgen.py --requests 5000 --concurrency 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import statistics
+import sys
+import time
+from typing import Any, Optional
+
+from calc_service import DEFAULT_HOST, DEFAULT_PORT
+
+# Request mix: (path, body) pairs sent round-robin
+DEFAULT_MIX: list[tuple[str, dict]] = [
+    (
+        "/u-value",
+        {"lagen": [
+            {"modus": "Materiaallijst", "categorie": "stenen", "materiaal": "kalkzandsteen",
+             "dikte": 0.1},
+            {"modus": "Materiaallijst", "categorie": "isolatie", "materiaal": "PIR",
+             "dikte": 0.12},
+        ]},
+    ),
+    (
+        "/fk/calc_f_k_buitenlucht",
+        {"bouwdeel": "plat_dak", "theta_i": 20.0, "theta_e": -10.0,
+         "heating_system_id": "radiatoren_lt"},
+    ),
+    ("/scenario", {"scenario": "Grond", "gr_grondwater": "Ja"}),
+]
+
+
+class Client:
+    """Minimal keep-alive HTTP/1.1 JSON client."""
+
+    def __init__(self, host: str, port: int) -> None:
+        self.host, self.port = host, port
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def request(self, method: str, path: str, body: Any = None) -> tuple[int, Any]:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        data = b"" if body is None else json.dumps(body).encode("utf-8")
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n\r\n".encode()
+            + data
+        )
+        await self.writer.drain()
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        close = False
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            if key.lower() == "content-length":
+                length = int(value)
+            elif key.lower() == "connection" and value.strip().lower() == "close":
+                close = True
+        payload = json.loads(await self.reader.readexactly(length))
+        if close:   # the server ends the connection; the next request reconnects
+            await self.close()
+        return status, payload
+
+    async def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Nearest-rank percentile of *values* (0 < p ≤ 100)."""
+    ordered = sorted(values)
+    rank = max(1, min(len(ordered), math.ceil(p / 100 * len(ordered))))
+    return ordered[rank - 1]
+
+
+async def run_load(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    requests: int = 1000,
+    concurrency: int = 32,
+    mix: list[tuple[str, dict]] = DEFAULT_MIX,
+) -> dict[str, Any]:
+    """Send *requests* requests from *concurrency* clients; return a report."""
+    latencies: list[float] = []
+    failures = 0
+    counter = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal failures
+        client = Client(host, port)
+        try:
+            for i in counter:
+                path, body = mix[i % len(mix)]
+                t0 = time.perf_counter()
+                status, _payload = await client.request("POST", path, body)
+                latencies.append(time.perf_counter() - t0)
+                failures += status != 200
+        finally:
+            await client.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    report = {
+        "requests": len(latencies),
+        "failures": failures,
+        "seconds": elapsed,
+        "throughput": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "p50_ms": 0.0,
+        "p99_ms": 0.0,
+        "mean_ms": 0.0,
+    }
+    if latencies:   # nothing completed (e.g. --requests 0): report zeros
+        report.update(
+            p50_ms=percentile(latencies, 50) * 1000,
+            p99_ms=percentile(latencies, 99) * 1000,
+            mean_ms=statistics.fmean(latencies) * 1000,
+        )
+    return report
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Belastingtest voor calc_service.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("-n", "--requests", type=int, default=1000)
+    parser.add_argument("-c", "--concurrency", type=int, default=32)
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run_load(args.host, args.port, args.requests, args.concurrency))
+    print(
+        f"{report['requests']} requests ({report['failures']} mislukt) in "
+        f"{report['seconds']:.2f} s – {report['throughput']:,.0f} req/s\n"
+        f"p50 {report['p50_ms']:.2f} ms   p99 {report['p99_ms']:.2f} ms   "
+        f"gemiddeld {report['mean_ms']:.2f} ms"
+    )
+    return 1 if report["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
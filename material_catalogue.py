@@ -0,0 +1,171 @@
+"""material_catalogue.py – Flattened, interned view of ``material_properties.json``.
+
+The material database is a nested dict (categorie → materiaal [→ subtype]) with
+λ, U or R values, some given as a ``[min, max]`` range.  :class:`MaterialCatalogue`
+compiles it once into
+
+  materials        – one :class:`Material` record per leaf, indexed by id
+  id_by_path       – (categorie, materiaal, subtype | None) → id
+  kinds, low, high – NumPy columns over all ids (``heat_calc.LAYER_*``, values)
+
+plus precomputed key tuples for the category / material / subtype selectors.
+:func:`heat_calc.raw_value`, :func:`heat_calc.sub_keys`,
+:func:`heat_calc.third_keys` and :func:`heat_calc.pack_constructions` accept a
+catalogue in place of the raw dict.  Use :func:`get_catalogue` to obtain the
+shared instance; the JSON file is parsed at most once per process (until
+:func:`reload_catalogue`).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+from types import MappingProxyType
+from typing import Mapping, Optional, Union
+
+import numpy as np
+
+from heat_calc import layer_kind
+
+_BASE_DIR = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+MATERIALS_PATH = os.path.join(_BASE_DIR, "material_properties.json")
+
+# (categorie, materiaal, subtype) – subtype is None for two-level entries
+MaterialPath = tuple[str, str, Optional[str]]
+Number = Union[int, float]
+
+
+class Material:
+    """One leaf of the material database.
+
+    *low* is the value used in calculations (the lowest of a range); *high*
+    is the upper end of a ``[min, max]`` range, or ``None`` for single values.
+    """
+
+    __slots__ = ("id", "path", "kind", "low", "high")
+
+    def __init__(
+        self, id: int, path: MaterialPath, kind: int, low: Number, high: Optional[Number]
+    ) -> None:
+        self.id = id
+        self.path = path
+        self.kind = kind
+        self.low = low
+        self.high = high
+
+    @property
+    def raw(self) -> Union[Number, list[Number]]:
+        """The value as written in the JSON file (number or ``[min, max]``)."""
+        return self.low if self.high is None else [self.low, self.high]
+
+    def __repr__(self) -> str:
+        return f"Material({self.id}, {self.path!r}, kind={self.kind}, raw={self.raw!r})"
+
+
+class MaterialCatalogue:
+    """Compiled, read-only index over the nested material dict *data*."""
+
+    def __init__(self, data: Mapping) -> None:
+        records: list[Material] = []
+        id_by_path: dict[MaterialPath, int] = {}
+        sub_keys: dict[str, tuple[str, ...]] = {}
+        third_keys: dict[tuple[str, str], tuple[str, ...]] = {}
+
+        for cat, subs in data.items():
+            cat = sys.intern(cat)
+            kind = layer_kind(cat)
+            sub_keys[cat] = tuple(sys.intern(s) for s in subs) if isinstance(subs, dict) else ()
+            for sub, v in (subs.items() if isinstance(subs, dict) else ()):
+                sub = sys.intern(sub)
+                if isinstance(v, dict):
+                    third_keys[(cat, sub)] = tuple(sys.intern(t) for t in v)
+                    leaves = [(sys.intern(t), tv) for t, tv in v.items()]
+                else:
+                    leaves = [(None, v)]
+                for third, value in leaves:
+                    if isinstance(value, list):
+                        low, high = min(value), max(value)
+                    else:
+                        low, high = value, None
+                    path = (cat, sub, third)
+                    id_by_path[path] = len(records)
+                    records.append(Material(len(records), path, kind, low, high))
+
+        self.materials: tuple[Material, ...] = tuple(records)
+        self.paths: tuple[MaterialPath, ...] = tuple(m.path for m in records)
+        self.id_by_path: Mapping[MaterialPath, int] = MappingProxyType(id_by_path)
+        self.categories: tuple[str, ...] = tuple(sub_keys)
+        self._sub_keys = sub_keys
+        self._third_keys = third_keys
+
+        self.kinds = np.fromiter((m.kind for m in records), dtype=np.int8, count=len(records))
+        self.low = np.fromiter((m.low for m in records), dtype=float, count=len(records))
+        self.high = np.fromiter(
+            (m.low if m.high is None else m.high for m in records),
+            dtype=float,
+            count=len(records),
+        )
+        for column in (self.kinds, self.low, self.high):
+            column.flags.writeable = False
+
+    @classmethod
+    def from_file(cls, path: str = MATERIALS_PATH) -> "MaterialCatalogue":
+        with open(path, "r", encoding="utf-8") as fh:
+            return cls(json.load(fh))
+
+    def __len__(self) -> int:
+        return len(self.materials)
+
+    def keys(self) -> tuple[str, ...]:
+        """Category names (the top-level keys of the JSON file)."""
+        return self.categories
+
+    def sub_keys(self, main: str) -> tuple[str, ...]:
+        return self._sub_keys.get(main, ())
+
+    def third_keys(self, main: str, sub: str) -> tuple[str, ...]:
+        return self._third_keys.get((main, sub), ())
+
+    def find(self, main: str, sub: str, third: Optional[str] = None) -> Optional[Material]:
+        """Return the record for a selection, or ``None`` if it is not a leaf.
+
+        *third* is ignored for materials without subtypes, mirroring
+        :func:`heat_calc.raw_value`.
+        """
+        i = self.id_by_path.get((main, sub, None))
+        if i is None and third:
+            i = self.id_by_path.get((main, sub, third))
+        return None if i is None else self.materials[i]
+
+    def raw_value(self, main: str, sub: str, third: Optional[str] = None):
+        m = self.find(main, sub, third)
+        return None if m is None else m.raw
+
+
+_catalogue: Optional[MaterialCatalogue] = None
+_catalogue_lock = threading.Lock()
+
+
+def get_catalogue() -> MaterialCatalogue:
+    """Return the shared :class:`MaterialCatalogue` for ``material_properties.json``."""
+    global _catalogue
+    if _catalogue is None:
+        with _catalogue_lock:
+            if _catalogue is None:
+                _catalogue = MaterialCatalogue.from_file()
+    return _catalogue
+
+
+def reload_catalogue(path: str = MATERIALS_PATH) -> MaterialCatalogue:
+    """Re-read the material database and replace the shared catalogue.
+
+    Caches bound to the shared catalogue (:func:`r_cache.get_r_cache`) notice
+    the new instance and drop their entries.
+    """
+    global _catalogue
+    catalogue = MaterialCatalogue.from_file(path)
+    with _catalogue_lock:
+        _catalogue = catalogue
+    return catalogue
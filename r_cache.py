@@ -0,0 +1,211 @@
+"""r_cache.py – Bounded LRU caches for layer R and construction Rc / U.
+
+Projects evaluate the same layers (100 mm PIR, 100 mm kalkzandsteen, …) over
+and over.  :class:`RValueCache` memoises
+
+  layer R          – keyed on (modus, material, dikte) resp. (modus, R)
+  construction Rc  – keyed on the canonical sequence of those layer keys
+
+against a :class:`material_catalogue.MaterialCatalogue`.  Both caches are
+bounded (least recently used entries are evicted), thread-safe, and count hits,
+misses and evictions; see :meth:`RValueCache.stats`.
+
+The shared instance from :func:`get_r_cache` follows the shared catalogue:
+after :func:`material_catalogue.reload_catalogue` it drops its entries on the
+next call.  Call :meth:`RValueCache.invalidate` to clear it explicitly.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, Mapping, NamedTuple, Optional
+
+from heat_calc import DEFAULT_RE, DEFAULT_RI, layer_r
+from material_catalogue import MaterialCatalogue, get_catalogue
+
+DEFAULT_LAYER_MAXSIZE = 4096
+DEFAULT_CONSTRUCTION_MAXSIZE = 1024
+
+MODE_MATERIAL = "Materiaallijst"
+MODE_MANUAL = "Handmatige R"
+
+LayerKey = tuple[Hashable, ...]
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of look-ups answered from the cache (0.0 when unused)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _LRU:
+    """Minimal ordered-dict LRU; callers hold the owning cache's lock."""
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, not {maxsize!r}")
+        self.maxsize = maxsize
+        self.data: OrderedDict[Hashable, Any] = OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        try:
+            value = self.data[key]
+        except KeyError:
+            self.misses += 1
+            value = self.data[key] = compute()
+            if len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+                self.evictions += 1
+            return value
+        self.hits += 1
+        self.data.move_to_end(key)
+        return value
+
+    def clear(self) -> None:
+        self.data.clear()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(self.hits, self.misses, self.evictions, self.maxsize, len(self.data))
+
+
+class RValueCache:
+    """LRU-cached R / Rc / U evaluation for layers in ``.uwr`` layer-dict form.
+
+    Parameters
+    ----------
+    catalogue :
+        Material catalogue to resolve materials against; ``None`` follows
+        :func:`material_catalogue.get_catalogue`.
+    layer_maxsize, construction_maxsize :
+        Maximum number of cached layers resp. constructions.
+    """
+
+    def __init__(
+        self,
+        catalogue: Optional[MaterialCatalogue] = None,
+        layer_maxsize: int = DEFAULT_LAYER_MAXSIZE,
+        construction_maxsize: int = DEFAULT_CONSTRUCTION_MAXSIZE,
+    ) -> None:
+        self._follow_shared = catalogue is None
+        self._catalogue = catalogue
+        self._lock = threading.RLock()
+        self._layers = _LRU(layer_maxsize)
+        self._constructions = _LRU(construction_maxsize)
+
+    @property
+    def catalogue(self) -> MaterialCatalogue:
+        if self._follow_shared:
+            shared = get_catalogue()
+            if shared is not self._catalogue:
+                self.invalidate(shared)
+        return self._catalogue
+
+    def invalidate(self, catalogue: Optional[MaterialCatalogue] = None) -> None:
+        """Drop all cached values, e.g. after the material data changed.
+
+        Passing *catalogue* also switches the cache over to it.
+        """
+        with self._lock:
+            if catalogue is not None:
+                self._catalogue = catalogue
+            self._layers.clear()
+            self._constructions.clear()
+
+    def stats(self) -> dict[str, CacheStats]:
+        """Return hit / miss / eviction counters per cache level."""
+        with self._lock:
+            return {"layer": self._layers.stats(), "construction": self._constructions.stats()}
+
+    # ── Keys ─────────────────────────────────────────────────────────────────
+
+    def layer_key(self, layer: Mapping[str, Any]) -> Optional[LayerKey]:
+        """Canonical cache key of a layer dict, or ``None`` for unknown materials.
+
+        Material keys hold the catalogue's :class:`Material` itself (hashed by
+        identity), so the value is computed from the same catalogue the key
+        was resolved in, and a key from a replaced catalogue never matches.
+        """
+        if layer.get("modus") == MODE_MANUAL:
+            return (MODE_MANUAL, layer.get("handmatige_r"))
+        m = self.catalogue.find(
+            layer.get("categorie"), layer.get("materiaal"), layer.get("subtype")
+        )
+        if m is None:
+            return None
+        return (MODE_MATERIAL, m, float(layer.get("dikte") or 0.0))
+
+    @staticmethod
+    def _compute_layer(key: LayerKey) -> Optional[float]:
+        if key[0] == MODE_MANUAL:
+            return key[1]
+        m = key[1]
+        return layer_r(m.path[0], m.raw, key[2])
+
+    # ── Look-ups ─────────────────────────────────────────────────────────────
+
+    def layer_r(self, layer: Mapping[str, Any]) -> Optional[float]:
+        """R [m²·K/W] of one layer; ``None`` when it cannot be determined."""
+        key = self.layer_key(layer)
+        if key is None:
+            return None
+        with self._lock:
+            return self._layers.get(key, lambda: self._compute_layer(key))
+
+    def material_r(
+        self, main: str, sub: str, third: Optional[str], thickness: float
+    ) -> Optional[float]:
+        """Shorthand for :meth:`layer_r` of a material-list layer."""
+        return self.layer_r(
+            {"modus": MODE_MATERIAL, "categorie": main, "materiaal": sub,
+             "subtype": third, "dikte": thickness}
+        )
+
+    def construction_rc(self, layers: Iterable[Mapping[str, Any]]) -> float:
+        """Rc [m²·K/W] of a layer sequence (undetermined layers count as 0)."""
+        keys = tuple(self.layer_key(layer) for layer in layers)
+
+        def compute() -> float:
+            total = 0.0
+            for key in keys:
+                if key is not None:
+                    r = self._layers.get(key, lambda: self._compute_layer(key))
+                    total += r or 0.0
+            return total
+
+        with self._lock:
+            return self._constructions.get(keys, compute)
+
+    def construction(
+        self,
+        layers: Iterable[Mapping[str, Any]],
+        ri: float = DEFAULT_RI,
+        re: float = DEFAULT_RE,
+    ) -> tuple[float, Optional[float]]:
+        """Return ``(Rc, U)``; U is ``None`` when Ri + Rc + Re is not positive."""
+        rc = self.construction_rc(layers)
+        total = ri + rc + re
+        return rc, (1.0 / total if total > 0 else None)
+
+
+_cache: Optional[RValueCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_r_cache() -> RValueCache:
+    """Return the shared :class:`RValueCache` (bound to the shared catalogue)."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = RValueCache()
+    return _cache
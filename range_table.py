@@ -0,0 +1,118 @@
+"""range_table.py – Interval look-up tables compiled from ``*_min`` / ``*_max`` columns.
+
+Several reference tables map a continuous quantity onto a value through
+contiguous bins, e.g. R_c → U_equiv,k or groundwater depth → f_gw.  A
+:class:`RangeTable` compiles such a table once into sorted breakpoints and
+answers scalar queries by bisection and array queries with
+``numpy.searchsorted``.  NumPy is only imported once an array query is made.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterable, Mapping, Optional
+
+
+def _bound(value: Optional[float], default: float) -> float:
+    return default if value is None else float(value)
+
+
+class RangeTable:
+    """Contiguous interval table: "which bin contains *x*?".
+
+    Parameters
+    ----------
+    entries :
+        Table rows (the ``"waarden"`` list of a JSON table).
+    lower_key, upper_key :
+        Column names of the bin bounds.  A missing or ``null`` bound means
+        the bin is unbounded on that side; that side is then closed, so
+        ``±inf`` itself still falls in the outer bin.
+    value_key : column returned for a matching bin.
+    closed :
+        ``"left"`` for bins ``[min, max)``, ``"right"`` for ``(min, max]``.
+
+    Raises ``ValueError`` when the bins overlap or leave gaps.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[Mapping[str, Any]],
+        lower_key: str,
+        upper_key: str,
+        value_key: str,
+        closed: str = "left",
+    ) -> None:
+        if closed not in ("left", "right"):
+            raise ValueError(f"closed must be 'left' or 'right', not {closed!r}")
+        bins = sorted(
+            (
+                _bound(e.get(lower_key), -math.inf),
+                _bound(e.get(upper_key), math.inf),
+                e[value_key],
+            )
+            for e in entries
+        )
+        if not bins:
+            raise ValueError(f"Range table for {value_key!r} has no entries")
+        for (_lo, hi, _v), (next_lo, _hi, _nv) in zip(bins, bins[1:]):
+            if hi != next_lo:
+                raise ValueError(
+                    f"Range table for {value_key!r} is not contiguous at {hi} / {next_lo}"
+                )
+
+        self.closed = closed
+        self.lower = bins[0][0]
+        self.upper = bins[-1][1]
+        self.breakpoints: tuple[float, ...] = tuple(b[0] for b in bins[1:])
+        self.values: tuple[Any, ...] = tuple(b[2] for b in bins)
+        self._bisect = bisect_right if closed == "left" else bisect_left
+        self._side = "right" if closed == "left" else "left"
+        self._arrays = None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return (
+            f"RangeTable(breakpoints={self.breakpoints}, values={self.values}, "
+            f"closed={self.closed!r})"
+        )
+
+    def _in_domain(self, x):
+        if self.closed == "left":
+            below = x <= self.upper if self.upper == math.inf else x < self.upper
+            return (x >= self.lower) & below
+        above = x >= self.lower if self.lower == -math.inf else x > self.lower
+        return above & (x <= self.upper)
+
+    def lookup(self, x: float) -> Any:
+        """Return the value of the bin containing *x*.
+
+        Raises ``ValueError`` when *x* lies outside all bins (or is NaN).
+        """
+        if not self._in_domain(x):
+            raise ValueError(f"No matching range for {x!r}")
+        return self.values[self._bisect(self.breakpoints, x)]
+
+    def lookup_array(self, x):
+        """Vectorised :meth:`lookup`.
+
+        Returns ``(values, valid)`` arrays; *values* is ``NaN`` where *valid*
+        is ``False``.
+        """
+        import numpy as np
+
+        if self._arrays is None:
+            self._arrays = (
+                np.asarray(self.breakpoints, dtype=float),
+                np.asarray(self.values, dtype=float),
+            )
+        breakpoints, values = self._arrays
+        x = np.asarray(x, dtype=float)
+        with np.errstate(invalid="ignore"):
+            valid = self._in_domain(x)
+        idx = np.searchsorted(breakpoints, x, side=self._side)
+        idx = np.minimum(idx, len(values) - 1)
+        return np.where(valid, values[idx], np.nan), valid
@@ -0,0 +1,194 @@
+"""stack_optimizer.py – Branch-and-bound search for layer stacks meeting an Rc target.
+
+Given fixed (structural) layers in ``.uwr`` layer-dict form, :func:`optimize_stack`
+adds up to *max_layers* λ-material layers from the allowed catalogue
+categories, each in commercial thickness steps, and returns the Pareto front
+of total thickness versus U among the stacks that meet the target: for every
+front point no other stack is both thinner and better insulating.  At equal
+thickness and U the stack with the fewest layers wins.
+
+Naive enumeration of (material × thickness)^layers explodes, so the search is
+a depth-first branch-and-bound with materials ordered by λ:
+
+* Rc upper bound – from a partial stack, the remaining thickness budget can add
+  at most ``Δd / λ_min`` of the materials still allowed on that branch; if that
+  cannot reach the target, or cannot beat the front found so far at any
+  thickness, the branch (and every branch with a larger λ) is cut.
+* iterative deepening on the layer count, so one-layer solutions are found
+  (and preferred) before two-layer ones.
+* a wall-clock *time_budget*; when it runs out the best front so far is
+  returned with ``complete=False``.
+
+Only λ-layers are candidates (R = d / λ as in :func:`heat_calc.layer_r`);
+glass, doors and floors can only appear as fixed layers.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Mapping, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from heat_calc import DEFAULT_RE, DEFAULT_RI, LAYER_LAMBDA
+from r_cache import MODE_MANUAL, MODE_MATERIAL, RValueCache, get_r_cache
+from thickness_solver import INSULATION, THICKNESS_STEP, Selector, select_materials, target_rc
+
+DEFAULT_MAX_LAYERS = 3
+DEFAULT_MAX_TOTAL_THICKNESS = 0.5   # [m], fixed layers included
+DEFAULT_MAX_LAYER_THICKNESS = 0.2   # [m], thickest commercial board / blanket
+DEFAULT_TIME_BUDGET = 2.0           # [s]
+
+# Rc comparisons tolerate float noise of this size
+_EPS = 1e-9
+
+
+class Stack(NamedTuple):
+    """One front point: the added layers and the resulting construction."""
+
+    layers: tuple[tuple[tuple[str, str, Optional[str]], float], ...]  # (path, d)
+    thickness: float   # total thickness incl. fixed λ-layers [m]
+    rc: float          # Rc incl. fixed layers [m²·K/W]
+    u: float           # U [W/(m²·K)]
+
+    @property
+    def count(self) -> int:
+        return len(self.layers)
+
+    def as_layers(self) -> list[dict]:
+        """The added layers as ``.uwr`` layer dicts."""
+        return [
+            {"modus": MODE_MATERIAL, "categorie": path[0], "materiaal": path[1],
+             "subtype": path[2], "dikte": d}
+            for path, d in self.layers
+        ]
+
+
+class OptimizerResult(NamedTuple):
+    front: list[Stack]   # sorted thinnest first (and therefore highest U first)
+    complete: bool       # False when the time budget cut the search short
+    nodes: int           # number of search nodes expanded
+    seconds: float
+
+
+class _Timeout(Exception):
+    pass
+
+
+def _fixed_thickness(layers: Sequence[Mapping[str, Any]], cache: RValueCache) -> float:
+    total = 0.0
+    for layer in layers:
+        if layer.get("modus") == MODE_MANUAL:
+            continue
+        m = cache.catalogue.find(layer.get("categorie"), layer.get("materiaal"), layer.get("subtype"))
+        if m is not None and m.kind == LAYER_LAMBDA:
+            total += float(layer.get("dikte") or 0.0)
+    return total
+
+
+def optimize_stack(
+    fixed_layers: Sequence[Mapping[str, Any]] = (),
+    u: Optional[float] = None,
+    rc: Optional[float] = None,
+    ri: float = DEFAULT_RI,
+    re: float = DEFAULT_RE,
+    categories: Optional[Sequence[Selector]] = INSULATION,
+    max_layers: int = DEFAULT_MAX_LAYERS,
+    max_total_thickness: float = DEFAULT_MAX_TOTAL_THICKNESS,
+    max_layer_thickness: float = DEFAULT_MAX_LAYER_THICKNESS,
+    step: float = THICKNESS_STEP,
+    time_budget: Optional[float] = DEFAULT_TIME_BUDGET,
+    cache: Optional[RValueCache] = None,
+) -> OptimizerResult:
+    """Search layer stacks that reach a target *u* or *rc* (exactly one).
+
+    *categories* limits the candidate materials to main categories and/or
+    ``(categorie, materiaal)`` pairs (``None`` allows every λ-material); *max_total_thickness* includes the fixed λ-layers.  An empty
+    front means the target cannot be met within the constraints.
+    """
+    if max_layers < 1:
+        raise ValueError(f"max_layers must be at least 1, not {max_layers!r}")
+    if step <= 0:
+        raise ValueError(f"step must be positive, not {step!r}")
+    cache = cache or get_r_cache()
+    catalogue = cache.catalogue
+    start = time.perf_counter()
+    deadline = None if time_budget is None else start + time_budget
+
+    fixed_layers = list(fixed_layers)
+    rc0 = cache.construction_rc(fixed_layers)
+    d0 = _fixed_thickness(fixed_layers, cache)
+    target = target_rc(u, rc, ri, re)
+
+    # Candidate materials, best (lowest λ) first
+    mask = (catalogue.kinds == LAYER_LAMBDA) & (catalogue.low > 0)
+    if categories is not None:
+        mask &= select_materials(catalogue, categories)
+    ids = np.flatnonzero(mask)
+    ids = ids[np.argsort(catalogue.low[ids], kind="stable")]
+    paths = [catalogue.materials[i].path for i in ids]
+    slopes = (step / catalogue.low[ids]).tolist()   # R per thickness step
+
+    # Everything below works in integer thickness steps
+    budget = int(np.floor((max_total_thickness - d0) / step + _EPS))
+    k_layer = max(int(np.floor(max_layer_thickness / step + _EPS)), 0)
+    if budget < 1 or k_layer < 1 or not paths:
+        return OptimizerResult([], True, 0, time.perf_counter() - start)
+
+    # best[k]: highest feasible Rc with k added steps, stacks[k] its layers
+    best = np.full(budget + 1, -np.inf)
+    stacks: list[Optional[tuple]] = [None] * (budget + 1)
+    if rc0 >= target - _EPS:
+        best[0] = rc0
+        stacks[0] = ()
+    steps = np.arange(budget + 1)
+    nodes = 0
+
+    def dominated(k: int, r: float, slope: float) -> bool:
+        """True when no completion of (k, r) can add a front point."""
+        potential = r + (steps[k + 1:] - k) * slope
+        envelope = np.maximum.accumulate(best)[k + 1:]
+        useful = (potential >= target - _EPS) & (potential > envelope + _EPS)
+        return not useful.any()
+
+    def expand(first: int, k: int, r: float, layers: tuple, depth: int) -> None:
+        nonlocal nodes
+        nodes += 1
+        if deadline is not None and time.perf_counter() > deadline:
+            raise _Timeout
+        for j in range(first, len(paths)):
+            slope = slopes[j]
+            # λ only grows with j, so once a material is cut all later ones are
+            if r + (budget - k) * slope < target - _EPS or dominated(k, r, slope):
+                break
+            for dk in range(1, min(k_layer, budget - k) + 1):
+                k2, r2 = k + dk, r + dk * slope
+                child = layers + ((j, dk),)
+                if r2 >= target - _EPS and r2 > best[k2] + _EPS:
+                    best[k2] = r2
+                    stacks[k2] = child
+                if depth > 1:
+                    expand(j, k2, r2, child, depth - 1)
+
+    complete = True
+    try:
+        for depth in range(1, max_layers + 1):
+            expand(0, 0, rc0, (), depth)
+    except _Timeout:
+        complete = False
+
+    front: list[Stack] = []
+    top = -np.inf
+    for k in range(budget + 1):
+        if stacks[k] is not None and best[k] > top + _EPS:
+            top = best[k]
+            total = rc0 + sum(dk * slopes[j] for j, dk in stacks[k])
+            front.append(
+                Stack(
+                    tuple((paths[j], round(dk * step, 9)) for j, dk in stacks[k]),
+                    round(d0 + k * step, 9),
+                    total,
+                    1.0 / (ri + total + re),
+                )
+            )
+    return OptimizerResult(front, complete, nodes, time.perf_counter() - start)
@@ -0,0 +1,220 @@
+"""table_registry.py – Compiled, read-only indexes over the reference tables.
+
+Each JSON file in the ``tables/`` folder is parsed once and compiled into
+immutable hashed indexes, so that the look-ups done by ``fk_calc`` and the
+desktop app are O(1) dictionary hits instead of linear scans over the raw
+JSON structures:
+
+  heating_system_by_id  – Tabel 2.12: id → record (Δθ₁, Δθ₂, …)
+  theta_i               – binnentemperaturen: (building_type, room) → θ_i
+  vertrek_f_k, dak_f_k  – Tabel 2.3 look-ups
+  tijdconstante_f_k     – Tabel 2.13: aangrenzende_ruimte → f_k
+  u_equiv_k, f_gw,
+  kruipruimte_f_k       – :class:`range_table.RangeTable` bins
+
+Tables are loaded lazily: a JSON file is parsed and compiled on first access
+to one of its indexes (thread-safe, exactly once), so importing ``fk_calc``
+touches no files at all.  Use :func:`get_registry` to obtain the shared
+instance.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Union
+
+from range_table import RangeTable
+
+_BASE_DIR = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+TABLES_DIR = os.path.join(_BASE_DIR, "tables")
+
+# Tabel 2.3 "vertrek" key: (aantal externe scheidingsconstructies, buitendeur)
+VertrekKey = tuple[Union[int, str], Optional[bool]]
+
+
+def load_json(filename: str, tables_dir: str = TABLES_DIR) -> dict:
+    """Parse one JSON file from *tables_dir*."""
+    with open(os.path.join(tables_dir, filename), "r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def _frozen(d: dict) -> Mapping[str, Any]:
+    return MappingProxyType(dict(d))
+
+
+# Index attribute → compile step that defines it (see TableRegistry.__getattr__)
+_COMPILERS: dict[str, str] = {
+    "heating_systems": "_compile_tabel_2_12",
+    "heating_system_by_id": "_compile_tabel_2_12",
+    "heating_system_id_by_omschrijving": "_compile_tabel_2_12",
+    "delta_theta": "_compile_tabel_2_12",
+    "theta_e": "_compile_binnentemperaturen",
+    "theta_me": "_compile_binnentemperaturen",
+    "room_types": "_compile_binnentemperaturen",
+    "theta_i": "_compile_binnentemperaturen",
+    "vertrek_f_k": "_compile_tabel_2_3",
+    "dak_f_k": "_compile_tabel_2_3",
+    "kruipruimte_f_k": "_compile_tabel_2_3",
+    "tijdconstante_f_k": "_compile_tabel_2_13",
+    "u_equiv_k": "_compile_tabel_u_equiv_k",
+    "f_gw": "_compile_tabel_f_gw",
+}
+
+
+class TableRegistry:
+    """Immutable, indexed view of all reference tables in *tables_dir*.
+
+    Index attributes do not exist until first accessed; ``__getattr__`` then
+    runs the matching ``_compile_*`` step under a lock.  Afterwards they are
+    plain instance attributes, so later look-ups carry no overhead.
+    """
+
+    def __init__(self, tables_dir: str = TABLES_DIR) -> None:
+        self._lock = threading.RLock()
+        self.tables_dir = tables_dir
+        self._raw: dict[str, dict] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        compiler = _COMPILERS.get(name)
+        if compiler is None:
+            raise AttributeError(f"{type(self).__name__!s} has no attribute {name!r}")
+        with self._lock:
+            if name not in self.__dict__:
+                getattr(self, compiler)()
+        return self.__dict__[name]
+
+    @property
+    def loaded_tables(self) -> frozenset[str]:
+        """Names of the JSON files parsed so far."""
+        return frozenset(self._raw)
+
+    def load_all(self) -> None:
+        """Compile every table now (e.g. once per worker process)."""
+        for compiler in dict.fromkeys(_COMPILERS.values()):
+            getattr(self, compiler)()
+
+    def raw(self, filename: str) -> dict:
+        """Return the parsed JSON of *filename* (parsed at most once)."""
+        with self._lock:
+            if filename not in self._raw:
+                self._raw[filename] = load_json(filename, self.tables_dir)
+            return self._raw[filename]
+
+    # ── Tabel 2.12 – Δθ per verwarmingssysteem ──────────────────────────────
+
+    def _compile_tabel_2_12(self) -> None:
+        systems = tuple(
+            _frozen(
+                {
+                    "id": s["id"],
+                    "omschrijving": s["omschrijving"],
+                    "delta_theta_1": s["delta_theta_1_K"],
+                    "delta_theta_2": s["delta_theta_2_K"],
+                }
+            )
+            for cat in self.raw("tabel_2_12.json")["categorieen"]
+            for s in cat["systemen"]
+        )
+        self.heating_systems: tuple[Mapping[str, Any], ...] = systems
+        self.heating_system_by_id: Mapping[str, Mapping[str, Any]] = MappingProxyType(
+            {s["id"]: s for s in systems}
+        )
+        self.heating_system_id_by_omschrijving: Mapping[str, str] = MappingProxyType(
+            {s["omschrijving"]: s["id"] for s in systems}
+        )
+        self.delta_theta: Mapping[str, tuple[float, float]] = MappingProxyType(
+            {s["id"]: (s["delta_theta_1"], s["delta_theta_2"]) for s in systems}
+        )
+
+    # ── Binnentemperaturen ──────────────────────────────────────────────────
+
+    def _compile_binnentemperaturen(self) -> None:
+        data = self.raw("tabel_binnentemperaturen.json")
+        self.theta_e: float = data["standaard_nl"]["theta_e_C"]
+        self.theta_me: float = data["standaard_nl"]["theta_me_C"]
+
+        room_types: dict[str, tuple[Mapping[str, Any], ...]] = {}
+        theta_i: dict[tuple[str, str], float] = {}
+        for building_type, rooms in data.items():
+            if not isinstance(rooms, list):
+                continue
+            room_types[building_type] = tuple(
+                _frozen(
+                    {"id": r["id"], "omschrijving": r["omschrijving"], "theta_i": r["theta_i_C"]}
+                )
+                for r in rooms
+            )
+            for r in rooms:
+                theta_i.setdefault((building_type, r["id"]), float(r["theta_i_C"]))
+        self.room_types: Mapping[str, tuple[Mapping[str, Any], ...]] = MappingProxyType(
+            room_types
+        )
+        self.theta_i: Mapping[tuple[str, str], float] = MappingProxyType(theta_i)
+
+    # ── Tabel 2.3 – f_k bij onbekende θ_a (warmteverlies) ───────────────────
+
+    def _compile_tabel_2_3(self) -> None:
+        data = self.raw("tabel_2_3.json")
+        vertrek: dict[VertrekKey, float] = {}
+        for entry in data["vertrek"]["waarden"]:
+            key = (entry["aantal_externe_scheidingsconstructies"], entry["buitendeur_aanwezig"])
+            vertrek.setdefault(key, entry["f_k"])
+        self.vertrek_f_k: Mapping[VertrekKey, float] = MappingProxyType(vertrek)
+
+        dak: dict[str, float] = {}
+        for entry in data["dak"]["waarden"]:
+            dak.setdefault(entry["daktype"], entry["f_k"])
+        self.dak_f_k: Mapping[str, float] = MappingProxyType(dak)
+
+        # "≤ 1.000 mm²/m²", "> 1.000 en ≤ 1.500", … → bins closed on the right
+        self.kruipruimte_f_k = RangeTable(
+            data["kruipruimte"]["waarden"],
+            "openingsgrootte_mm2_per_m2_min",
+            "openingsgrootte_mm2_per_m2_max",
+            "f_k",
+            closed="right",
+        )
+
+    # ── Tabel 2.13 – f_k voor de tijdconstante ──────────────────────────────
+
+    def _compile_tabel_2_13(self) -> None:
+        waarden: dict[str, float] = {}
+        for entry in self.raw("tabel_2_13.json")["waarden"]:
+            waarden.setdefault(entry["aangrenzende_ruimte"], entry["f_k"])
+        self.tijdconstante_f_k: Mapping[str, float] = MappingProxyType(waarden)
+
+    # ── U_equiv,k en f_gw (grond) ───────────────────────────────────────────
+
+    def _compile_tabel_u_equiv_k(self) -> None:
+        self.u_equiv_k = RangeTable(
+            self.raw("tabel_u_equiv_k.json")["waarden"],
+            "R_c_min_m2KperW",
+            "R_c_max_m2KperW",
+            "U_equiv_k_W_per_m2K",
+        )
+
+    def _compile_tabel_f_gw(self) -> None:
+        self.f_gw = RangeTable(
+            self.raw("tabel_f_gw.json")["waarden"],
+            "grondwaterdiepte_onder_vloer_m_min",
+            "grondwaterdiepte_onder_vloer_m_max",
+            "f_gw",
+        )
+
+
+_registry: Optional[TableRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> TableRegistry:
+    """Return the shared :class:`TableRegistry` for the bundled ``tables/``."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = TableRegistry()
+    return _registry
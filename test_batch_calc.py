@@ -0,0 +1,181 @@
+"""Tests for batch_calc – headless batch CLI."""
+
+import io
+import json
+import math
+
+import pytest
+
+import batch_calc
+
+PIR = {"modus": "Materiaallijst", "categorie": "isolatie", "materiaal": "PIR", "dikte": 0.1}
+
+
+def _write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def _no_prefs(tmp_path):
+    """CLI option so main() reads a fresh preferences file, not the user's."""
+    return ["--config", str(tmp_path / "prefs.json")]
+
+
+def _jsonl(out):
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+class TestBatchCalc:
+    def test_jsonl_constructions_and_scenarios(self, tmp_path):
+        src = _write(
+            tmp_path,
+            "in.jsonl",
+            json.dumps({"id": "gevel", "lagen": [PIR]}) + "\n\n"
+            + json.dumps({"scenario": "Grond", "gr_grondwater": "Ja", "gr_gwdiepte_idx": 1})
+            + "\n",
+        )
+        out = io.StringIO()
+        assert tuple(batch_calc.run([src], out))[:2] == (2, 0)
+        con, scen = _jsonl(out)
+        assert con["id"] == "gevel"
+        assert con["type"] == "constructie"
+        assert math.isclose(con["rc"], 0.1 / 0.022)
+        assert math.isclose(con["u"], 1 / (0.13 + con["rc"] + 0.04))
+        assert scen["id"] == 2
+        assert scen["f_gw"] == 1.15
+
+    def test_errors_do_not_stop_stream(self, tmp_path):
+        src = _write(
+            tmp_path,
+            "in.jsonl",
+            "geen json\n" + json.dumps({"x": 1}) + "\n" + json.dumps({"lagen": [PIR]}) + "\n",
+        )
+        out = io.StringIO()
+        assert tuple(batch_calc.run([src], out))[:2] == (3, 2)
+        results = _jsonl(out)
+        assert "JSONDecodeError" in results[0]["error"]
+        assert "error" in results[1]
+        assert results[2]["type"] == "constructie"
+
+    def test_uwr_and_cfr_files(self, tmp_path):
+        uwr = _write(
+            tmp_path,
+            "gevel.uwr",
+            json.dumps({"ri": "Binnenzijde  —  Ri = 0,13 m²·K/W", "re": 0.1, "lagen": [PIR]}),
+        )
+        cfr = _write(tmp_path, "kelder.cfr", json.dumps({"scenario": "Buitenlucht"}))
+        out = io.StringIO()
+        batch_calc.run([uwr, cfr], out)
+        con, scen = _jsonl(out)
+        assert math.isclose(con["u"], 1 / (0.13 + 0.1 / 0.022 + 0.1))
+        assert scen["f_k"] == 1.0
+
+    def test_csv_layers_grouped_by_id(self, tmp_path):
+        src = _write(
+            tmp_path,
+            "lagen.csv",
+            "id,categorie,materiaal,dikte\n"
+            "w1,isolatie,PIR,0.1\n"
+            "w1,isolatie,PIR,0.1\n"
+            "w2,isolatie,PIR,0.1\n",
+        )
+        out = io.StringIO()
+        batch_calc.run([src], out)
+        w1, w2 = _jsonl(out)
+        assert (w1["id"], w2["id"]) == ("w1", "w2")
+        assert math.isclose(w1["rc"], 2 * w2["rc"])
+
+    def test_csv_bad_value_fails_only_its_record(self, tmp_path):
+        layers = _write(
+            tmp_path,
+            "lagen.csv",
+            "id,categorie,materiaal,dikte\n"
+            "w1,isolatie,PIR,0.1\n"
+            "w2,isolatie,PIR,abc\n"
+            "w3,isolatie,PIR,0.1\n",
+        )
+        scenarios = _write(
+            tmp_path,
+            "sc.csv",
+            "id,scenario,theta_i\n"
+            "s1,Buitenlucht,20\n"
+            "s2,Buitenlucht,twintig\n"
+            "s3,Buitenlucht,20\n",
+        )
+        for workers in (1, 2):
+            out = io.StringIO()
+            assert tuple(batch_calc.run([layers, scenarios], out, workers=workers))[:2] == (6, 2)
+            results = _jsonl(out)
+            assert [r["id"] for r in results] == ["w1", 2, "w3", "s1", 5, "s3"]
+            assert "ValueError" in results[1]["error"] and "ValueError" in results[4]["error"]
+            assert "error" not in results[2] and "error" not in results[5]
+
+    def test_csv_scenarios_and_csv_output(self, tmp_path):
+        src = _write(
+            tmp_path,
+            "sc.csv",
+            "id,scenario,theta_i,bl_bouwdeel,bl_heated\n"
+            "s1,Buitenlucht,20,Buitenwand,ja\n"
+            "s2,Buitenlucht,20,Buitenwand,nee\n",
+        )
+        out = io.StringIO()
+        batch_calc.run([src], out, fmt="csv")
+        lines = out.getvalue().splitlines()
+        assert lines[0] == ",".join(batch_calc.CSV_COLUMNS)
+        assert lines[1].startswith("s1,scenario,Buitenlucht,,,0.0,")
+        assert lines[2].startswith("s2,scenario,Buitenlucht,,,1.0,")
+
+    def test_main_writes_output_file(self, tmp_path):
+        src = _write(tmp_path, "in.jsonl", json.dumps({"lagen": [PIR]}) + "\n")
+        dst = tmp_path / "uit.csv"
+        assert batch_calc.main([src, "-o", str(dst), *_no_prefs(tmp_path)]) == 0
+        assert dst.read_text(encoding="utf-8").startswith("id,type,")
+
+    def test_main_exit_status_on_errors(self, tmp_path, capsys):
+        src = _write(tmp_path, "in.jsonl", json.dumps({"scenario": "Onbekend"}) + "\n")
+        assert batch_calc.main([src, *_no_prefs(tmp_path)]) == 1
+        assert "error" in json.loads(capsys.readouterr().out)
+
+    def test_invalid_json_document(self, tmp_path):
+        src = _write(tmp_path, "kapot.uwr", "{")
+        out = io.StringIO()
+        assert tuple(batch_calc.run([src], out))[:2] == (1, 1)
+        assert _jsonl(out)[0]["id"] == src
+
+
+class TestParallel:
+    RECORDS = [{"lagen": [dict(PIR, dikte=0.01 * (i % 7 + 1))]} for i in range(50)] + [
+        {"scenario": "Grond"},
+        {"scenario": "Onbekend"},
+    ]
+
+    def _items(self):
+        return list(enumerate(self.RECORDS, 1))
+
+    def test_ordered_matches_serial(self):
+        serial = [batch_calc.evaluate_item(n, r) for n, r in self._items()]
+        parallel = list(batch_calc.evaluate_parallel(self._items(), workers=2, chunk_size=7))
+        assert parallel == serial
+
+    def test_unordered_returns_every_result(self):
+        parallel = batch_calc.evaluate_parallel(
+            self._items(), workers=2, chunk_size=5, ordered=False
+        )
+        assert sorted(r["id"] for r in parallel) == list(range(1, len(self.RECORDS) + 1))
+
+    def test_invalid_chunk_size(self):
+        with pytest.raises(ValueError):
+            list(batch_calc.evaluate_parallel(self._items(), workers=2, chunk_size=0))
+
+    def test_main_with_workers_reports_stats(self, tmp_path, capsys):
+        src = _write(tmp_path, "in.jsonl", "".join(json.dumps(r) + "\n" for r in self.RECORDS))
+        assert batch_calc.main([src, "-j", "2", "--chunk-size", "10", "--stats", *_no_prefs(tmp_path)]) == 1
+        captured = capsys.readouterr()
+        assert len(captured.out.splitlines()) == len(self.RECORDS)
+        assert "records/s" in captured.err
+
+    def test_stats(self):
+        stats = batch_calc.BatchStats(100, 1, 0.5)
+        assert stats.records_per_second == 200
+        assert "1 fouten" in str(stats)
@@ -0,0 +1,47 @@
+"""Tests for benchmark – hot-path timings and baseline comparison."""
+
+import fk_calc
+from benchmark import (
+    BASELINE_PATH,
+    FK_CASES,
+    cases,
+    compare,
+    generate_stacks,
+    load_report,
+    run_benchmarks,
+)
+
+
+def _report(**us):
+    return {"results": {name: {"us_per_op": v} for name, v in us.items()}}
+
+
+class TestBenchmark:
+    def test_every_calc_function_is_covered(self):
+        covered = {func for _name, func, _kwargs in FK_CASES}
+        public = {n for n in dir(fk_calc) if n.startswith("calc_") and not n.endswith("_batch")}
+        assert public | {"get_delta_theta", "get_theta_i"} <= covered
+
+    def test_fk_cases_run(self):
+        for _name, func, kwargs in FK_CASES:
+            getattr(fk_calc, func)(**kwargs)
+
+    def test_generate_stacks(self):
+        stacks = generate_stacks(5, 3)
+        assert len(stacks) == 3 and all(len(s) == 5 for s in stacks)
+        assert stacks == generate_stacks(5, 3)
+        assert all(0 < layer["dikte"] <= 0.3 for s in stacks for layer in s)
+
+    def test_run_subset(self):
+        report = run_benchmarks("u_value[L=10,M=100]", repeat=1, min_time=0.001)
+        (result,) = report["results"].values()
+        assert result["ops"] == 100 and result["us_per_op"] > 0
+        assert "python" in report["meta"]
+
+    def test_compare_flags_regressions(self):
+        rows = compare(_report(a=1.3, b=1.2, c=5.0), _report(a=1.0, b=1.0), threshold=0.25)
+        assert [(r.name, r.regression) for r in rows] == [("a", True), ("b", False)]
+
+    def test_baseline_covers_all_cases(self):
+        baseline = load_report(BASELINE_PATH)
+        assert {case.name for case in cases()} == set(baseline["results"])
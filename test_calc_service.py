@@ -0,0 +1,155 @@
+"""Tests for calc_service and loadgen – local HTTP service with coalescing."""
+
+import asyncio
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+import fk_calc
+from calc_service import MAX_BODY, CalcService, Coalescer, fk_items, u_value_items
+from loadgen import Client, percentile, run_load
+
+PIR = {"modus": "Materiaallijst", "categorie": "isolatie", "materiaal": "PIR", "dikte": 0.1}
+
+
+def _serve(coro_fn, window=0.01):
+    """Run *coro_fn(service, port)* against a service on a free localhost port."""
+
+    async def main():
+        with ThreadPoolExecutor(2) as executor:
+            service = CalcService(executor, window=window)
+            server = await service.start("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                return await coro_fn(service, port)
+
+    return asyncio.run(main())
+
+
+class TestBatchFunctions:
+    def test_u_value_items_isolates_bad_records(self):
+        outcomes = u_value_items([{"lagen": [PIR]}, {"lagen": 5}, {"lagen": [PIR], "re": 0.1}])
+        assert outcomes[0][0] and outcomes[2][0]
+        assert not outcomes[1][0]
+        assert math.isclose(outcomes[0][1]["u"], 1 / (0.13 + 0.1 / 0.022 + 0.04))
+        assert math.isclose(outcomes[2][1]["u"], 1 / (0.13 + 0.1 / 0.022 + 0.1))
+
+    def test_fk_items_match_scalar(self):
+        kwargs = [
+            {"bouwdeel": "plat_dak", "theta_i": t, "theta_e": -10.0,
+             "heating_system_id": "radiatoren_lt"}
+            for t in (18.0, 20.0, 22.0)
+        ] + [{"bouwdeel": "plat_dak", "theta_i": 20.0}]
+        outcomes = fk_items("calc_f_k_buitenlucht", kwargs)
+        for kw, (ok, result) in zip(kwargs[:3], outcomes):
+            assert ok
+            assert math.isclose(result["value"], fk_calc.calc_f_k_buitenlucht(**kw))
+        assert not outcomes[3][0]
+        assert "heating_system_id" in outcomes[3][1]
+
+    def test_fk_items_without_batch_variant(self):
+        ((ok, result),) = fk_items(
+            "calc_f_k_onverwarmd_onbekend_tijdconstante", [{"aangrenzende_ruimte": "kelder"}]
+        )
+        assert ok
+        assert result["value"] == 0.5
+
+
+class TestService:
+    def test_requests_are_coalesced(self):
+        async def scenario(service, port):
+            clients = [Client("127.0.0.1", port) for _ in range(20)]
+            replies = await asyncio.gather(
+                *(c.request("POST", "/u-value", {"lagen": [PIR]}) for c in clients)
+            )
+            for c in clients:
+                await c.close()
+            return replies, service.stats()["/u-value"]
+
+        replies, stats = _serve(scenario, window=0.05)
+        assert all(status == 200 for status, _ in replies)
+        assert stats["requests"] == 20
+        assert stats["batches"] < 20
+
+    def test_status_codes(self):
+        async def scenario(service, port):
+            client = Client("127.0.0.1", port)
+            try:
+                return [
+                    await client.request("GET", "/health"),
+                    await client.request("POST", "/fk/bestaat_niet", {}),
+                    await client.request("POST", "/scenario", [1]),
+                    await client.request("POST", "/scenario", {"scenario": "Onbekend"}),
+                    await client.request("POST", "/fk/calc_u_equiv_k", {"r_c": 3.0}),
+                    await client.request("DELETE", "/u-value"),
+                ]
+            finally:
+                await client.close()
+
+        replies = _serve(scenario)
+        assert [status for status, _ in replies] == [200, 404, 400, 422, 200, 405]
+        assert replies[4][1]["value"] == fk_calc.calc_u_equiv_k(3.0)
+
+    def test_loadgen_reports_latency(self):
+        async def scenario(service, port):
+            return await run_load("127.0.0.1", port, requests=60, concurrency=6)
+
+        report = _serve(scenario, window=0.001)
+        assert report["requests"] == 60
+        assert report["failures"] == 0
+        assert 0 < report["p50_ms"] <= report["p99_ms"]
+
+    def test_loadgen_without_requests_reports_zeros(self):
+        async def scenario(service, port):
+            return await run_load("127.0.0.1", port, requests=0, concurrency=2)
+
+        report = _serve(scenario)
+        assert report["requests"] == 0
+        assert report["p50_ms"] == report["p99_ms"] == report["mean_ms"] == 0.0
+
+    def test_client_closes_on_connection_close(self):
+        async def scenario(service, port):
+            client = Client("127.0.0.1", port)
+            await client.request("GET", "/health")
+            writer = client.writer
+            status, _ = await client.request("POST", "/u-value", "x" * (MAX_BODY + 1))
+            closed = client.writer is None and writer.is_closing()
+            again, _ = await client.request("GET", "/health")   # reconnects
+            await client.close()
+            return status, closed, again
+
+        assert _serve(scenario) == (413, True, 200)
+
+
+class TestCoalescer:
+    def test_max_batch_flushes_immediately(self):
+        async def main():
+            coalescer = Coalescer(
+                lambda items: [(True, len(items))] * len(items), window=10.0, max_batch=3
+            )
+            results = await asyncio.gather(*(coalescer.submit(i) for i in range(3)))
+            return results, coalescer
+
+        results, coalescer = asyncio.run(main())
+        assert results == [(True, 3)] * 3
+        assert coalescer.batches == 1
+
+    def test_running_batches_are_referenced(self):
+        seen = []
+
+        async def main():
+            def batch(items):
+                seen.append(len(coalescer._tasks))
+                return [(True, None)] * len(items)
+
+            coalescer = Coalescer(batch, window=0.0)
+            await asyncio.gather(*(coalescer.submit(i) for i in range(2)))
+            await asyncio.sleep(0)
+            return coalescer
+
+        coalescer = asyncio.run(main())
+        assert seen == [1]
+        assert not coalescer._tasks
+
+    def test_percentile(self):
+        assert percentile([1, 2, 3, 4], 50) == 2
+        assert percentile(list(range(1, 101)), 99) == 99
@@ -0,0 +1,83 @@
+"""Tests for app.compute_worker – background jobs where the newest input wins."""
+
+import os
+import threading
+
+import pytest
+
+pytest.importorskip("PyQt5")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QThreadPool  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from app.compute_worker import ComputeWorker  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def worker(qapp):
+    pool = QThreadPool()
+    w = ComputeWorker(pool)
+    events = []
+    w.finished.connect(lambda key, gen, result: events.append(("finished", key, gen, result)))
+    w.failed.connect(lambda key, gen, exc: events.append(("failed", key, gen, type(exc))))
+    yield w, events
+    w.wait()
+    pool.waitForDone()
+
+
+class TestComputeWorker:
+    def test_result_delivered_in_gui_thread(self, worker):
+        w, events = worker
+        threads = []
+        w.finished.connect(lambda *_: threads.append(threading.current_thread()))
+        assert w.submit("a", sum, [1, 2, 3]) == 1
+        assert w.wait()
+        assert events == [("finished", "a", 1, 6)]
+        assert threads == [threading.main_thread()]
+
+    def test_newer_input_supersedes_running_and_queued(self, worker):
+        w, events = worker
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def job(x):
+            calls.append(x)
+            if x == 1:
+                started.set()
+                release.wait(5)
+            return x
+
+        w.submit("a", job, 1)
+        assert started.wait(5)
+        w.submit("a", job, 2)
+        w.submit("a", job, 3)
+        assert w.is_busy("a")
+        release.set()
+        assert w.wait()
+        assert calls == [1, 3]
+        assert events == [("finished", "a", 3, 3)]
+
+    def test_keys_are_independent(self, worker):
+        w, events = worker
+        w.submit("a", str, 1)
+        w.submit("b", str, 2)
+        assert w.wait()
+        assert sorted(events) == [("finished", "a", 1, "1"), ("finished", "b", 1, "2")]
+
+    def test_failure_and_cancel(self, worker):
+        w, events = worker
+        w.submit("a", int, "geen getal")
+        assert w.wait()
+        assert events == [("failed", "a", 1, ValueError)]
+        events.clear()
+        gen = w.submit("a", str, 1)
+        w.cancel("a")
+        assert not w.is_current("a", gen)
+        assert w.wait()
+        assert events == []
@@ -1,6 +1,8 @@
 """Tests for fk_calc – correction-factor calculator."""
 
 import math
+
+import numpy as np
 import pytest
 
 import fk_calc
@@ -409,6 +411,11 @@ class TestGrondwaterfactor:
 
     def test_unknown(self):
         assert fk_calc.calc_f_gw(None) == 1.15
+        assert fk_calc.calc_f_gw(math.nan) == 1.15
+
+    def test_infinite_depth(self):
+        assert fk_calc.calc_f_gw(math.inf) == 1.00
+        assert fk_calc.calc_f_gw(-math.inf) == 1.15
 
 
 class TestFigk:
@@ -458,6 +465,14 @@ class TestUEquivK:
     def test_rc_boundary_25(self):
         assert fk_calc.calc_u_equiv_k(2.5) == 0.30
 
+    def test_infinite_rc(self):
+        assert fk_calc.calc_u_equiv_k(math.inf) == 0.13
+        assert fk_calc.calc_u_equiv_k(-math.inf) == 0.50
+
+    def test_nan_rc_raises(self):
+        with pytest.raises(ValueError):
+            fk_calc.calc_u_equiv_k(math.nan)
+
 
 class TestHTig:
     def test_basic(self):
@@ -480,3 +495,90 @@ class TestConstants:
 
     def test_default_theta_me(self):
         assert fk_calc.DEFAULT_THETA_ME == 10.5
+
+
+# ── Batch variants ────────────────────────────────────────────────────────────
+
+
+class TestBatchVariants:
+    def test_buitenlucht_matches_scalar(self):
+        bouwdelen = ["buitenwand", "schuin_dak", "vloer_boven_buitenlucht", "plat_dak"]
+        f, err = fk_calc.calc_f_k_buitenlucht_batch(
+            bouwdelen, 22, -10, "gashaard_gevelkachel"
+        )
+        assert (err == fk_calc.ERR_OK).all()
+        for i, bd in enumerate(bouwdelen):
+            expected = fk_calc.calc_f_k_buitenlucht(bd, 22, -10, "gashaard_gevelkachel")
+            assert math.isclose(f[i], expected, rel_tol=1e-9)
+
+    def test_errors_instead_of_raising(self):
+        f, err = fk_calc.calc_f_k_buitenlucht_batch(
+            ["plat_dak", "plat_dak", "plat_dak", "kelder"],
+            [22, 10, 22, 22],
+            [-10, 10, -10, -10],
+            ["radiatoren_lt", "radiatoren_lt", "onbekend", "radiatoren_lt"],
+        )
+        assert list(err) == [
+            fk_calc.ERR_OK,
+            fk_calc.ERR_EQUAL_TEMPERATURES,
+            fk_calc.ERR_UNKNOWN_HEATING_SYSTEM,
+            fk_calc.ERR_UNKNOWN_BOUWDEEL,
+        ]
+        assert not math.isnan(f[0])
+        assert np.isnan(f[1:]).all()
+
+    def test_missing_heating_system(self):
+        _f, err = fk_calc.calc_f_ig_k_batch(["wand", "vloer"], 22, -10, 10.5)
+        assert list(err) == [fk_calc.ERR_OK, fk_calc.ERR_MISSING_HEATING_SYSTEM]
+
+    def test_non_string_ids_become_error_codes(self):
+        bouwdeel = np.array(["buitenwand", None, np.nan, 3, "plat_dak", "plat_dak"], dtype=object)
+        hs = np.array(["radiatoren_lt"] * 4 + [np.nan, 7], dtype=object)
+        f, err = fk_calc.calc_f_k_buitenlucht_batch(bouwdeel, 20, -10, hs)
+        assert list(err) == [fk_calc.ERR_OK] + [fk_calc.ERR_UNKNOWN_BOUWDEEL] * 3 + [
+            fk_calc.ERR_MISSING_HEATING_SYSTEM, fk_calc.ERR_UNKNOWN_HEATING_SYSTEM]
+        assert f[0] == 1.0 and np.isnan(f[1:]).all()
+        _f, err = fk_calc.calc_f_k_buitenlucht_batch(["wand", None, np.nan], 20, -10, "radiatoren_lt")
+        assert (err == fk_calc.ERR_UNKNOWN_BOUWDEEL).all()
+
+    def test_heated_surface_is_zero(self):
+        f, err = fk_calc.calc_f_ia_k_aangrenzend_gebouw_batch(
+            "vloer", 22, -10, 20, None, [True, False]
+        )
+        assert f[0] == 0.0 and err[0] == fk_calc.ERR_OK
+        assert err[1] == fk_calc.ERR_MISSING_HEATING_SYSTEM
+
+    def test_verwarmde_ruimte_matches_scalar(self):
+        f, err = fk_calc.calc_f_ia_k_verwarmde_ruimte_batch(
+            np.array(["wand", "vloer", "plafond"]),
+            22, -10, 18, "radiatoren_lt", "radiatoren_lt",
+        )
+        assert (err == fk_calc.ERR_OK).all()
+        assert np.allclose(f, [4 / 32, 1 / 32, 7 / 32])
+
+    def test_onverwarmd_bekend_array_temperatures(self):
+        theta_i = np.array([22.0, 20.0, 18.0])
+        f, _err = fk_calc.calc_f_k_onverwarmd_bekend_batch("wand", theta_i, -10, 5)
+        assert np.allclose(f, (theta_i - 5) / (theta_i + 10))
+
+    def test_scalar_inputs_return_0d(self):
+        f, err = fk_calc.calc_f_ig_k_batch("wand", 22)
+        assert f.shape == () and math.isclose(float(f), 11.5 / 32)
+        assert int(err) == fk_calc.ERR_OK
+
+    def test_u_equiv_k_matches_scalar(self):
+        r_c = np.array([1.0, 2.5, 3.0, 3.5, 4.9, 5.0, 8.0])
+        u, err = fk_calc.calc_u_equiv_k_batch(r_c)
+        assert (err == fk_calc.ERR_OK).all()
+        assert list(u) == [fk_calc.calc_u_equiv_k(r) for r in r_c]
+
+    def test_f_gw_unknown_depth(self):
+        f, err = fk_calc.calc_f_gw_batch([2.0, 1.0, 0.5, np.nan])
+        assert list(f) == [1.00, 1.00, 1.15, 1.15]
+        assert (err == fk_calc.ERR_OK).all()
+
+    def test_h_t_ig(self):
+        h, err = fk_calc.calc_h_t_ig_batch(10, [6.0, 2.0, np.nan], 0.36, [1.0, 1.15, 1.0])
+        assert math.isclose(h[0], 10 * 0.13 * 0.36)
+        assert math.isclose(h[1], 10 * 0.50 * 0.36 * 1.15)
+        assert err[2] == fk_calc.ERR_OUT_OF_RANGE
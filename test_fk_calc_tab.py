@@ -0,0 +1,116 @@
+"""Tests for app.fk_calc_tab – transactional state restore and background
+computation in the correctiefactoren tab."""
+
+import os
+
+import pytest
+
+pytest.importorskip("PyQt5")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from app import fk_calc_tab  # noqa: E402
+from app.config import Config  # noqa: E402
+from app.fk_calc_tab import FkCalcTab  # noqa: E402
+from fk_scenarios import evaluate_state  # noqa: E402
+
+GROUND = {
+    "scenario": "Grond", "theta_i": 20.0, "theta_e": -10.0, "gr_bouwdeel": "Vloer",
+    "gr_grondwater": "Ja", "gr_gwdiepte_idx": 0, "gr_rc": 4.0, "gr_area": 60.0,
+}
+OUTSIDE = {"scenario": "Buitenlucht", "theta_i": 20.0, "theta_e": -10.0, "bl_bouwdeel": "Plat dak"}
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def counted_tab(qapp, tmp_path, monkeypatch):
+    """A tab whose relayouts and computations are counted (patched before the
+    signals are connected)."""
+    counts = {"layout": 0, "compute": 0}
+    layout, evaluate = FkCalcTab._on_scenario_change, fk_calc_tab.evaluate_state
+
+    def counted_layout(self, _=None):
+        counts["layout"] += 1
+        layout(self)
+
+    def counted_evaluate(state):
+        counts["compute"] += 1
+        return evaluate(state)
+
+    monkeypatch.setattr(FkCalcTab, "_on_scenario_change", counted_layout)
+    monkeypatch.setattr(fk_calc_tab, "evaluate_state", counted_evaluate)
+    tab = FkCalcTab(Config(str(tmp_path / "prefs.json")))
+    assert tab.worker.wait()
+    counts.update(layout=0, compute=0)
+    yield tab, counts
+    tab.worker.wait()
+    tab.deleteLater()
+
+
+class TestStateRestore:
+    def test_set_state_relayouts_and_computes_once(self, counted_tab):
+        tab, counts = counted_tab
+        tab._set_state(GROUND)
+        assert tab.worker.wait()
+        assert counts == {"layout": 1, "compute": 1}
+        assert tab._get_state()["gr_grondwater"] == "Ja"
+        assert tab.gr_gwdiepte.isVisibleTo(tab)
+        assert tab.result_model.rows() == [
+            (f.label, f.formatted()) for f in evaluate_state(tab._get_state())
+        ]
+
+    def test_evaluate_states_in_sequence(self, counted_tab):
+        tab, counts = counted_tab
+        before = tab._get_state()
+        invalid = {"scenario": "Aangrenzend gebouw", "theta_i": 10.0, "theta_e": 10.0}
+        results = tab.evaluate_states([GROUND, OUTSIDE, invalid])
+        assert counts == {"layout": 0, "compute": 3}
+        assert tab._get_state() == before
+        assert [f.key for f in results[0]] == [f.key for f in evaluate_state(GROUND)]
+        assert results[1] == evaluate_state({**before, **OUTSIDE})
+        assert isinstance(results[2], ValueError)
+
+
+class TestBackgroundCompute:
+    def test_only_latest_input_is_shown(self, counted_tab):
+        tab, counts = counted_tab
+        tab._set_state(GROUND)
+        for rc in (1.0, 2.0, 3.0, 5.0):
+            tab.gr_rc.setValue(rc)
+        assert tab.worker.wait()
+        # the running job finishes, intermediate inputs are never computed
+        assert counts["compute"] <= 2
+        assert tab.result_model.rows() == [
+            (f.label, f.formatted()) for f in evaluate_state(tab._get_state())
+        ]
+
+    def test_error_from_worker_is_shown(self, counted_tab):
+        tab, _ = counted_tab
+        tab._set_state({"scenario": "Aangrenzend gebouw", "theta_i": 10.0, "theta_e": 10.0})
+        assert tab.worker.wait()
+        assert tab.error_label.text().startswith("⚠")
+        assert tab.result_model.rowCount() == 0
+
+
+class TestLazyPages:
+    def test_pages_built_on_first_use(self, counted_tab):
+        tab, _ = counted_tab
+        assert tab.pages.count() == 1
+        tab.scenario_dd.setCurrentText("Grond")
+        tab.scenario_dd.setCurrentText("Buitenlucht")
+        tab.scenario_dd.setCurrentText("Grond")
+        assert tab.pages.count() == 2
+        assert tab.pages.currentWidget() is tab._pages["Grond"]
+
+    def test_values_for_unbuilt_pages_are_kept(self, counted_tab):
+        tab, _ = counted_tab
+        tab._set_state({**GROUND, "ag_theta_b": 3.0})
+        assert "Aangrenzend gebouw" not in tab._pages
+        assert tab._get_state()["ag_theta_b"] == 3.0
+        tab.scenario_dd.setCurrentText("Aangrenzend gebouw")
+        assert tab.ag_theta_b.value() == 3.0
@@ -0,0 +1,53 @@
+"""Tests for fk_scenarios – .cfr state evaluation shared by GUI and CLI."""
+
+import pytest
+
+import fk_calc
+from fk_scenarios import DEFAULT_STATE, GW_OPTIONS, SCENARIOS, evaluate_state
+
+
+class TestEvaluateState:
+    @pytest.mark.parametrize("scenario", SCENARIOS)
+    def test_defaults_evaluate(self, scenario):
+        factors = evaluate_state({"scenario": scenario})
+        assert factors
+        assert all(isinstance(f.value, float) for f in factors)
+
+    def test_buitenlucht_matches_fk_calc(self):
+        (f,) = evaluate_state(
+            {"scenario": "Buitenlucht", "theta_i": 20.0, "bl_bouwdeel": "Plat dak",
+             "bl_hs": "Plafondverwarming"}
+        )
+        assert f.key == "f_k"
+        assert f.value == fk_calc.calc_f_k_buitenlucht("plat_dak", 20.0, -10.0, "plafondverwarming")
+        assert f.formatted() == f"{f.value:.4f}"
+
+    def test_grond_returns_f_ig_and_f_gw(self):
+        factors = evaluate_state(
+            {"scenario": "Grond", "gr_grondwater": "Ja", "gr_gwdiepte_idx": 1}
+        )
+        assert [f.key for f in factors] == ["f_ig_k", "f_gw"]
+        assert factors[1].value == GW_OPTIONS[1][1]
+
+    def test_onbekend_vertrek_uses_gevel_index(self):
+        (f,) = evaluate_state(
+            {"scenario": "Onverwarmde ruimte – onbekende temperatuur", "oo_gevels_idx": 2}
+        )
+        assert f.label == "f_k (Tabel 2.3)"
+        assert f.value == fk_calc.calc_f_k_onverwarmd_onbekend_warmteverlies(
+            "vertrek", aantal_externe_gevels=2, buitendeur_aanwezig=True
+        )
+
+    def test_invalid_input(self):
+        with pytest.raises(ValueError):
+            evaluate_state({"scenario": "Onbekend"})
+        with pytest.raises(ValueError):
+            evaluate_state({"scenario": "Grond", "gr_grondwater": "Ja", "gr_gwdiepte_idx": 5})
+        with pytest.raises(KeyError):
+            evaluate_state({"scenario": "Buitenlucht", "bl_bouwdeel": "Dak"})
+
+    def test_state_is_not_modified(self):
+        state = {"scenario": "Grond"}
+        evaluate_state(state)
+        assert state == {"scenario": "Grond"}
+        assert DEFAULT_STATE["scenario"] == SCENARIOS[0]
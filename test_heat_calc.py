@@ -0,0 +1,265 @@
+"""Tests for heat_calc – U-value helpers and the batch engine."""
+
+import json
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+
+import heat_calc
+
+with open(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "material_properties.json"),
+    "r",
+    encoding="utf-8",
+) as _fh:
+    MATERIALS = json.load(_fh)
+
+
+def _layer(cat, sub, d=0.1, third=None):
+    return {
+        "modus": "Materiaallijst",
+        "categorie": cat,
+        "materiaal": sub,
+        "subtype": third,
+        "dikte": d,
+        "handmatige_r": 0.1,
+    }
+
+
+# ── Scalar helpers ────────────────────────────────────────────────────────────
+
+
+class TestLayerR:
+    def test_lambda_layer(self):
+        # PIR λ = [0.022, 0.026] → lowest 0.022 → 0.1 / 0.022
+        val = heat_calc.raw_value(MATERIALS, "isolatie", "PIR")
+        assert math.isclose(heat_calc.layer_r("isolatie", val, 0.1), 0.1 / 0.022)
+
+    def test_u_value_layer(self):
+        val = heat_calc.raw_value(MATERIALS, "glas", "HR++", "hout_kunststof")
+        assert math.isclose(heat_calc.layer_r("glas", val, 0.0), 1 / 1.5)
+
+    def test_r_value_layer(self):
+        val = heat_calc.raw_value(MATERIALS, "vloeren", "vanaf_2021")
+        assert heat_calc.layer_r("vloeren", val, 0.0) == 3.7
+
+    def test_zero_thickness_is_none(self):
+        val = heat_calc.raw_value(MATERIALS, "beton", "gewapend_beton")
+        assert heat_calc.layer_r("beton", val, 0.0) is None
+
+
+class TestSurfaceR:
+    def test_label_number_and_default(self):
+        label = next(iter(heat_calc.SURFACE_R))
+        assert heat_calc.surface_r(label, 0.04) == heat_calc.SURFACE_R[label]
+        assert heat_calc.surface_r("0.1", 0.13) == 0.1
+        assert heat_calc.surface_r(None, 0.13) == heat_calc.surface_r("", 0.13) == 0.13
+        with pytest.raises(ValueError):
+            heat_calc.surface_r("onbekend", 0.13)
+
+
+# ── Batch engine ──────────────────────────────────────────────────────────────
+
+
+class TestBatch:
+    def test_matches_scalar_rules(self):
+        constructions = [
+            [_layer("stenen", "kalkzandsteen", 0.1), _layer("isolatie", "PIR", 0.12)],
+            [_layer("glas", "HR++", third="hout_kunststof")],
+            [_layer("vloeren", "vanaf_2021"), _layer("beton", "gewapend_beton", 0.2)],
+        ]
+        values, thickness, kinds = heat_calc.pack_constructions(MATERIALS, constructions)
+        assert values.shape == (3, 2)
+        assert kinds[1, 1] == heat_calc.LAYER_EMPTY
+
+        rc, u = heat_calc.u_value_batch(values, thickness, kinds)
+        for i, layers in enumerate(constructions):
+            expected_rc = sum(
+                heat_calc.layer_r(
+                    lay["categorie"],
+                    heat_calc.raw_value(
+                        MATERIALS, lay["categorie"], lay["materiaal"], lay["subtype"]
+                    ),
+                    lay["dikte"],
+                )
+                for lay in layers
+            )
+            assert math.isclose(rc[i], expected_rc)
+            assert math.isclose(u[i], 1 / (0.13 + expected_rc + 0.04))
+
+    def test_manual_r(self):
+        layers = [{"modus": "Handmatige R", "handmatige_r": 0.18}]
+        rc, _u = heat_calc.u_value_batch(*heat_calc.pack_constructions(MATERIALS, [layers]))
+        assert math.isclose(rc[0], 0.18)
+
+    def test_undetermined_layer_counts_as_zero(self):
+        layers = [_layer("beton", "gewapend_beton", 0.0), _layer("isolatie", "PIR", 0.1)]
+        rc, _u = heat_calc.u_value_batch(*heat_calc.pack_constructions(MATERIALS, [layers]))
+        assert math.isclose(rc[0], 0.1 / 0.022)
+
+    def test_per_construction_surface_resistances(self):
+        values = np.array([[0.04], [0.04]])
+        thickness = np.array([[0.1], [0.1]])
+        kinds = np.full((2, 1), heat_calc.LAYER_LAMBDA, dtype=np.int8)
+        _rc, u = heat_calc.u_value_batch(
+            values, thickness, kinds, ri=np.array([0.13, 0.10]), re=0.04
+        )
+        assert math.isclose(u[0], 1 / 2.67)
+        assert math.isclose(u[1], 1 / 2.64)
+
+    def test_empty_batch(self):
+        rc, u = heat_calc.u_value_batch(*heat_calc.pack_constructions(MATERIALS, []))
+        assert rc.shape == (0,)
+        assert u.shape == (0,)
+
+    def test_non_positive_total_is_nan(self):
+        rc, u = heat_calc.u_value_batch(
+            np.array([[-1.0]]), np.zeros((1, 1)), np.array([[heat_calc.LAYER_R]]),
+        )
+        assert rc[0] == -1.0
+        assert np.isnan(u[0])
+
+    def test_pack_single_lambda_layer(self):
+        layers = [_layer("isolatie", "EPS_geëxpandeerd_polystyreen", 0.1)]
+        values, thickness, kinds = heat_calc.pack_constructions(MATERIALS, [layers])
+        assert values[0, 0] == pytest.approx(0.035)
+        assert thickness[0, 0] == pytest.approx(0.1)
+        assert kinds[0, 0] == heat_calc.LAYER_LAMBDA
+
+
+# ── Interval bounds ──────────────────────────────────────────────────────────
+
+
+class TestBounds:
+    CONSTRUCTIONS = [
+        [_layer("isolatie", "PIR", 0.1), _layer("stenen", "kalkzandsteen", 0.1)],
+        [{"modus": "Handmatige R", "handmatige_r": 2.0}, _layer("glas", "HR++", third="hout_kunststof")],
+        [_layer("beton", "gewapend_beton", 0.0)],
+    ]
+
+    def test_layer_r_bounds(self):
+        assert heat_calc.layer_r_bounds("isolatie", [0.022, 0.026], 0.1) == pytest.approx(
+            (0.1 / 0.026, 0.1 / 0.022)
+        )
+        assert heat_calc.layer_r_bounds("glas", [1.0, 2.0], 0.0) == (0.5, 1.0)
+        assert heat_calc.layer_r_bounds("vloeren", [3.5, 3.7], 0.0) == (3.5, 3.7)
+        assert heat_calc.layer_r_bounds("isolatie", 0.035, 0.1) == pytest.approx((0.1 / 0.035,) * 2)
+        assert heat_calc.layer_r_bounds("isolatie", 0.035, 0.0) is None
+        assert heat_calc.layer_r_bounds("isolatie", None, 0.1) is None
+
+    def test_scalar_matches_batch(self):
+        batch = heat_calc.u_value_bounds_batch(*heat_calc.pack_ranges(MATERIALS, self.CONSTRUCTIONS))
+        for i, layers in enumerate(self.CONSTRUCTIONS):
+            single = heat_calc.construction_bounds(MATERIALS, layers)
+            for field in heat_calc.UBounds._fields:
+                assert getattr(batch, field)[i] == pytest.approx(getattr(single, field))
+
+    def test_bounds_enclose_point_values_and_samples(self):
+        low, high, thickness, kinds = heat_calc.pack_ranges(MATERIALS, self.CONSTRUCTIONS)
+        b = heat_calc.u_value_bounds_batch(low, thickness=thickness, high=high, kinds=kinds)
+        rc, u = heat_calc.u_value_batch(low, thickness, kinds)
+        np.testing.assert_allclose(b.rc_max, rc)
+        np.testing.assert_allclose(b.u_min, u)
+        mc = heat_calc.u_value_monte_carlo(low, high, thickness, kinds, draws=2000)
+        assert np.all(b.u_min <= mc.p5) and np.all(mc.p95 <= b.u_max)
+
+    def test_worst_case_compliance(self):
+        b = heat_calc.construction_bounds(MATERIALS, self.CONSTRUCTIONS[0])
+        assert b.u_min < b.u_max
+        assert b.u_max == pytest.approx(1 / (0.13 + 0.1 / 0.026 + 0.1 / 1.7 + 0.04))
+        assert b.rc_min == pytest.approx(0.1 / 0.026 + 0.1 / 1.7)
+
+    def test_non_positive_total_is_nan(self):
+        b = heat_calc.u_value_bounds_batch(
+            [[-1.0]], [[-1.0]], [[0.0]], [[heat_calc.LAYER_R]]
+        )
+        assert np.isnan(b.u_min[0]) and np.isnan(b.u_max[0])
+
+
+# ── Monte Carlo ──────────────────────────────────────────────────────────────
+
+
+class TestMonteCarlo:
+    CONSTRUCTIONS = [
+        [_layer("isolatie", "PIR", 0.1), _layer("stenen", "kalkzandsteen", 0.1)],
+        [{"modus": "Handmatige R", "handmatige_r": 2.0}],
+        [_layer("isolatie", "XPS_geëxtrudeerd_polystyreen", 0.08), _layer("isolatie", "PUR", 0.05)],
+    ]
+
+    def test_pack_ranges(self):
+        low, high, _t, _k = heat_calc.pack_ranges(MATERIALS, self.CONSTRUCTIONS)
+        assert (low[0, 0], high[0, 0]) == (0.022, 0.026)
+        assert low[1, 0] == high[1, 0] == 2.0
+        values, _thickness, _kinds = heat_calc.pack_constructions(MATERIALS, self.CONSTRUCTIONS)
+        np.testing.assert_array_equal(values, low)
+
+    def test_catalogue_and_dict_agree(self):
+        from material_catalogue import get_catalogue
+
+        a = heat_calc.pack_ranges(MATERIALS, self.CONSTRUCTIONS)
+        b = heat_calc.pack_ranges(get_catalogue(), self.CONSTRUCTIONS)
+        for x, y in zip(a, b):
+            np.testing.assert_array_equal(x, y)
+
+    @pytest.mark.parametrize("distribution", heat_calc.MC_DISTRIBUTIONS)
+    def test_distribution_within_bounds(self, distribution):
+        low, high, thickness, kinds = heat_calc.pack_ranges(MATERIALS, self.CONSTRUCTIONS)
+        mc = heat_calc.u_value_monte_carlo(
+            low, high, thickness, kinds, draws=5000, distribution=distribution
+        )
+        _rc, u_best = heat_calc.u_value_batch(low, thickness, kinds)
+        _rc, u_worst = heat_calc.u_value_batch(high, thickness, kinds)
+        assert np.all(u_best <= mc.p5) and np.all(mc.p5 <= mc.mean)
+        assert np.all(mc.mean <= mc.p95) and np.all(mc.p95 <= u_worst)
+        # a construction without ranges has a point distribution
+        assert mc.std[1] == 0 and mc.p5[1] == mc.p95[1] == u_best[1]
+
+    def test_uniform_mean_of_single_layer(self):
+        # U = 1 / (0.17 + d / λ) with λ ~ U(a, b) has E[U] = ∫ λ / (0.17 λ + d) dλ / (b - a)
+        a, b, d = 0.022, 0.026, 0.1
+        mc = heat_calc.u_value_monte_carlo(
+            [[a]], [[b]], [[d]], [[heat_calc.LAYER_LAMBDA]], draws=200_000
+        )
+        k = 0.17
+        exact = ((b - a) / k - d / k**2 * math.log((k * b + d) / (k * a + d))) / (b - a)
+        assert mc.mean[0] == pytest.approx(exact, rel=1e-3)
+
+    def test_seeded_and_chunked(self):
+        args = heat_calc.pack_ranges(MATERIALS, self.CONSTRUCTIONS * 4)
+        a = heat_calc.u_value_monte_carlo(*args, draws=1000, seed=7)
+        b = heat_calc.u_value_monte_carlo(*args, draws=1000, seed=7)
+        c = heat_calc.u_value_monte_carlo(*args, draws=1000, seed=7, max_elements=1)
+        np.testing.assert_array_equal(a.mean, b.mean)
+        np.testing.assert_allclose(a.mean, c.mean, rtol=0.02)
+
+    def test_invalid_arguments(self):
+        args = heat_calc.pack_ranges(MATERIALS, self.CONSTRUCTIONS)
+        with pytest.raises(ValueError):
+            heat_calc.u_value_monte_carlo(*args, distribution="normaal")
+        with pytest.raises(ValueError):
+            heat_calc.u_value_monte_carlo(*args, draws=0)
+
+
+
+# ── Optional notebook widgets ────────────────────────────────────────────────
+
+
+class TestWidgetDecoupling:
+    def test_helpers_do_not_load_widgets(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "ipywidgets", None)  # block the import
+        monkeypatch.delitem(sys.modules, "heat_calc_widgets", raising=False)
+        assert heat_calc.scalar([0.022, 0.026]) == 0.022
+        assert "heat_calc_widgets" not in sys.modules
+
+    def test_layer_widget_needs_ipywidgets(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "ipywidgets", None)
+        monkeypatch.delitem(sys.modules, "heat_calc_widgets", raising=False)
+        with pytest.raises(ImportError):
+            heat_calc.LayerWidget
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            heat_calc.no_such_name
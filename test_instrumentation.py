@@ -0,0 +1,88 @@
+"""Tests for instrumentation – opt-in timing counters for the hot paths."""
+
+import json
+
+import pytest
+
+import fk_calc
+import heat_calc
+import instrumentation
+import r_cache
+from app.config import Config
+
+
+@pytest.fixture
+def enabled():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+class TestInstrumentation:
+    def test_disabled_installs_nothing(self):
+        original = fk_calc.calc_f_gw
+        instrumentation.enable()
+        assert fk_calc.calc_f_gw is not original
+        instrumentation.disable()
+        assert fk_calc.calc_f_gw is original
+        assert r_cache.layer_r is heat_calc.layer_r
+        assert not hasattr(heat_calc.layer_r, "__instrumented__")
+        assert not instrumentation.is_enabled()
+
+    def test_counts_calls_and_errors(self, enabled):
+        for _ in range(3):
+            fk_calc.calc_f_k_buitenlucht("buitenwand", 20.0, -10.0)
+        with pytest.raises(ValueError):
+            fk_calc.calc_f_k_buitenlucht("onbekend", 20.0, -10.0)
+        snap = instrumentation.snapshot()
+        entry = snap["fk_calc.calc_f_k_buitenlucht"]
+        assert (entry["count"], entry["errors"], entry["kind"]) == (4, 1, "calc")
+        assert 0 < entry["p50_s"] <= entry["p99_s"] <= entry["max_s"] <= entry["total_s"]
+
+    def test_lookups_and_imported_names(self, enabled):
+        fk_calc.calc_u_equiv_k(3.0)
+        r_cache.RValueCache().material_r("isolatie", "PIR", None, 0.1)
+        snap = instrumentation.snapshot()
+        assert snap["fk_calc.calc_u_equiv_k"]["kind"] == "lookup"
+        assert snap["range_table.RangeTable.lookup"]["count"] == 1
+        assert snap["heat_calc.layer_r"]["count"] == 1
+
+    def test_reset_and_merge(self, enabled):
+        fk_calc.calc_f_gw(0.5)
+        state = instrumentation.export_state()
+        instrumentation.reset()
+        assert instrumentation.snapshot() == {}
+        instrumentation.merge_state(state)
+        instrumentation.merge_state(state)
+        assert instrumentation.snapshot()["fk_calc.calc_f_gw"]["count"] == 2
+
+    def test_prometheus_and_json_dump(self, enabled, tmp_path):
+        fk_calc.calc_f_gw(0.5)
+        text = instrumentation.to_prometheus()
+        assert "# TYPE warmtetransmissie_latency_seconds summary" in text
+        assert 'warmtetransmissie_calls_total{function="fk_calc.calc_f_gw",kind="calc"} 1' in text
+        assert 'quantile="0.99"' in text
+        instrumentation.dump(str(tmp_path / "m.prom"))
+        instrumentation.dump(str(tmp_path / "m.json"))
+        assert (tmp_path / "m.prom").read_text(encoding="utf-8") == text
+        data = json.loads((tmp_path / "m.json").read_text(encoding="utf-8"))
+        assert data["fk_calc.calc_f_gw"]["count"] == 1
+
+    def test_config_switch(self, tmp_path):
+        path = tmp_path / "prefs.json"
+        path.write_text(json.dumps({
+            "instrumentation": True, "instrumentation_file": str(tmp_path / "out.json"),
+        }), encoding="utf-8")
+        config = Config(str(path))
+        try:
+            assert config.apply_instrumentation()
+            assert instrumentation.is_enabled()
+            fk_calc.calc_f_gw(0.5)
+            config.dump_instrumentation()
+        finally:
+            instrumentation.disable()
+            instrumentation.reset()
+        assert "fk_calc.calc_f_gw" in json.loads((tmp_path / "out.json").read_text(encoding="utf-8"))
+        assert not Config(str(tmp_path / "missing.json")).apply_instrumentation()
@@ -0,0 +1,59 @@
+"""Tests for app.layer_table – table model behind the large-construction layer view."""
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from app.layer_table import (  # noqa: E402
+    COL_CAT,
+    COL_D,
+    COL_R,
+    COL_THIRD,
+    LayerTableModel,
+    layer_info,
+    normalize_layer,
+)
+from material_catalogue import MaterialCatalogue, get_catalogue  # noqa: E402
+
+SMALL = MaterialCatalogue({
+    "isolatie": {"PIR": 0.023, "EPS": [0.03, 0.04]},
+    "glas": {"HR++": {"hout": 1.5, "kunststof": 1.6}},
+})
+
+
+class TestLayerTable:
+    def test_normalize_falls_back_to_valid_choices(self):
+        data = normalize_layer(SMALL, {"categorie": "onbekend", "dikte": 0.2})
+        assert data == {"modus": "Materiaallijst", "categorie": "isolatie", "materiaal": "PIR",
+                        "subtype": None, "dikte": 0.2, "handmatige_r": 0.1}
+        assert normalize_layer(SMALL, {"categorie": "glas"})["subtype"] == "hout"
+
+    def test_layer_info_matches_formula(self):
+        # R comes from the shared R cache, i.e. the application catalogue
+        info = layer_info(get_catalogue(), {"modus": "Materiaallijst", "categorie": "isolatie",
+                                            "materiaal": "PIR", "dikte": 0.11})
+        assert info["formula"] == "0.110 / 0.0220 = 5.000"
+        assert info["R_bounds"] == pytest.approx((0.11 / 0.026, 5.0))
+        manual = layer_info(SMALL, {"modus": "Handmatige R", "handmatige_r": 2.0})
+        assert (manual["naam"], manual["R"], manual["R_bounds"]) == ("Handmatig", 2.0, (2.0, 2.0))
+
+    def test_edit_cascades_and_signals(self):
+        model = LayerTableModel(SMALL)
+        layer = model.append({"categorie": "isolatie", "materiaal": "PIR", "dikte": 0.1})
+        changed = []
+        model.layerChanged.connect(changed.append)
+        assert not model.setData(model.index(0, COL_D), 0.1)
+        assert model.setData(model.index(0, COL_CAT), "glas")
+        assert layer.to_dict()["materiaal"] == "HR++" and layer.to_dict()["subtype"] == "hout"
+        assert changed == [layer]
+        assert model.options(0, COL_THIRD) == ["hout", "kunststof"]
+        assert not model.flags(model.index(0, COL_R)) & 2   # Qt.ItemIsEditable
+
+    def test_round_trip_and_remove(self):
+        model = LayerTableModel(SMALL)
+        data = {"modus": "Handmatige R", "categorie": "isolatie", "materiaal": "PIR",
+                "subtype": None, "dikte": 0.05, "handmatige_r": 1.25}
+        layer = model.append(data)
+        assert layer.to_dict() == data and layer.get_r() == 1.25
+        model.remove(layer)
+        assert model.rowCount() == 0
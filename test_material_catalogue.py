@@ -0,0 +1,94 @@
+"""Tests for material_catalogue – compiled material database."""
+
+import json
+import math
+import os
+
+import numpy as np
+import pytest
+
+import heat_calc
+from material_catalogue import MATERIALS_PATH, Material, MaterialCatalogue, get_catalogue
+
+with open(MATERIALS_PATH, "r", encoding="utf-8") as _fh:
+    MATERIALS = json.load(_fh)
+
+
+class TestMaterialCatalogue:
+    def test_shared_instance(self):
+        assert get_catalogue() is get_catalogue()
+
+    def test_paths_and_ids_round_trip(self):
+        cat = get_catalogue()
+        assert len(cat) == len(cat.paths)
+        for i, path in enumerate(cat.paths):
+            assert cat.id_by_path[path] == i
+            assert cat.materials[i].path == path
+
+    def test_records_use_slots(self):
+        record = get_catalogue().materials[0]
+        assert isinstance(record, Material)
+        with pytest.raises(AttributeError):
+            record.extra = 1
+
+    def test_range_record(self):
+        m = get_catalogue().find("isolatie", "PIR")
+        assert (m.low, m.high) == (0.022, 0.026)
+        assert m.raw == [0.022, 0.026]
+        assert m.kind == heat_calc.LAYER_LAMBDA
+
+    def test_three_level_record(self):
+        m = get_catalogue().find("glas", "HR++", "hout_kunststof")
+        assert m.raw == 1.5
+        assert m.high is None
+        assert m.kind == heat_calc.LAYER_U
+
+    def test_columns(self):
+        cat = get_catalogue()
+        i = cat.id_by_path[("isolatie", "PIR", None)]
+        assert cat.low[i] == 0.022
+        assert cat.high[i] == 0.026
+        assert cat.kinds[i] == heat_calc.LAYER_LAMBDA
+        with pytest.raises(ValueError):
+            cat.low[i] = 1.0
+
+    def test_helpers_match_dict(self):
+        cat = get_catalogue()
+        assert list(cat.keys()) == list(MATERIALS)
+        for main in MATERIALS:
+            assert heat_calc.sub_keys(cat, main) == heat_calc.sub_keys(MATERIALS, main)
+            for sub in heat_calc.sub_keys(MATERIALS, main):
+                thirds = heat_calc.third_keys(MATERIALS, main, sub)
+                assert heat_calc.third_keys(cat, main, sub) == thirds
+                for third in thirds or [None]:
+                    assert heat_calc.raw_value(cat, main, sub, third) == heat_calc.raw_value(
+                        MATERIALS, main, sub, third
+                    )
+
+    def test_unknown_selection(self):
+        cat = get_catalogue()
+        assert cat.find("isolatie", "onbekend") is None
+        assert heat_calc.raw_value(cat, "glas", "HR++") is None
+        assert heat_calc.sub_keys(cat, "onbekend") == []
+
+    def test_pack_constructions_matches_dict(self):
+        layers = [
+            {"modus": "Materiaallijst", "categorie": "isolatie", "materiaal": "PIR", "dikte": 0.1},
+            {"modus": "Materiaallijst", "categorie": "glas", "materiaal": "HR++",
+             "subtype": "hout_kunststof"},
+            {"modus": "Materiaallijst", "categorie": "isolatie", "materiaal": "onbekend",
+             "dikte": 0.1},
+            {"modus": "Handmatige R", "handmatige_r": 0.2},
+        ]
+        expected = heat_calc.pack_constructions(MATERIALS, [layers, layers[:1]])
+        packed = heat_calc.pack_constructions(get_catalogue(), [layers, layers[:1]])
+        for a, b in zip(expected, packed):
+            np.testing.assert_array_equal(a, b)
+        _rc, u = heat_calc.u_value_batch(*packed)
+        assert math.isclose(u[1], 1 / (0.13 + 0.1 / 0.022 + 0.04))
+
+    def test_from_file(self):
+        cat = MaterialCatalogue.from_file(
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), "material_properties.json")
+        )
+        assert cat.paths == get_catalogue().paths
@@ -0,0 +1,108 @@
+"""Tests for r_cache – LRU caches for layer R and construction Rc / U."""
+
+import math
+
+import pytest
+
+import heat_calc
+from material_catalogue import MATERIALS_PATH, MaterialCatalogue, get_catalogue
+from r_cache import RValueCache, get_r_cache
+
+
+def _layer(sub, d=0.1, cat="isolatie", third=None):
+    return {"modus": "Materiaallijst", "categorie": cat, "materiaal": sub,
+            "subtype": third, "dikte": d}
+
+
+PIR = _layer("PIR")
+GLAS = _layer("HR++", cat="glas", third="hout_kunststof", d=0.0)
+MANUAL = {"modus": "Handmatige R", "handmatige_r": 0.18}
+
+
+class TestRValueCache:
+    def test_layer_r_matches_heat_calc(self):
+        cache = RValueCache(get_catalogue())
+        assert math.isclose(cache.layer_r(PIR), 0.1 / 0.022)
+        assert math.isclose(cache.layer_r(GLAS), 1 / 1.5)
+        assert cache.layer_r(MANUAL) == 0.18
+        assert cache.layer_r(_layer("onbekend")) is None
+        expected = heat_calc.layer_r(
+            "isolatie", heat_calc.raw_value(get_catalogue(), "isolatie", "PIR"), 0.1
+        )
+        assert cache.material_r("isolatie", "PIR", None, 0.1) == expected
+
+    def test_hits_and_misses(self):
+        cache = RValueCache(get_catalogue())
+        for _ in range(3):
+            cache.layer_r(PIR)
+        stats = cache.stats()["layer"]
+        assert (stats.hits, stats.misses, stats.currsize) == (2, 1, 1)
+        assert stats.hit_rate == pytest.approx(2 / 3)
+
+    def test_thickness_is_part_of_key(self):
+        cache = RValueCache(get_catalogue())
+        assert cache.layer_r(PIR) != cache.layer_r(_layer("PIR", d=0.2))
+        assert cache.stats()["layer"].misses == 2
+
+    def test_eviction(self):
+        cache = RValueCache(get_catalogue(), layer_maxsize=2)
+        cache.layer_r(_layer("PIR", d=0.1))
+        cache.layer_r(_layer("PIR", d=0.2))
+        cache.layer_r(_layer("PIR", d=0.1))  # refresh → 0.2 is least recent
+        cache.layer_r(_layer("PIR", d=0.3))
+        stats = cache.stats()["layer"]
+        assert (stats.evictions, stats.currsize) == (1, 2)
+        cache.layer_r(_layer("PIR", d=0.1))
+        assert cache.stats()["layer"].hits == 2
+
+    def test_construction(self):
+        cache = RValueCache(get_catalogue())
+        rc, u = cache.construction([PIR, GLAS, MANUAL, _layer("onbekend")])
+        assert math.isclose(rc, 0.1 / 0.022 + 1 / 1.5 + 0.18)
+        assert math.isclose(u, 1 / (0.13 + rc + 0.04))
+        cache.construction([PIR, GLAS, MANUAL, _layer("onbekend")], ri=0.10)
+        stats = cache.stats()
+        assert (stats["construction"].hits, stats["construction"].misses) == (1, 1)
+        assert stats["layer"].misses == 3
+
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError):
+            RValueCache(get_catalogue(), layer_maxsize=0)
+
+    def test_invalidate(self):
+        cache = RValueCache(get_catalogue())
+        cache.construction([PIR])
+        cache.invalidate()
+        stats = cache.stats()
+        assert stats["layer"].currsize == stats["construction"].currsize == 0
+
+    def test_catalogue_swap_during_lookup(self):
+        # Same ids, different materials: id 0 is PIR in a, EPS in b
+        a = MaterialCatalogue({"isolatie": {"PIR": 0.02, "EPS": 0.04}})
+        b = MaterialCatalogue({"isolatie": {"EPS": 0.04, "PIR": 0.02}})
+        cache = RValueCache(a)
+        find = a.find
+
+        def find_then_swap(*path):
+            m = find(*path)
+            cache.invalidate(b)   # another thread swaps the catalogue here
+            return m
+
+        a.find = find_then_swap
+        assert math.isclose(cache.layer_r(_layer("PIR")), 0.1 / 0.02)
+        # a's late entry is never served for b's materials
+        assert math.isclose(cache.layer_r(_layer("EPS")), 0.1 / 0.04)
+        assert math.isclose(cache.layer_r(_layer("PIR")), 0.1 / 0.02)
+
+    def test_shared_cache_follows_reloaded_catalogue(self, monkeypatch):
+        import material_catalogue
+
+        cache = get_r_cache()
+        assert cache is get_r_cache()
+        cache.layer_r(PIR)
+        # restore the original shared catalogue afterwards
+        monkeypatch.setattr(material_catalogue, "_catalogue", material_catalogue._catalogue)
+        fresh = material_catalogue.reload_catalogue(MATERIALS_PATH)
+        assert isinstance(fresh, MaterialCatalogue)
+        assert cache.catalogue is fresh
+        assert cache.stats()["layer"].currsize == 0
@@ -0,0 +1,54 @@
+"""Tests for app.result_model – diffing table model for the result tables."""
+
+import pytest
+
+pytest.importorskip("PyQt5")
+
+from PyQt5.QtCore import Qt  # noqa: E402
+
+from app.result_model import ResultTableModel  # noqa: E402
+
+
+@pytest.fixture
+def model():
+    m = ResultTableModel(["a", "b", "c"])
+    m.set_rows([("1", "2", "3"), ("4", "5", "6"), ("7", "8", "9"), ("x", "y", "z")])
+    events = []
+    m.dataChanged.connect(lambda tl, br, _roles: events.append(
+        ("changed", tl.row(), tl.column(), br.row(), br.column())))
+    m.rowsInserted.connect(lambda _p, first, last: events.append(("inserted", first, last)))
+    m.rowsRemoved.connect(lambda _p, first, last: events.append(("removed", first, last)))
+    return m, events
+
+
+class TestResultTableModel:
+    def test_data_and_headers(self, model):
+        m, _ = model
+        assert (m.rowCount(), m.columnCount()) == (4, 3)
+        assert m.data(m.index(1, 2)) == "6"
+        assert m.data(m.index(1, 2), Qt.TextAlignmentRole) == int(Qt.AlignCenter)
+        assert m.headerData(0, Qt.Horizontal) == "a"
+
+    def test_unchanged_rows_emit_nothing(self, model):
+        m, events = model
+        m.set_rows(m.rows())
+        m.set_row(0, ("1", "2", "3"))
+        assert events == []
+
+    def test_only_changed_ranges(self, model):
+        m, events = model
+        m.set_rows([("1", "2", "3"), ("4", "X", "6"), ("7", "Y", "9"), ("x", "y", "z")])
+        assert events == [("changed", 1, 0, 2, 2)]
+        events.clear()
+        m.set_row(3, ("x", "y", "Z"))
+        assert events == [("changed", 3, 2, 3, 2)]
+
+    def test_rows_added_and_removed_at_the_end(self, model):
+        m, events = model
+        m.set_rows([("1", "2", "3"), ("4", "5", "6")])
+        assert events == [("removed", 2, 3)]
+        events.clear()
+        m.set_rows([("1", "2", "3"), ("4", "5", "6"), ("n", "e", "w")])
+        assert events == [("inserted", 2, 2)]
+        m.clear()
+        assert m.rowCount() == 0
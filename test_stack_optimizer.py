@@ -0,0 +1,113 @@
+"""Tests for stack_optimizer – branch-and-bound search for Rc-target stacks."""
+
+import itertools
+import math
+
+import pytest
+
+from material_catalogue import MaterialCatalogue
+from r_cache import RValueCache
+from stack_optimizer import optimize_stack
+
+SMALL = MaterialCatalogue({
+    "isolatie": {"A": 0.02, "B": 0.03, "C": 0.045},
+    "stenen": {"baksteen": 0.9},
+    "glas": {"HR++": {"hout": 1.5}},
+})
+WALL = [{"modus": "Materiaallijst", "categorie": "stenen", "materiaal": "baksteen", "dikte": 0.1}]
+
+
+def _cache():
+    return RValueCache(SMALL)
+
+
+def _brute_front(rc0, lams, target, max_layers, budget, k_layer):
+    """Best Rc per total step count by plain enumeration, reduced to a front."""
+    best = {}
+    choices = [(lam, k) for lam in lams for k in range(1, k_layer + 1)]
+    for n in range(1, max_layers + 1):
+        for combo in itertools.combinations_with_replacement(choices, n):
+            k = sum(c[1] for c in combo)
+            r = rc0 + sum(0.01 * c[1] / c[0] for c in combo)
+            if k <= budget and r >= target - 1e-9:
+                best[k] = max(best.get(k, -1.0), r)
+    front, top = [], -1.0
+    for k in sorted(best):
+        if best[k] > top + 1e-9:
+            top = best[k]
+            front.append((k, best[k]))
+    return front
+
+
+class TestOptimizeStack:
+    def test_front_matches_enumeration(self):
+        result = optimize_stack(
+            WALL, rc=3.0, categories=["isolatie"], max_layers=2,
+            max_total_thickness=0.22, max_layer_thickness=0.05, cache=_cache(),
+        )
+        assert result.complete
+        rc0 = 0.1 / 0.9
+        expected = _brute_front(rc0, [0.02, 0.03, 0.045], 3.0, 2, 12, 5)
+        got = [(round((s.thickness - 0.1) / 0.01), s.rc) for s in result.front]
+        assert [k for k, _ in got] == [k for k, _ in expected]
+        for (_, r), (_, e) in zip(got, expected):
+            assert math.isclose(r, e)
+
+    def test_front_is_pareto_and_meets_target(self):
+        front = optimize_stack(WALL, u=0.25, categories=["isolatie"], cache=_cache()).front
+        assert front
+        for a, b in zip(front, front[1:]):
+            assert a.thickness < b.thickness and a.u > b.u
+        for s in front:
+            assert s.u <= 0.25
+            assert math.isclose(s.u, 1 / (0.13 + s.rc + 0.04))
+            assert math.isclose(s.thickness, 0.1 + sum(d for _, d in s.layers))
+
+    def test_single_material_selector(self):
+        front = optimize_stack(
+            [], rc=2.0, categories=[("isolatie", "B")], max_layer_thickness=0.2, cache=_cache()
+        ).front
+        assert front and {path for s in front for path, _ in s.layers} == {("isolatie", "B", None)}
+
+    def test_prefers_fewest_layers(self):
+        front = optimize_stack(
+            [], rc=2.0, categories=["isolatie"], max_layer_thickness=0.2, cache=_cache()
+        ).front
+        assert front[0].count == 1
+        assert front[0].layers == ((("isolatie", "A", None), 0.04),)
+
+    def test_layer_cap_forces_more_layers(self):
+        front = optimize_stack(
+            [], rc=5.0, categories=["isolatie"], max_layer_thickness=0.05, cache=_cache()
+        ).front
+        assert front[0].count == 2
+        assert front[0].thickness == 0.1
+
+    def test_infeasible_target_gives_empty_front(self):
+        result = optimize_stack(
+            WALL, rc=20.0, categories=["isolatie"], max_total_thickness=0.3, cache=_cache()
+        )
+        assert result.front == [] and result.complete
+
+    def test_fixed_layers_already_meet_target(self):
+        manual = [{"modus": "Handmatige R", "handmatige_r": 5.0}]
+        front = optimize_stack(manual, rc=4.0, categories=["isolatie"], cache=_cache()).front
+        assert front[0].layers == () and front[0].thickness == 0.0
+
+    def test_time_budget(self):
+        result = optimize_stack(WALL, rc=3.0, categories=None, time_budget=0.0, cache=_cache())
+        assert not result.complete
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            optimize_stack(WALL, rc=3.0, max_layers=0, cache=_cache())
+        with pytest.raises(ValueError):
+            optimize_stack(WALL, cache=_cache())
+
+    def test_full_catalogue_is_pruned(self):
+        result = optimize_stack(
+            [], u=0.15, categories=None, max_layers=3, max_layer_thickness=0.06, time_budget=None
+        )
+        assert result.complete
+        assert result.front
+        assert result.nodes < 10_000
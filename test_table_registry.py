@@ -0,0 +1,172 @@
+"""Tests for table_registry and range_table – compiled reference-table indexes."""
+
+import math
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from typing import Optional
+
+import numpy as np
+import pytest
+
+import fk_calc
+from range_table import RangeTable
+from table_registry import TableRegistry, get_registry
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Cumulative ``-X importtime`` budget for ``import fk_calc`` (warm bytecode
+# cache).  Eager table loading plus NumPy took roughly 75 ms.
+IMPORT_TIME_TARGET_US = 40_000
+
+
+def _run_python(code: str, *args: str, env: Optional[dict] = None) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        cwd=_HERE,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+class TestTableRegistry:
+    def test_shared_instance(self):
+        assert get_registry() is get_registry()
+
+    def test_heating_system_index(self):
+        reg = get_registry()
+        assert reg.delta_theta["radiatoren_lt"] == (2, -1)
+        assert reg.heating_system_by_id["radiatoren_lt"]["omschrijving"] == (
+            "Radiatoren/convectoren Lt"
+        )
+        assert reg.heating_system_id_by_omschrijving["Plafondverwarming"] == (
+            "plafondverwarming"
+        )
+        assert len(reg.heating_systems) == len(fk_calc.list_heating_systems())
+
+    def test_theta_i_index(self):
+        reg = get_registry()
+        assert reg.theta_i[("woonfunctie", "toiletruimte")] == 18.0
+        assert reg.theta_i[("seniorenwoningen_verzorgingstehuizen", "toiletruimte")] == 20.0
+
+    def test_tabel_2_3_and_2_13(self):
+        reg = get_registry()
+        assert reg.dak_f_k["geisoleerd"] == 0.7
+        assert reg.vertrek_f_k[(2, True)] == 0.6
+        assert reg.vertrek_f_k[("3+", None)] == 0.8
+        assert reg.tijdconstante_f_k["kelder"] == 0.5
+
+    def test_indexes_are_read_only(self):
+        reg = get_registry()
+        with pytest.raises(TypeError):
+            reg.delta_theta["nieuw"] = (0, 0)
+        with pytest.raises(TypeError):
+            reg.heating_systems[0]["delta_theta_1"] = 99
+
+    def test_list_helpers_return_copies(self):
+        systems = fk_calc.list_heating_systems()
+        systems[0]["delta_theta_1"] = 99
+        assert fk_calc.list_heating_systems()[0]["delta_theta_1"] != 99
+
+    def test_separate_instance_from_directory(self):
+        reg = TableRegistry(get_registry().tables_dir)
+        assert reg.theta_e == -10.0
+        assert reg.theta_me == 10.5
+
+    def test_tables_compile_on_first_access(self):
+        reg = TableRegistry(get_registry().tables_dir)
+        assert reg.loaded_tables == frozenset()
+        assert reg.dak_f_k["geisoleerd"] == 0.7
+        assert reg.loaded_tables == {"tabel_2_3.json"}
+        reg.load_all()
+        assert len(reg.loaded_tables) == 6
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            TableRegistry().no_such_index
+
+
+class TestLazyImport:
+    def test_import_touches_no_tables_or_numpy(self):
+        out = _run_python(
+            "import sys, fk_calc, table_registry\n"
+            "print(sorted(table_registry.get_registry().loaded_tables), 'numpy' in sys.modules)"
+        )
+        assert out.stdout.strip() == "[] False"
+
+    def test_lazy_constants_and_batch_forwarding(self):
+        assert fk_calc.DEFAULT_THETA_E == -10.0
+        assert fk_calc.DEFAULT_THETA_ME == 10.5
+        assert fk_calc.ERR_OK == 0
+        assert callable(fk_calc.calc_f_gw_batch)
+        with pytest.raises(AttributeError):
+            fk_calc.no_such_name
+
+    def test_import_time_target(self):
+        env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+        with tempfile.TemporaryDirectory() as cache:
+            env["PYTHONPYCACHEPREFIX"] = cache
+            timings = []
+            for _ in range(4):  # first run only populates the bytecode cache
+                err = _run_python("import fk_calc", "-X", "importtime", env=env).stderr
+                timings.append(int(re.search(r"\|\s*(\d+) \| fk_calc$", err, re.M).group(1)))
+        assert min(timings[1:]) < IMPORT_TIME_TARGET_US
+
+
+class TestRangeTable:
+    ENTRIES = [
+        {"lo": 5.0, "hi": None, "v": 0.13},
+        {"lo": 2.5, "hi": 5.0, "v": 0.30},
+        {"hi": 2.5, "v": 0.50},
+    ]
+
+    def test_left_closed_bins(self):
+        table = RangeTable(self.ENTRIES, "lo", "hi", "v")
+        assert table.breakpoints == (2.5, 5.0)
+        assert table.lookup(2.4999) == 0.50
+        assert table.lookup(2.5) == 0.30
+        assert table.lookup(5.0) == 0.13
+
+    def test_right_closed_bins(self):
+        table = RangeTable(self.ENTRIES, "lo", "hi", "v", closed="right")
+        assert table.lookup(2.5) == 0.50
+        assert table.lookup(5.0) == 0.30
+        assert table.lookup(5.0001) == 0.13
+
+    def test_array_lookup_matches_scalar(self):
+        table = RangeTable(self.ENTRIES, "lo", "hi", "v")
+        x = np.array([-1.0, 2.5, 3.0, 5.0, 100.0])
+        values, valid = table.lookup_array(x)
+        assert valid.all()
+        assert list(values) == [table.lookup(v) for v in x]
+
+    def test_unbounded_ends_include_infinity(self):
+        for closed in ("left", "right"):
+            table = RangeTable(self.ENTRIES, "lo", "hi", "v", closed=closed)
+            assert (table.lookup(math.inf), table.lookup(-math.inf)) == (0.13, 0.50)
+            values, valid = table.lookup_array([-np.inf, np.inf])
+            assert valid.all() and list(values) == [0.50, 0.13]
+
+    def test_out_of_domain(self):
+        table = RangeTable([{"lo": 0.0, "hi": 1.0, "v": 1}], "lo", "hi", "v")
+        with pytest.raises(ValueError):
+            table.lookup(1.0)
+        with pytest.raises(ValueError):
+            table.lookup(float("nan"))
+        values, valid = table.lookup_array([-0.5, 0.5, np.nan])
+        assert list(valid) == [False, True, False]
+        assert np.isnan(values[[0, 2]]).all()
+
+    def test_gap_raises(self):
+        with pytest.raises(ValueError):
+            RangeTable([{"hi": 1.0, "v": 1}, {"lo": 2.0, "v": 2}], "lo", "hi", "v")
+
+    def test_registry_range_tables(self):
+        reg = get_registry()
+        assert reg.u_equiv_k.lookup(3.5) == 0.18
+        assert reg.f_gw.lookup(1.0) == 1.00
+        assert reg.kruipruimte_f_k.lookup(1500) == 0.8
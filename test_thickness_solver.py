@@ -0,0 +1,95 @@
+"""Tests for thickness_solver – required insulation thickness for a target U / Rc."""
+
+import math
+
+import pytest
+
+from material_catalogue import get_catalogue
+from r_cache import RValueCache
+from thickness_solver import rank_materials, round_up, solve_thickness, target_rc
+
+
+def _layer(sub, d=0.1, cat="isolatie", third=None):
+    return {"modus": "Materiaallijst", "categorie": cat, "materiaal": sub,
+            "subtype": third, "dikte": d}
+
+
+MANUAL = {"modus": "Handmatige R", "handmatige_r": 0.5}
+WALL = [MANUAL, _layer("PIR", d=0.05)]
+
+
+class TestHelpers:
+    def test_target_rc(self):
+        assert math.isclose(target_rc(u=0.2), 5.0 - 0.13 - 0.04)
+        assert target_rc(rc=4.7) == 4.7
+        with pytest.raises(ValueError):
+            target_rc()
+        with pytest.raises(ValueError):
+            target_rc(u=0.2, rc=4.7)
+        with pytest.raises(ValueError):
+            target_rc(u=0.0)
+
+    def test_round_up(self):
+        assert round_up(0.0912) == 0.1
+        assert round_up(0.12) == 0.12
+        assert round_up(0.3 * 0.4) == 0.12           # float noise is not a step
+        assert round_up(0.101, step=0.02) == 0.12
+        assert list(round_up([0.0, 0.011])) == [0.0, 0.02]
+
+
+class TestSolveThickness:
+    def test_closed_form(self):
+        s = solve_thickness(WALL, 1, rc=4.7, cache=RValueCache(get_catalogue()))
+        assert s.path == ("isolatie", "PIR", None)
+        assert math.isclose(s.exact, (4.7 - 0.5) * 0.022)
+        assert s.thickness == 0.1
+        assert math.isclose(s.rc, 0.5 + 0.1 / 0.022)
+        assert math.isclose(s.u, 1 / (0.13 + s.rc + 0.04))
+
+    def test_rounded_result_meets_target(self):
+        for u in (0.15, 0.2, 0.28, 0.4):
+            s = solve_thickness(WALL, 1, u=u)
+            assert s.u <= u
+            assert s.thickness - s.exact < 0.01
+
+    def test_target_already_met(self):
+        s = solve_thickness([{"modus": "Handmatige R", "handmatige_r": 6.0}, _layer("PIR")], 1, rc=4.7)
+        assert (s.exact, s.thickness) == (0.0, 0.0)
+
+    def test_variable_layer_must_have_lambda(self):
+        with pytest.raises(ValueError):
+            solve_thickness(WALL, 0, rc=4.7)
+        with pytest.raises(ValueError):
+            solve_thickness([_layer("HR++", cat="glas", third="hout_kunststof")], 0, rc=1.0)
+        with pytest.raises(ValueError):
+            solve_thickness(WALL, 2, rc=4.7)
+
+
+class TestRankMaterials:
+    def test_matches_scalar_solver(self):
+        ranking = rank_materials(WALL, 1, u=0.2)
+        assert {s.path[0] for s in ranking} == {
+            "isolatie", "kunststofschuimen", "andere_anorganische_materialen"}
+        for s in ranking:
+            single = solve_thickness([MANUAL, _layer(s.path[1], cat=s.path[0])], 1, u=0.2)
+            assert single.thickness == s.thickness
+            assert math.isclose(single.u, s.u)
+
+    def test_insulation_selected_per_material(self):
+        ranked = {s.path[:2] for s in rank_materials(WALL, 1, rc=4.7)}
+        other = "andere_anorganische_materialen"
+        assert {(other, "minerale_wol_platen"), (other, "minerale_wol_dekens"),
+                (other, "cellulair_glass")} <= ranked
+        assert (other, "gipskartonplaat") not in ranked
+        assert not any(path[0] == "gassen" for path in ranked)
+
+    def test_sorted_thinnest_first(self):
+        ranking = rank_materials(WALL, 1, rc=4.7)
+        keys = [(s.thickness, s.lam) for s in ranking]
+        assert keys == sorted(keys)
+        assert ranking[0].path[1] == "vacuum_isolatie_panelen_VIP"
+
+    def test_variable_layer_material_is_ignored(self):
+        a = rank_materials([MANUAL, MANUAL], 1, rc=4.7)
+        b = rank_materials([MANUAL, _layer("PIR")], 1, rc=4.7)
+        assert a == b
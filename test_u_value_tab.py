@@ -0,0 +1,159 @@
+"""Tests for app.u_value_tab – bulk loading of projects into the U-value tab
+and the background Monte Carlo spread."""
+
+import os
+
+import pytest
+
+pytest.importorskip("PyQt5")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtTest import QTest  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from app.config import Config  # noqa: E402
+from app.layer_table import THICKNESS_RANGE  # noqa: E402
+from app.thickness_dialog import ThicknessDialog  # noqa: E402
+from app.u_value_tab import REFRESH_DEBOUNCE_MS, TABLE_VIEW_LAYERS, UValueTab  # noqa: E402
+from benchmark import generate_stacks  # noqa: E402
+from heat_calc import SURFACE_R, pack_ranges, u_value_monte_carlo  # noqa: E402
+from material_catalogue import get_catalogue  # noqa: E402
+from thickness_solver import solve_thickness  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def tab(qapp, tmp_path, monkeypatch):
+    tab = UValueTab(Config(str(tmp_path / "prefs.json")))
+    tab.show()
+    refreshes = []
+    original = tab._refresh
+    monkeypatch.setattr(tab, "_refresh", lambda: (refreshes.append(1), original())[1])
+    tab.refreshes = refreshes
+    yield tab
+    tab.worker.wait()
+    tab.deleteLater()
+
+
+def _settle():
+    QTest.qWait(3 * REFRESH_DEBOUNCE_MS)
+
+
+class TestBulkLoad:
+    @pytest.mark.parametrize("n", [5, TABLE_VIEW_LAYERS + 15])
+    def test_load_project_refreshes_once(self, tab, n):
+        layers = generate_stacks(n, 1)[0]
+        tab.load_project({"ri": tab.ri_dd.itemText(1), "lagen": layers})
+        _settle()
+        assert len(tab.refreshes) == 1
+        assert tab.table_cb.isChecked() == (n > TABLE_VIEW_LAYERS)
+        assert [{k: layer.to_dict()[k] for k in layers[0]} for layer in tab.layers] == layers
+        assert tab.result_model.rowCount() == n + 3
+        assert tab.u_label.text().startswith(f"U = 1 / (Ri {SURFACE_R[tab.ri_dd.itemText(1)]:.2f}")
+
+    def test_append_layers_refreshes_once(self, tab):
+        tab.append_layers(generate_stacks(3, 1)[0])
+        _settle()
+        assert len(tab.refreshes) == 1
+        assert len(tab.layers) == 4
+
+    def test_edits_are_coalesced(self, tab):
+        layer = tab.layers[0]
+        for i in range(1, 20):
+            layer.thickness.setValue(i / 100)
+        _settle()
+        assert tab.refreshes == []
+        assert tab.result_model.row(1)[1] == "0.190"
+
+
+class TestDebouncedRefresh:
+    def _changed_rows(self, tab):
+        rows = []
+        tab.result_model.dataChanged.connect(
+            lambda tl, br, _roles: rows.extend(range(tl.row(), br.row() + 1)))
+        return rows
+
+    def test_edit_rewrites_only_its_row_and_totals(self, tab):
+        tab.append_layers([{"categorie": "isolatie", "materiaal": "PIR", "dikte": 0.1}] * 2)
+        _settle()
+        tab.refreshes.clear()
+        rows = self._changed_rows(tab)
+        tab.layers[1].thickness.setValue(0.2)
+        assert rows == []                       # nothing until the debounce fires
+        _settle()
+        assert tab.refreshes == []
+        assert sorted(set(rows)) == [2, len(tab.layers) + 2]
+        assert tab.result_model.row(2)[1] == "0.200"
+
+    def test_surface_resistance_change_is_full_refresh(self, tab):
+        tab.ri_dd.setCurrentIndex(1)
+        tab.re_dd.setCurrentIndex(1)
+        assert tab.refreshes == []
+        _settle()
+        assert len(tab.refreshes) == 1
+        assert tab.result_model.row(0)[4] == f"{SURFACE_R[tab.ri_dd.currentText()]:.2f}"
+
+
+class TestSharedComboModels:
+    def test_layers_share_models(self, tab):
+        tab.append_layers([{"categorie": "isolatie"}, {"categorie": "isolatie"}])
+        a, b, c = tab.layers
+        assert b.cat_dd.model() is c.cat_dd.model() is a.cat_dd.model()
+        assert b.sub_dd.model() is c.sub_dd.model()
+        assert b.sub_dd.model().rowCount() == len(get_catalogue().sub_keys("isolatie"))
+
+    def test_subtype_survives_hidden_tab(self, tab):
+        catalogue = get_catalogue()
+        sub = next(s for s in catalogue.sub_keys("glas") if len(catalogue.third_keys("glas", s)) > 1)
+        third = catalogue.third_keys("glas", sub)[1]
+        tab.hide()
+        tab.layers[0].load_from_dict({"categorie": "glas", "materiaal": sub, "subtype": third})
+        assert tab.layers[0].to_dict()["subtype"] == third
+
+
+class TestBackgroundMonteCarlo:
+    def test_latest_spread_is_shown(self, tab):
+        tab.load_project({"lagen": [{"categorie": "isolatie", "materiaal": "PIR", "dikte": 0.1}]})
+        tab.mc_cb.setChecked(True)
+        for d in (0.12, 0.14, 0.16):
+            tab.layers[0].thickness.setValue(d)
+            _settle()
+        assert tab.worker.wait()
+        ri, re = SURFACE_R[tab.ri_dd.currentText()], SURFACE_R[tab.re_dd.currentText()]
+        low, high, thickness, kinds = pack_ranges(get_catalogue(), [[tab.layers[0].to_dict()]])
+        mc = u_value_monte_carlo(low, high, thickness, kinds, ri, re)
+        assert mc.std[0] > 0
+        assert tab.mc_label.text().startswith(f"U gemiddeld {mc.mean[0]:.3f} W/(m²·K)")
+
+    def test_disabling_drops_running_spread(self, tab):
+        tab.mc_cb.setChecked(True)
+        _settle()
+        tab.mc_cb.setChecked(False)
+        _settle()
+        tab.mc_label.setText("")
+        assert tab.worker.wait()
+        assert tab.mc_label.text() == ""
+
+
+class TestThicknessLimit:
+    def test_too_thick_solution_is_not_clamped(self, tab):
+        tab.load_project({"lagen": [{"categorie": "isolatie", "materiaal": "PIR", "dikte": 0.1}]})
+        dialog = ThicknessDialog(tab)
+        dialog.target.setValue(0.002)
+        assert dialog.solution.thickness > THICKNESS_RANGE[1]
+        assert "⚠" in dialog.result_label.text()
+        assert not dialog.apply_btn.isEnabled()
+        with pytest.raises(ValueError):
+            tab.apply_thickness(0, dialog.solution)
+        assert tab.layers[0].to_dict()["dikte"] == 0.1
+        dialog.deleteLater()
+
+    def test_fitting_solution_is_applied(self, tab):
+        tab.load_project({"lagen": [{"categorie": "isolatie", "materiaal": "PIR", "dikte": 0.1}]})
+        solution = solve_thickness([tab.layers[0].to_dict()], 0, u=0.2)
+        tab.apply_thickness(0, solution)
+        assert tab.layers[0].to_dict()["dikte"] == solution.thickness
@@ -0,0 +1,184 @@
+"""thickness_solver.py – Required insulation thickness for a target U or Rc.
+
+For a construction in ``.uwr`` layer-dict form with one variable λ-layer the
+thermal resistance of that layer follows in closed form:
+
+    Rc_target = 1 / U_target − Ri − Re          (or Rc_target given directly)
+    d         = λ · (Rc_target − Rc_other)
+
+where Rc_other is the sum of the remaining layers (resolved through the shared
+:class:`r_cache.RValueCache`, so undetermined layers count as 0 just like in
+the app).  The exact thickness is rounded *up* to commercial steps
+(:data:`THICKNESS_STEP`, 10 mm), so the rounded result always meets the target.
+
+:func:`solve_thickness` answers this for the material chosen in the variable
+layer; :func:`rank_materials` does the same for every insulation material in
+the catalogue in a single NumPy pass and returns them thinnest first.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Mapping, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+
+from heat_calc import DEFAULT_RE, DEFAULT_RI, LAYER_LAMBDA
+from material_catalogue import MaterialCatalogue
+from r_cache import MODE_MANUAL, RValueCache, get_r_cache
+
+# A candidate selector: a whole main category, or one (categorie, materiaal)
+Selector = Union[str, tuple[str, str]]
+
+# Insulation materials searched by rank_materials() and the stack optimizer:
+# two whole categories plus the insulating materials filed under
+# "andere_anorganische_materialen" (which also holds e.g. gypsum board)
+INSULATION: tuple[Selector, ...] = (
+    "isolatie",
+    "kunststofschuimen",
+    ("andere_anorganische_materialen", "cellulair_glass"),
+    ("andere_anorganische_materialen", "minerale_wol_dekens"),
+    ("andere_anorganische_materialen", "minerale_wol_platen"),
+)
+
+# Commercial thickness step [m]; results are rounded up to a multiple of it
+THICKNESS_STEP = 0.01
+
+# Tolerance so that e.g. 0.1200000001 m is not rounded up to 0.13 m
+_ROUND_EPS = 1e-9
+
+
+class ThicknessSolution(NamedTuple):
+    """Required thickness of one material and the resulting Rc / U."""
+
+    path: tuple[str, str, Optional[str]]   # (categorie, materiaal, subtype)
+    lam: float                             # λ [W/(m·K)]
+    exact: float                           # unrounded thickness [m]
+    thickness: float                       # rounded up to the step [m]
+    rc: float                              # Rc with the rounded thickness
+    u: float                               # U with the rounded thickness
+
+    @property
+    def label(self) -> str:
+        return " / ".join(p for p in self.path if p)
+
+
+def target_rc(
+    u: Optional[float] = None,
+    rc: Optional[float] = None,
+    ri: float = DEFAULT_RI,
+    re: float = DEFAULT_RE,
+) -> float:
+    """Return the Rc [m²·K/W] needed for a target *u* or *rc* (exactly one)."""
+    if (u is None) == (rc is None):
+        raise ValueError("Give exactly one of target u or rc")
+    if u is not None:
+        if u <= 0:
+            raise ValueError(f"Target U must be positive, not {u!r}")
+        return 1.0 / u - ri - re
+    return float(rc)
+
+
+def round_up(thickness, step: float = THICKNESS_STEP):
+    """Round *thickness* (scalar or array) up to a multiple of *step*."""
+    if step <= 0:
+        raise ValueError(f"step must be positive, not {step!r}")
+    steps = np.ceil(np.asarray(thickness, dtype=float) / step - _ROUND_EPS)
+    # round() strips float noise such as 0.12000000000000001
+    out = np.round(np.maximum(steps, 0.0) * step, 9)
+    return float(out) if out.ndim == 0 else out
+
+
+def select_materials(catalogue: MaterialCatalogue, selection: Sequence[Selector]) -> np.ndarray:
+    """Boolean mask over *catalogue* of the materials matched by *selection*.
+
+    A string selects a whole main category, a ``(categorie, materiaal)``
+    pair one material (with all its subtypes).
+    """
+    wanted = set(selection)
+    return np.fromiter(
+        (m.path[0] in wanted or m.path[:2] in wanted for m in catalogue.materials),
+        dtype=bool, count=len(catalogue),
+    )
+
+
+def _other_rc(layers: Sequence[Mapping[str, Any]], index: int, cache: RValueCache) -> float:
+    if not 0 <= index < len(layers):
+        raise ValueError(f"Layer index {index!r} out of range 0..{len(layers) - 1}")
+    return cache.construction_rc(layers[:index] + layers[index + 1:])
+
+
+def solve_thickness(
+    layers: Sequence[Mapping[str, Any]],
+    index: int,
+    u: Optional[float] = None,
+    rc: Optional[float] = None,
+    ri: float = DEFAULT_RI,
+    re: float = DEFAULT_RE,
+    step: float = THICKNESS_STEP,
+    cache: Optional[RValueCache] = None,
+) -> ThicknessSolution:
+    """Thickness of ``layers[index]`` that reaches a target *u* or *rc*.
+
+    The variable layer must be a material-list layer with a λ-value (not
+    glass, doors, floors or a manual R).  When the other layers already meet
+    the target the thickness is 0.
+    """
+    cache = cache or get_r_cache()
+    layers = list(layers)
+    other = _other_rc(layers, index, cache)
+    layer = layers[index]
+    m = None
+    if layer.get("modus") != MODE_MANUAL:
+        m = cache.catalogue.find(layer.get("categorie"), layer.get("materiaal"), layer.get("subtype"))
+    if m is None or m.kind != LAYER_LAMBDA or not m.low > 0:
+        raise ValueError(f"Layer {index} is not a material layer with a λ-value")
+
+    needed = target_rc(u, rc, ri, re) - other
+    exact = max(needed, 0.0) * m.low
+    d = round_up(exact, step)
+    total = other + d / m.low
+    return ThicknessSolution(m.path, m.low, exact, d, total, 1.0 / (ri + total + re))
+
+
+def rank_materials(
+    layers: Sequence[Mapping[str, Any]],
+    index: int,
+    u: Optional[float] = None,
+    rc: Optional[float] = None,
+    ri: float = DEFAULT_RI,
+    re: float = DEFAULT_RE,
+    step: float = THICKNESS_STEP,
+    categories: Sequence[Selector] = INSULATION,
+    cache: Optional[RValueCache] = None,
+) -> list[ThicknessSolution]:
+    """Solve :func:`solve_thickness` for every λ-material in *categories*.
+
+    *categories* holds main categories and/or ``(categorie, materiaal)``
+    pairs (see :func:`select_materials`).
+
+    ``layers[index]`` is replaced by each candidate in turn (its own material
+    is ignored).  The result is sorted by rounded thickness, then by λ.
+    """
+    cache = cache or get_r_cache()
+    layers = list(layers)
+    other = _other_rc(layers, index, cache)
+    catalogue: MaterialCatalogue = cache.catalogue
+
+    selected = select_materials(catalogue, categories)
+    ids = np.flatnonzero(selected & (catalogue.kinds == LAYER_LAMBDA) & (catalogue.low > 0))
+    lam = catalogue.low[ids]
+
+    needed = target_rc(u, rc, ri, re) - other
+    exact = max(needed, 0.0) * lam
+    d = round_up(exact, step)
+    total = other + d / lam
+    u_out = 1.0 / (ri + total + re)
+
+    order = np.lexsort((lam, d))
+    return [
+        ThicknessSolution(
+            catalogue.materials[ids[i]].path,
+            float(lam[i]), float(exact[i]), float(d[i]), float(total[i]), float(u_out[i]),
+        )
+        for i in order
+    ]
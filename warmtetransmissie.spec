@@ -19,11 +19,24 @@ a = Analysis(
     ],
     hiddenimports=[
         "heat_calc",
+        "material_catalogue",
+        "r_cache",
+        "thickness_solver",
+        "fk_scenarios",
         "fk_calc",
+        "fk_calc_batch",
+        "table_registry",
+        "range_table",
+        "instrumentation",
         "app",
         "app.config",
         "app.main_window",
         "app.u_value_tab",
+        "app.thickness_dialog",
+        "app.result_model",
+        "app.layer_table",
+        "app.material_models",
+        "app.compute_worker",
         "app.fk_calc_tab",
         "app.settings_tab",
     ],